@@ -0,0 +1,39 @@
+"""create rag_embedding_cache
+
+Revision ID: 20260421_0001
+Revises: 20260420_0003
+Create Date: 2026-04-21
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260421_0001"
+down_revision: str | None = "20260420_0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rag_embedding_cache",
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("task", sa.String(length=20), nullable=False),
+        sa.Column("text_hash", sa.String(length=64), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("model", "task", "text_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rag_embedding_cache")
@@ -0,0 +1,36 @@
+"""create rag_namespace_versions
+
+Revision ID: 20260421_0002
+Revises: 20260421_0001
+Create Date: 2026-04-21
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260421_0002"
+down_revision: str | None = "20260421_0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rag_namespace_versions",
+        sa.Column("namespace", sa.String(length=100), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("namespace"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rag_namespace_versions")
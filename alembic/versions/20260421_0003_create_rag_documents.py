@@ -0,0 +1,42 @@
+"""create rag_documents registry
+
+Revision ID: 20260421_0003
+Revises: 20260421_0002
+Create Date: 2026-04-21
+
+The table starts empty. Run scripts/backfill_rag_registry.py once after upgrading so
+documents uploaded before the registry existed are listed.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260421_0003"
+down_revision: str | None = "20260421_0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rag_documents",
+        sa.Column("doc_id", sa.String(length=36), nullable=False),
+        sa.Column("namespace", sa.String(length=100), nullable=False),
+        sa.Column("doc_key", sa.String(length=200), nullable=True),
+        sa.Column("filename", sa.Text(), nullable=False),
+        sa.Column("chunk_count", sa.Integer(), nullable=False),
+        sa.Column("uploaded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("doc_id"),
+    )
+    op.create_index(
+        "ix_rag_documents_namespace_uploaded_at",
+        "rag_documents",
+        ["namespace", "uploaded_at", "doc_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rag_documents_namespace_uploaded_at", table_name="rag_documents")
+    op.drop_table("rag_documents")
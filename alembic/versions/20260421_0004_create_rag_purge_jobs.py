@@ -0,0 +1,35 @@
+"""create rag_purge_jobs
+
+Revision ID: 20260421_0004
+Revises: 20260421_0003
+Create Date: 2026-04-21
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260421_0004"
+down_revision: str | None = "20260421_0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rag_purge_jobs",
+        sa.Column("namespace", sa.String(length=100), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("total_chunks", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("deleted_chunks", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("deleted_documents", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("namespace"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rag_purge_jobs")
@@ -1,6 +1,18 @@
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Response
+from collections.abc import Iterator
+from typing import Any
 
-from app.models.bhsa import BHSALoadResponse, BHSAStatusResponse, ClauseData, PassageResponse
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Response
+from fastapi.responses import StreamingResponse
+
+from app.models.bhsa import (
+    BHSALoadResponse,
+    BHSAStatusResponse,
+    ClauseData,
+    PassageBatchItem,
+    PassageBatchRequest,
+    PassageCacheStats,
+    PassageResponse,
+)
 from app.services.bhsa import loader
 
 router = APIRouter()
@@ -31,6 +43,11 @@ async def get_bhsa_status() -> BHSAStatusResponse | Response:
     )
 
 
+@router.get("/cache-stats", response_model=PassageCacheStats)
+async def get_cache_stats() -> PassageCacheStats:
+    return loader.get_cache_stats()
+
+
 @router.post("/load", response_model=BHSALoadResponse)
 async def load_bhsa_data(background_tasks: BackgroundTasks) -> BHSALoadResponse:
     bhsa_status = loader.get_status()
@@ -46,8 +63,7 @@ async def load_bhsa_data(background_tasks: BackgroundTasks) -> BHSALoadResponse:
     )
 
 
-@router.get("/passage", response_model=PassageResponse)
-async def fetch_passage(ref: str) -> PassageResponse:
+def _require_loaded() -> None:
     bhsa_status = loader.get_status()
     if bhsa_status.is_loading:
         raise HTTPException(
@@ -60,13 +76,8 @@ async def fetch_passage(ref: str) -> PassageResponse:
             detail="BHSA not loaded. Call POST /api/bhsa/load first",
         )
 
-    try:
-        data = loader.fetch_passage(ref)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except RuntimeError as exc:
-        raise HTTPException(status_code=503, detail=str(exc)) from exc
 
+def _to_passage_response(data: dict[str, Any]) -> PassageResponse:
     return PassageResponse(
         reference=data["reference"],
         source_lang=data["source_lang"],
@@ -74,6 +85,42 @@ async def fetch_passage(ref: str) -> PassageResponse:
     )
 
 
+@router.get("/passage", response_model=PassageResponse)
+async def fetch_passage(ref: str) -> PassageResponse:
+    _require_loaded()
+
+    try:
+        data = await loader.afetch_passage(ref)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    except TimeoutError as exc:
+        raise HTTPException(status_code=504, detail=f"BHSA extraction timed out for {ref}") from exc
+
+    return _to_passage_response(data)
+
+
+@router.post("/passages")
+async def fetch_passages(payload: PassageBatchRequest) -> StreamingResponse:
+    _require_loaded()
+    try:
+        results = loader.fetch_passages(payload.references)
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+    def _lines() -> Iterator[str]:
+        for ref, data, error in results:
+            item = PassageBatchItem(
+                ref=ref,
+                passage=_to_passage_response(data) if data is not None else None,
+                error=error,
+            )
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/books/{book_name}/verse-counts")
 async def get_verse_counts(book_name: str) -> dict[str, int]:
 
@@ -84,5 +131,7 @@ async def get_verse_counts(book_name: str) -> dict[str, int]:
         counts = loader.get_verse_counts(book_name)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
 
     return {str(k): v for k, v in counts.items()}
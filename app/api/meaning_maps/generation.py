@@ -57,6 +57,7 @@ async def generate_meaning_map(
         raise GenerationError("RAG service is not available. Contact an administrator.") from exc
     try:
         generated_data = await run_generation(
+            db,
             pericope.reference,
             qdrant_client=qdrant,
             entry_brief=entry_brief_data,
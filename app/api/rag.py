@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends, UploadFile, status
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.access_control import require_app_access, require_role
 from app.core.auth_middleware import get_current_user
+from app.core.database import AsyncSessionLocal, get_db
 from app.core.exceptions import ValidationError
 from app.core.qdrant import get_qdrant_client
 from app.db.models.auth import User
@@ -9,11 +14,14 @@ from app.models.rag import (
     DeleteDocumentResponse,
     DocumentInfo,
     DocumentUploadResponse,
+    EmbeddingCacheStats,
+    NamespacePurgeStatus,
     QueryRequest,
     QueryResponse,
     RagNamespace,
 )
 from app.services import rag_service
+from app.services.rag import embedding_cache
 
 router = APIRouter()
 _mm_access = require_app_access("meaning-map-generator")
@@ -28,14 +36,18 @@ _mm_admin = require_role("meaning-map-generator", "admin")
 async def upload_document(
     namespace: RagNamespace,
     file: UploadFile,
+    doc_key: str | None = Query(default=None, min_length=1, max_length=200),
     _: User = _mm_admin,
+    db: AsyncSession = Depends(get_db),
 ) -> DocumentUploadResponse:
     if not file.filename or not file.filename.lower().endswith(".md"):
         raise ValidationError("Only .md files are supported")
 
     content = (await file.read()).decode("utf-8")
     client = get_qdrant_client()
-    return await rag_service.upload_document(client, namespace, file.filename, content)
+    return await rag_service.upload_document(
+        db, client, namespace, file.filename, content, doc_key=doc_key
+    )
 
 
 @router.post("/{namespace}/query", response_model=QueryResponse, dependencies=[_mm_access])
@@ -43,18 +55,55 @@ async def query_documents(
     namespace: RagNamespace,
     payload: QueryRequest,
     _: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ) -> QueryResponse:
     client = get_qdrant_client()
-    return await rag_service.query(client, namespace, payload.question, payload.top_k)
+    return await rag_service.query(
+        db, client, namespace, payload.question, payload.top_k, use_cache=True
+    )
+
+
+@router.post("/{namespace}/query/stream", dependencies=[_mm_access])
+async def stream_query_documents(
+    namespace: RagNamespace,
+    payload: QueryRequest,
+    _: User = Depends(get_current_user),
+) -> StreamingResponse:
+    client = get_qdrant_client()
+
+    async def _sse() -> AsyncIterator[str]:
+        async with AsyncSessionLocal() as db:
+            events = rag_service.stream_query(
+                db, client, namespace, payload.question, payload.top_k, use_cache=True
+            )
+            async for event, data in events:
+                yield f"event: {event}\ndata: {data.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        _sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{namespace}/documents", response_model=list[DocumentInfo], dependencies=[_mm_access])
 async def list_documents(
     namespace: RagNamespace,
+    response: Response,
+    cursor: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=200),
     _: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ) -> list[DocumentInfo]:
-    client = get_qdrant_client()
-    return await rag_service.list_documents(client, namespace)
+    try:
+        documents, next_cursor = await rag_service.list_documents(
+            db, namespace, cursor=cursor, limit=limit
+        )
+    except ValueError as e:
+        raise ValidationError(str(e)) from e
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return documents
 
 
 @router.delete(
@@ -66,7 +115,46 @@ async def delete_document(
     namespace: RagNamespace,
     doc_id: str,
     _: User = _mm_admin,
+    db: AsyncSession = Depends(get_db),
 ) -> DeleteDocumentResponse:
     client = get_qdrant_client()
-    deleted = await rag_service.delete_document(client, namespace, doc_id)
+    deleted = await rag_service.delete_document(db, client, namespace, doc_id)
     return DeleteDocumentResponse(deleted_chunks=deleted, doc_id=doc_id)
+
+
+@router.delete(
+    "/{namespace}/documents",
+    response_model=NamespacePurgeStatus,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def purge_namespace(
+    namespace: RagNamespace,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    _: User = _mm_admin,
+) -> NamespacePurgeStatus:
+    job = await rag_service.begin_purge(db, namespace)
+    if job is None:
+        return await rag_service.get_purge_status(db, namespace)
+    client = get_qdrant_client()
+
+    async def _run_purge() -> None:
+        async with AsyncSessionLocal() as purge_db:
+            await rag_service.purge_namespace(purge_db, client, namespace)
+
+    background_tasks.add_task(_run_purge)
+    return job
+
+
+@router.get("/{namespace}/purge-status", response_model=NamespacePurgeStatus)
+async def get_purge_status(
+    namespace: RagNamespace,
+    db: AsyncSession = Depends(get_db),
+    _: User = _mm_admin,
+) -> NamespacePurgeStatus:
+    return await rag_service.get_purge_status(db, namespace)
+
+
+@router.get("/embedding-cache/stats", response_model=EmbeddingCacheStats)
+async def get_embedding_cache_stats(_: User = _mm_admin) -> EmbeddingCacheStats:
+    return embedding_cache.get_stats()
@@ -1,5 +1,7 @@
 from functools import lru_cache
+from typing import Literal
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -20,17 +22,34 @@ class Settings(BaseSettings):
 
     qdrant_url: str = "http://localhost:6333"
     qdrant_api_key: str | None = None
+    qdrant_collection: str = ""
+    qdrant_quantization: Literal["none", "scalar", "binary"] = "none"
+    qdrant_quantization_oversampling: float = 2.0
 
     google_api_key: str = ""
     google_maps_api_key: str = ""
     google_embedding_model: str = "gemini-embedding-001"
     google_llm_model: str = "gemini-3.1-pro-preview"
+    rag_embedding_provider: Literal["google", "local"] = "google"
+    rag_embedding_dimensions: int = 3072
     rag_chunk_size: int = 1000
     rag_chunk_overlap: int = 200
     rag_top_k: int = 5
+    rag_embedding_cache_ttl_seconds: int = 60 * 60 * 24 * 30
+    rag_embed_batch_size: int = 64
+    rag_embed_concurrency: int = 4
+    rag_hybrid_search: bool = False
+    rag_rerank_candidates: int = 20
 
     gcs_bucket_name: str = ""
     bhsa_data_path: str = ""
+    bhsa_index_path: str = ""
+    bhsa_index_only: bool = False
+    bhsa_download_workers: int = 16
+    bhsa_worker_processes: int = 0
+    bhsa_worker_full_corpus: bool = False
+    bhsa_passage_timeout_seconds: float = 30.0
+    bhsa_collect_timeout_seconds: float = 600.0
 
     cleaning_api_url: str = ""
     cleaning_api_key: str = ""
@@ -47,14 +66,18 @@ class Settings(BaseSettings):
     azure_client_secret: str = ""
     email_from_address: str = "support@shemaywam.com"
 
+    @model_validator(mode="after")
+    def _default_qdrant_collection(self) -> "Settings":
+        if not self.qdrant_collection:
+            self.qdrant_collection = (
+                "meaning_map_prod" if self.env == "production" else "meaning_map_test"
+            )
+        return self
+
     @property
     def cors_origin_list(self) -> list[str]:
         return [item.strip() for item in self.cors_origins.split(",") if item.strip()]
 
-    @property
-    def qdrant_collection(self) -> str:
-        return "meaning_map_prod" if self.env == "production" else "meaning_map_test"
-
 
 @lru_cache
 def get_settings() -> Settings:
@@ -1,65 +1,145 @@
-import contextlib
-import logging
-
-from qdrant_client import AsyncQdrantClient
-from qdrant_client.http.exceptions import UnexpectedResponse
-from qdrant_client.models import Distance, PayloadSchemaType, VectorParams
-
-from app.core.config import get_settings
-
-logger = logging.getLogger(__name__)
-
-_client: AsyncQdrantClient | None = None
-
-
-async def init_qdrant() -> None:
-    global _client
-    settings = get_settings()
-
-    _client = AsyncQdrantClient(
-        url=settings.qdrant_url,
-        api_key=settings.qdrant_api_key,
-    )
-
-    collection_name = settings.qdrant_collection
-    try:
-        if not await _client.collection_exists(collection_name):
-            await _client.create_collection(
-                collection_name=collection_name,
-                vectors_config=VectorParams(size=3072, distance=Distance.COSINE),
-            )
-            logger.info("Created Qdrant collection '%s'", collection_name)
-
-        with contextlib.suppress(UnexpectedResponse, Exception):
-            await _client.create_payload_index(
-                collection_name=collection_name,
-                field_name="namespace",
-                field_schema=PayloadSchemaType.KEYWORD,
-            )
-            await _client.create_payload_index(
-                collection_name=collection_name,
-                field_name="doc_id",
-                field_schema=PayloadSchemaType.KEYWORD,
-            )
-    except Exception:
-        logger.warning(
-            "Could not connect to Qdrant at '%s'. "
-            "RAG endpoints will fail until Qdrant is reachable.",
-            settings.qdrant_url,
-        )
-        _client = None
-
-
-def get_qdrant_client() -> AsyncQdrantClient:
-
-    if _client is None:
-        raise RuntimeError("Qdrant client not initialised — call init_qdrant() first")
-    return _client
-
-
-async def close_qdrant() -> None:
-
-    global _client
-    if _client is not None:
-        await _client.close()
-        _client = None
+import contextlib
+import logging
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.exceptions import UnexpectedResponse
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Distance,
+    Modifier,
+    PayloadSchemaType,
+    QuantizationConfig,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    SparseVectorParams,
+    VectorParams,
+)
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+SPARSE_VECTOR_NAME = "text-bm25"
+MEMORY_LOCATION = ":memory:"
+
+_client: AsyncQdrantClient | None = None
+
+
+def sparse_vectors_config() -> dict[str, SparseVectorParams]:
+    return {SPARSE_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF)}
+
+
+def quantization_config(settings: Settings) -> QuantizationConfig | None:
+    if settings.qdrant_quantization == "scalar":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+        )
+    if settings.qdrant_quantization == "binary":
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+    return None
+
+
+def search_params(settings: Settings) -> SearchParams | None:
+    if settings.qdrant_quantization == "none":
+        return None
+    return SearchParams(
+        quantization=QuantizationSearchParams(
+            rescore=True, oversampling=settings.qdrant_quantization_oversampling
+        )
+    )
+
+
+async def ensure_payload_indexes(client: AsyncQdrantClient, collection_name: str) -> None:
+    with contextlib.suppress(UnexpectedResponse, Exception):
+        await client.create_payload_index(
+            collection_name=collection_name,
+            field_name="namespace",
+            field_schema=PayloadSchemaType.KEYWORD,
+        )
+        await client.create_payload_index(
+            collection_name=collection_name,
+            field_name="doc_id",
+            field_schema=PayloadSchemaType.KEYWORD,
+        )
+
+
+async def create_collection(
+    client: AsyncQdrantClient, collection_name: str, settings: Settings
+) -> None:
+    quantization = quantization_config(settings)
+    await client.create_collection(
+        collection_name=collection_name,
+        vectors_config=VectorParams(
+            size=settings.rag_embedding_dimensions,
+            distance=Distance.COSINE,
+            on_disk=quantization is not None,
+        ),
+        sparse_vectors_config=sparse_vectors_config(),
+        quantization_config=quantization,
+    )
+    await ensure_payload_indexes(client, collection_name)
+
+
+async def _check_hybrid_search(
+    client: AsyncQdrantClient, collection_name: str, settings: Settings
+) -> None:
+    info = await client.get_collection(collection_name)
+    if SPARSE_VECTOR_NAME in (info.config.params.sparse_vectors or {}):
+        return
+    logger.error(
+        "RAG_HYBRID_SEARCH is on but Qdrant collection '%s' has no '%s' sparse vector; "
+        "hybrid search is disabled. Rebuild the collection with "
+        "scripts/migrate_rag_collection.py to enable it.",
+        collection_name,
+        SPARSE_VECTOR_NAME,
+    )
+    settings.rag_hybrid_search = False
+
+
+async def init_qdrant() -> None:
+    global _client
+    settings = get_settings()
+
+    if settings.qdrant_url == MEMORY_LOCATION:
+        _client = AsyncQdrantClient(location=MEMORY_LOCATION)
+    else:
+        _client = AsyncQdrantClient(
+            url=settings.qdrant_url,
+            api_key=settings.qdrant_api_key,
+        )
+
+    collection_name = settings.qdrant_collection
+    try:
+        if not await _client.collection_exists(collection_name):
+            await create_collection(_client, collection_name, settings)
+            logger.info("Created Qdrant collection '%s'", collection_name)
+        else:
+            await ensure_payload_indexes(_client, collection_name)
+            if settings.rag_hybrid_search:
+                await _check_hybrid_search(_client, collection_name, settings)
+    except Exception:
+        logger.warning(
+            "Could not connect to Qdrant at '%s'. "
+            "RAG endpoints will fail until Qdrant is reachable.",
+            settings.qdrant_url,
+        )
+        _client = None
+
+
+def get_qdrant_client() -> AsyncQdrantClient:
+
+    if _client is None:
+        raise RuntimeError("Qdrant client not initialised — call init_qdrant() first")
+    return _client
+
+
+async def close_qdrant() -> None:
+
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
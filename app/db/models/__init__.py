@@ -33,6 +33,7 @@ from app.db.models.project import (
     ProjectOrganizationAccess,
     ProjectUserAccess,
 )
+from app.db.models.rag import RagDocument, RagEmbedding, RagNamespaceVersion, RagPurgeJob
 
 __all__ = [
     "AccessRequest",
@@ -62,6 +63,10 @@ __all__ = [
     "ProjectOrganizationAccess",
     "ProjectPhase",
     "ProjectUserAccess",
+    "RagDocument",
+    "RagEmbedding",
+    "RagNamespaceVersion",
+    "RagPurgeJob",
     "RefreshToken",
     "Role",
     "RolePermission",
@@ -1,6 +1,7 @@
 import logging
 import tempfile
 import uuid
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -24,12 +25,9 @@ from app.inngest.helpers import (
     update_recording_fields,
 )
 from app.inngest.schemas import SegmentResult, SplitRequestedPayload
-from app.services.oral_collector.gcs_utils import content_type_for_format, upload_gcs_blob
+from app.services.oral_collector.gcs_utils import content_type_for_format, upload_gcs_file
 from app.services.oral_collector.recording_service import FORMAT_EXTENSIONS, _gcs_blob_path
-from app.services.oral_collector.split_service import (
-    _download_audio,
-    _ffmpeg_split_segment,
-)
+from app.services.oral_collector.split_service import _ffmpeg_cut_segment
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +78,34 @@ async def persist_split_segments(
     return new_ids
 
 
+def segment_id(run_id: str, index: int) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"tripod-split:{run_id}:{index}"))
+
+
+async def split_segment(
+    gcs_url: str, payload: SplitRequestedPayload, index: int, new_id: str
+) -> SegmentResult:
+    seg = payload.segments[index]
+    fmt = payload.format.lower()
+    ext = FORMAT_EXTENSIONS.get(fmt, f".{fmt}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_file = Path(tmp_dir) / f"segment_{index}{ext}"
+        await _ffmpeg_cut_segment(gcs_url, output_file, seg)
+
+        blob_path = _gcs_blob_path(payload.project_id, seg.genre_id, new_id, fmt)
+        segment_gcs_url = await upload_gcs_file(
+            blob_path, output_file, content_type_for_format(fmt)
+        )
+        return SegmentResult(
+            id=new_id,
+            gcs_url=segment_gcs_url,
+            duration_seconds=seg.end_seconds - seg.start_seconds,
+            file_size_bytes=output_file.stat().st_size,
+            index=index,
+        )
+
+
 async def _on_split_failure(ctx: inngest.Context, _step: inngest.Step) -> None:
     fc = extract_failure_context(ctx, "Splitting failed")
 
@@ -111,43 +137,16 @@ async def split_recording_fn(ctx: inngest.Context, step: inngest.Step) -> str:
         lambda: check_recording_verified(payload.recording_id),
     )
 
-    async def _split_and_upload() -> list[dict[str, object]]:
-        audio_data = await _download_audio(gcs_url)
-        fmt = payload.format.lower()
-        ext = FORMAT_EXTENSIONS.get(fmt, f".{fmt}")
-        content_type = content_type_for_format(fmt)
-        results: list[SegmentResult] = []
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp = Path(tmp_dir)
-            input_file = tmp / f"original{ext}"
-            input_file.write_bytes(audio_data)
-
-            for i, seg in enumerate(payload.segments):
-                new_id = str(uuid.uuid4())
-                output_file = tmp / f"segment_{i}{ext}"
-
-                await _ffmpeg_split_segment(
-                    input_file, output_file, seg.start_seconds, seg.end_seconds
-                )
-
-                segment_bytes = output_file.read_bytes()
-                blob_path = _gcs_blob_path(payload.project_id, seg.genre_id, new_id, fmt)
-                segment_gcs_url = await upload_gcs_blob(blob_path, segment_bytes, content_type)
-
-                results.append(
-                    SegmentResult(
-                        id=new_id,
-                        gcs_url=segment_gcs_url,
-                        duration_seconds=seg.end_seconds - seg.start_seconds,
-                        file_size_bytes=len(segment_bytes),
-                        index=i,
-                    )
-                )
-
-        return [r.model_dump() for r in results]
-
-    raw_results = await step.run("split-and-upload", _split_and_upload)
+    def _segment_step(index: int) -> Callable[[], Awaitable[dict[str, object]]]:
+        async def _split_one() -> dict[str, object]:
+            result = await split_segment(gcs_url, payload, index, segment_id(ctx.run_id, index))
+            return result.model_dump()
+
+        return lambda: step.run(f"split-segment-{index}", _split_one)
+
+    raw_results = await ctx.group.parallel(
+        tuple(_segment_step(i) for i in range(len(payload.segments)))
+    )
     segment_results = [SegmentResult.model_validate(r) for r in raw_results]
 
     async def _save_segments() -> list[str]:
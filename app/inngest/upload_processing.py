@@ -19,6 +19,7 @@ from app.inngest.helpers import (
 from app.inngest.schemas import BlobVerificationResult, UploadConfirmedPayload
 from app.services.oral_collector.constants import GCS_OC_BUCKET, GCS_OC_PROJECT
 from app.services.oral_collector.gcs_utils import GCS_PUBLIC_BASE
+from app.services.storage import gcs
 
 logger = logging.getLogger(__name__)
 
@@ -70,16 +71,10 @@ async def process_upload_fn(ctx: inngest.Context, step: inngest.Step) -> str:
     async def _verify_gcs_blob() -> dict[str, int]:
         import base64
 
-        from google.cloud import storage
-
-        client = storage.Client(project=GCS_OC_PROJECT)
-        bucket = client.bucket(GCS_OC_BUCKET)
-        blob = bucket.blob(payload.expected_blob_path)
-
-        if not blob.exists():
+        blob = await gcs.get_blob(GCS_OC_BUCKET, payload.expected_blob_path, project=GCS_OC_PROJECT)
+        if blob is None:
             raise inngest.NonRetriableError("Blob does not exist in GCS — upload may have failed")
 
-        blob.reload()
         actual_size = blob.size or 0
         if payload.expected_size_bytes > 0 and actual_size != payload.expected_size_bytes:
             raise inngest.NonRetriableError(
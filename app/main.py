@@ -41,8 +41,9 @@ from app.core.database import AsyncSessionLocal, close_db, init_db
 from app.core.exceptions import register_exception_handlers
 from app.core.logging import setup_logging
 from app.core.qdrant import close_qdrant, init_qdrant
-from app.services.bhsa import loader
+from app.services.bhsa import loader, worker_pool
 from app.services.meaning_map.seed_books import seed_books
+from app.services.storage import gcs
 
 
 def _load_bhsa_background() -> None:
@@ -65,9 +66,12 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
             print(f"[STARTUP] Seeded {seeded} Bible books.", flush=True)
     await init_qdrant()
     threading.Thread(target=_load_bhsa_background, daemon=True).start()
+    worker_pool.start()
     try:
         yield
     finally:
+        worker_pool.shutdown()
+        gcs.shutdown()
         await close_qdrant()
         await close_db()
 
@@ -82,6 +86,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     app.include_router(health_router)
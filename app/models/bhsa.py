@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ClauseData(BaseModel):
@@ -27,10 +27,33 @@ class PassageResponse(BaseModel):
     clauses: list[ClauseData]
 
 
+class PassageBatchRequest(BaseModel):
+    references: list[str] = Field(min_length=1, max_length=200)
+
+
+class PassageBatchItem(BaseModel):
+    ref: str
+    passage: PassageResponse | None = None
+    error: str | None = None
+
+
 class BHSAStatus(BaseModel):
     is_loaded: bool
     is_loading: bool
     message: str
+    download_bytes_done: int = 0
+    download_bytes_total: int = 0
+    download_bytes_per_second: float = 0.0
+
+
+class PassageCacheStats(BaseModel):
+    passage_hits: int
+    passage_misses: int
+    verse_hits: int
+    verse_misses: int
+    cached_passages: int
+    cached_verses: int
+    cached_clauses: int
 
 
 class BHSAStatusResponse(BaseModel):
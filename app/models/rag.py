@@ -19,6 +19,8 @@ class DocumentUploadResponse(BaseModel):
     filename: str
     namespace: str
     chunk_count: int
+    embedded_chunks: int
+    removed_chunks: int = 0
 
 
 class DocumentInfo(BaseModel):
@@ -42,3 +44,33 @@ class QueryResponse(BaseModel):
 class DeleteDocumentResponse(BaseModel):
     deleted_chunks: int
     doc_id: str
+
+
+class NamespacePurgeStatus(BaseModel):
+    namespace: str
+    status: str
+    total_chunks: int = 0
+    deleted_chunks: int = 0
+    deleted_documents: int = 0
+    message: str
+
+
+class EmbeddingCacheStats(BaseModel):
+    memory_hits: int
+    db_hits: int
+    misses: int
+    embedded_texts: int
+    embedded_chars: int
+    cached_entries: int
+
+
+class QueryStreamSources(BaseModel):
+    sources: list[SourceChunk]
+
+
+class QueryStreamToken(BaseModel):
+    text: str
+
+
+class QueryStreamError(BaseModel):
+    detail: str
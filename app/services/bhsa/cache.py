@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import copy
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+from cachetools import LRUCache  # type: ignore[import-untyped]
+
+from app.models.bhsa import PassageCacheStats
+from app.services.bhsa.clause import renumber_clauses
+from app.services.bhsa.index import ClauseIndex
+from app.services.bhsa.passage import extract_verse_records
+from app.services.bhsa.reference import format_reference, parse_reference
+
+_PASSAGE_CACHE_CLAUSES = 4096
+_VERSE_CACHE_CLAUSES = 16384
+
+PassageKey = tuple[str, int, int, int]
+VerseKey = tuple[str, int, int]
+
+
+def _passage_size(passage: dict[str, Any]) -> int:
+    return max(len(passage["clauses"]), 1)
+
+
+def _verse_size(records: list[dict[str, Any]]) -> int:
+    return max(len(records), 1)
+
+
+def _merge_ranges(keys: list[PassageKey]) -> dict[tuple[str, int], list[tuple[int, int]]]:
+    by_chapter: dict[tuple[str, int], list[tuple[int, int]]] = {}
+    for book, chapter, start_verse, end_verse in sorted(keys):
+        spans = by_chapter.setdefault((book, chapter), [])
+        if spans and start_verse <= spans[-1][1] + 1:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end_verse))
+        else:
+            spans.append((start_verse, end_verse))
+    return by_chapter
+
+
+def _copy_passage(passage: dict[str, Any]) -> dict[str, Any]:
+    # Clauses carry lists (names, subjects, content_words) that callers may edit.
+    return {**passage, "clauses": copy.deepcopy(passage["clauses"])}
+
+
+class PassageCache:
+    def __init__(
+        self,
+        passage_clauses: int = _PASSAGE_CACHE_CLAUSES,
+        verse_clauses: int = _VERSE_CACHE_CLAUSES,
+    ) -> None:
+        self._passages: LRUCache[PassageKey, dict[str, Any]] = LRUCache(
+            maxsize=passage_clauses, getsizeof=_passage_size
+        )
+        self._verses: LRUCache[VerseKey, list[dict[str, Any]]] = LRUCache(
+            maxsize=verse_clauses, getsizeof=_verse_size
+        )
+        self._lock = threading.Lock()
+        self.passage_hits = 0
+        self.passage_misses = 0
+        self.verse_hits = 0
+        self.verse_misses = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._passages.clear()
+            self._verses.clear()
+            self.passage_hits = self.passage_misses = 0
+            self.verse_hits = self.verse_misses = 0
+
+    def stats(self) -> PassageCacheStats:
+        with self._lock:
+            return PassageCacheStats(
+                passage_hits=self.passage_hits,
+                passage_misses=self.passage_misses,
+                verse_hits=self.verse_hits,
+                verse_misses=self.verse_misses,
+                cached_passages=len(self._passages),
+                cached_verses=len(self._verses),
+                cached_clauses=int(self._passages.currsize + self._verses.currsize),
+            )
+
+    def fetch(self, source: Any, ref: str) -> dict[str, Any]:
+        return self._fetch_key(source, parse_reference(ref), {})
+
+    def fetch_many(
+        self, source: Any, refs: list[str]
+    ) -> Iterator[tuple[str, dict[str, Any] | None, str | None]]:
+        keys: dict[str, PassageKey | ValueError] = {}
+        for ref in refs:
+            try:
+                keys[ref] = parse_reference(ref)
+            except ValueError as exc:
+                keys[ref] = exc
+
+        with self._lock:
+            missing = [k for k in keys.values() if isinstance(k, tuple) and k not in self._passages]
+        pinned: dict[VerseKey, list[dict[str, Any]] | None] = {}
+        for (book, chapter), spans in _merge_ranges(missing).items():
+            for start_verse, end_verse in spans:
+                for verse in range(start_verse, end_verse + 1):
+                    if self._pinned_verse(source, pinned, (book, chapter, verse)) is None:
+                        break
+
+        for ref in refs:
+            key = keys[ref]
+            if isinstance(key, ValueError):
+                yield ref, None, str(key)
+                continue
+            try:
+                yield ref, self._fetch_key(source, key, pinned), None
+            except ValueError as exc:
+                yield ref, None, str(exc)
+
+    def _fetch_key(
+        self,
+        source: Any,
+        key: PassageKey,
+        pinned: dict[VerseKey, list[dict[str, Any]] | None],
+    ) -> dict[str, Any]:
+        with self._lock:
+            cached = self._passages.get(key)
+            if cached is not None:
+                self.passage_hits += 1
+                return _copy_passage(cached)
+            self.passage_misses += 1
+
+        book, chapter, start_verse, end_verse = key
+        records: list[dict[str, Any]] = []
+        actual_end = start_verse
+        for verse in range(start_verse, end_verse + 1):
+            verse_records = self._pinned_verse(source, pinned, (book, chapter, verse))
+            if verse_records is None:
+                if verse == start_verse:
+                    raise ValueError(f"Could not find {book} {chapter}:{verse}")
+                break
+            actual_end = verse
+            records.extend(dict(r) for r in verse_records)
+
+        passage = {
+            "reference": format_reference(book, chapter, start_verse, actual_end),
+            "source_lang": "hbo",
+            "clauses": renumber_clauses(records),
+        }
+        with self._lock:
+            if _passage_size(passage) <= self._passages.maxsize:
+                self._passages[key] = passage
+        return _copy_passage(passage)
+
+    def _pinned_verse(
+        self,
+        source: Any,
+        pinned: dict[VerseKey, list[dict[str, Any]] | None],
+        key: VerseKey,
+    ) -> list[dict[str, Any]] | None:
+        if key not in pinned:
+            pinned[key] = self._verse_records(source, *key)
+        return pinned[key]
+
+    def _verse_records(
+        self, source: Any, book: str, chapter: int, verse: int
+    ) -> list[dict[str, Any]] | None:
+        key: VerseKey = (book, chapter, verse)
+        with self._lock:
+            cached = self._verses.get(key)
+            if cached is not None:
+                self.verse_hits += 1
+                return cached
+            self.verse_misses += 1
+
+        if isinstance(source, ClauseIndex):
+            records = source.verse_records(book, chapter, verse)
+        else:
+            records = extract_verse_records(source, book, chapter, verse)
+        if records is None:
+            return None
+
+        with self._lock:
+            if _verse_size(records) <= self._verses.maxsize:
+                self._verses[key] = records
+        return records
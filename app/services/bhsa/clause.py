@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, cast
 
+from app.services.bhsa.lexicon import WordFeatures, word_features
 from app.services.book_context.generation.types import ClauseExtract, ContentWordEntry
 
 _MAINLINE_TYPES = frozenset({"Way0", "WayX"})
 _CONTENT_FUNCTIONS = frozenset({"Subj", "Objc", "Cmpl", "PreC"})
 _FILTERED_PDP = frozenset({"prde", "prps", "prin", "intj"})
+_POSITIONAL_KEYS = frozenset({"clause_id", "is_mainline", "chain_position"})
 
 
 def is_mainline(clause_type: str) -> bool:
@@ -21,44 +23,51 @@ def get_chain_position(clause_type: str, prev_type: str | None) -> str:
     return "continuation"
 
 
-def _extract_lemmas(words: list[Any], F: Any) -> list[str]:
+def strip_positional(data: ClauseExtract) -> dict[str, Any]:
+    return {k: v for k, v in data.items() if k not in _POSITIONAL_KEYS}
+
+
+def renumber_clauses(records: list[dict[str, Any]]) -> list[ClauseExtract]:
+    clauses: list[ClauseExtract] = []
+    prev_type: str | None = None
+    for clause_id, record in enumerate(records, start=1):
+        clause_type = record["clause_type"]
+        record["clause_id"] = clause_id
+        record["is_mainline"] = is_mainline(clause_type)
+        record["chain_position"] = get_chain_position(clause_type, prev_type)
+        clauses.append(cast(ClauseExtract, record))
+        prev_type = clause_type
+    return clauses
+
+
+def _extract_lemmas(words: list[Any], features: WordFeatures) -> list[str]:
     lemmas = []
     for w in words:
-        if F.sp.v(w) in ("art", "prep", "conj"):
+        if features.sp(w) in ("art", "prep", "conj"):
             continue
-        lemma = None
-        for attr in ("lex_utf8", "g_lex_utf8", "lex"):
-            if hasattr(F, attr):
-                lemma = getattr(F, attr).v(w)
-                break
-        if lemma:
-            lemmas.append(lemma.rstrip("/=[]"))
+        lemma = features.lexeme(w).lemma
+        if lemma is not None:
+            lemmas.append(lemma)
     return lemmas
 
 
-def _content_word_entry(w: Any, F: Any, sp: str, function: str | None) -> ContentWordEntry | None:
-    lex_utf8 = None
-    for attr in ("lex_utf8", "g_lex_utf8"):
-        if hasattr(F, attr):
-            lex_utf8 = getattr(F, attr).v(w)
-            if lex_utf8:
-                break
-    lex_ascii = F.lex.v(w) if hasattr(F, "lex") else None
-    cleaned_utf8 = (lex_utf8 or "").rstrip("/=[]") or None
-    cleaned_ascii = (lex_ascii or "").rstrip("/=[]") or None
-    if not cleaned_utf8 and not cleaned_ascii:
+def _content_word_entry(
+    w: Any, features: WordFeatures, sp: str, function: str | None, pdp: str | None
+) -> ContentWordEntry | None:
+    lexeme = features.lexeme(w)
+    if not lexeme.lex_utf8 and not lexeme.lex:
         return None
     entry: ContentWordEntry = {
-        "lex_utf8": cleaned_utf8,
-        "lex": cleaned_ascii,
+        "lex_utf8": lexeme.lex_utf8,
+        "lex": lexeme.lex,
         "sp": sp,
-        "gloss": (F.gloss.v(w) if hasattr(F, "gloss") else "") or "",
-        "pdp": F.pdp.v(w) if hasattr(F, "pdp") else None,
+        "gloss": lexeme.gloss,
+        "pdp": pdp,
         "function": function,
     }
     if sp == "verb":
-        entry["binyan"] = F.vs.v(w) if hasattr(F, "vs") else None
-        entry["tense"] = F.vt.v(w) if hasattr(F, "vt") else None
+        entry["binyan"] = features.vs(w)
+        entry["tense"] = features.vt(w)
     return entry
 
 
@@ -71,26 +80,21 @@ def extract_clause(
     L: Any,
     T: Any,
 ) -> ClauseExtract:
+    features = word_features(F)
     text = T.text(clause_node).strip()
     clause_type = F.typ.v(clause_node) or "Unknown"
     words = L.d(clause_node, otype="word")
+    lexemes = [features.lexeme(w) for w in words]
 
-    glosses = []
-    for w in words:
-        g = F.gloss.v(w) if hasattr(F, "gloss") and F.gloss.v(w) else ""
-        if g:
-            glosses.append(g)
+    glosses = [lexeme.gloss for lexeme in lexemes if lexeme.gloss]
 
     verb_lemma = verb_lemma_ascii = verb_stem = verb_tense = None
-    for w in words:
-        if F.sp.v(w) == "verb":
-            for attr in ("lex_utf8", "g_lex_utf8", "lex"):
-                if hasattr(F, attr):
-                    verb_lemma = getattr(F, attr).v(w)
-                    break
-            verb_lemma_ascii = F.lex.v(w)
-            verb_stem = F.vs.v(w)
-            verb_tense = F.vt.v(w)
+    for w, lexeme in zip(words, lexemes, strict=True):
+        if features.sp(w) == "verb":
+            verb_lemma = lexeme.lemma
+            verb_lemma_ascii = lexeme.lemma_ascii
+            verb_stem = features.vs(w)
+            verb_tense = features.vt(w)
             break
 
     subjects: list[str] = []
@@ -103,7 +107,7 @@ def extract_clause(
     for phrase_node in L.d(clause_node, otype="phrase"):
         func = F.function.v(phrase_node)
         phrase_words = L.d(phrase_node, otype="word")
-        lemmas = _extract_lemmas(phrase_words, F)
+        lemmas = _extract_lemmas(phrase_words, features)
         clean = " ".join(lemmas) if lemmas else None
 
         if func == "Subj" and clean:
@@ -112,30 +116,23 @@ def extract_clause(
             objects.append(clean)
 
         for w in phrase_words:
-            sp = F.sp.v(w)
+            sp = features.sp(w)
             if sp == "nmpr":
-                for attr in ("lex_utf8", "lex"):
-                    if hasattr(F, attr):
-                        name = getattr(F, attr).v(w)
-                        if name:
-                            clean_name = name.rstrip("/=[]")
-                            names.append(clean_name)
-                            if clean_name not in name_glosses:
-                                gloss_val = F.gloss.v(w) if hasattr(F, "gloss") else ""
-                                if gloss_val:
-                                    name_glosses[clean_name] = gloss_val
-                            if clean_name not in name_types and hasattr(F, "nametype"):
-                                nt = F.nametype.v(w) or ""
-                                if nt:
-                                    name_types[clean_name] = nt
-                        break
+                lexeme = features.lexeme(w)
+                clean_name = lexeme.name
+                if clean_name is not None:
+                    names.append(clean_name)
+                    if clean_name not in name_glosses and lexeme.gloss:
+                        name_glosses[clean_name] = lexeme.gloss
+                    if clean_name not in name_types and lexeme.nametype:
+                        name_types[clean_name] = lexeme.nametype
                 continue
 
             if sp == "verb" or (sp in ("subs", "adjv") and func in _CONTENT_FUNCTIONS):
-                pdp = F.pdp.v(w) if hasattr(F, "pdp") else None
+                pdp = features.pdp(w)
                 if pdp in _FILTERED_PDP:
                     continue
-                entry = _content_word_entry(w, F, sp, func)
+                entry = _content_word_entry(w, features, sp, func, pdp)
                 if entry:
                     content_words.append(entry)
 
@@ -147,13 +144,13 @@ def extract_clause(
         "clause_type": clause_type,
         "is_mainline": is_mainline(clause_type),
         "chain_position": get_chain_position(clause_type, prev_type),
-        "lemma": verb_lemma.rstrip("/=[]") if verb_lemma else None,
-        "lemma_ascii": (verb_lemma_ascii.rstrip("/=[]") if verb_lemma_ascii else None),
+        "lemma": verb_lemma,
+        "lemma_ascii": verb_lemma_ascii,
         "binyan": verb_stem,
         "tense": verb_tense,
         "subjects": subjects,
         "objects": objects,
-        "has_ki": any(F.lex.v(w) == "KJ/" for w in words),
+        "has_ki": any(lexeme.is_ki for lexeme in lexemes),
         "names": list(set(names)),
         "name_glosses": name_glosses,
         "name_types": name_types,
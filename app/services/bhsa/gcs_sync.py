@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".gcs-manifest.json"
+_PART_SUFFIX = ".part"
+_HASH_CHUNK = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    blob_name: str
+    rel_path: str
+    size: int
+    crc32c: str | None
+
+
+@dataclass
+class DownloadProgress:
+    files_total: int = 0
+    files_done: int = 0
+    bytes_total: int = 0
+    bytes_done: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add_bytes(self, n: int) -> None:
+        with self._lock:
+            self.bytes_done += n
+
+    def file_done(self) -> None:
+        with self._lock:
+            self.files_done += 1
+
+    @property
+    def bytes_per_second(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.bytes_done / elapsed if elapsed > 0 else 0.0
+
+    def describe(self) -> str:
+        mb_done = self.bytes_done / 1_000_000
+        mb_total = self.bytes_total / 1_000_000
+        rate = self.bytes_per_second / 1_000_000
+        return (
+            f"Downloading: {self.files_done}/{self.files_total} files, "
+            f"{mb_done:.1f}/{mb_total:.1f} MB ({rate:.1f} MB/s)"
+        )
+
+
+class _CountingWriter:
+    def __init__(self, fh: Any, progress: DownloadProgress) -> None:
+        self._fh = fh
+        self._progress = progress
+
+    def write(self, data: bytes) -> int:
+        written: int = self._fh.write(data)
+        self._progress.add_bytes(len(data))
+        return written
+
+
+def crc32c_of(path: Path) -> str:
+    import google_crc32c
+
+    checksum = google_crc32c.Checksum()
+    with path.open("rb") as fh:
+        while chunk := fh.read(_HASH_CHUNK):
+            checksum.update(chunk)
+    return base64.b64encode(checksum.digest()).decode("ascii")
+
+
+def list_manifest(bucket: Any, prefix: str) -> list[ManifestEntry]:
+    entries: list[ManifestEntry] = []
+    for blob in bucket.list_blobs(prefix=prefix):
+        rel_path = blob.name.removeprefix(prefix)
+        if not rel_path or rel_path.endswith("/"):
+            continue
+        entries.append(ManifestEntry(blob.name, rel_path, int(blob.size or 0), blob.crc32c))
+    return entries
+
+
+def _load_verified(dest_dir: Path) -> dict[str, dict[str, Any]]:
+    try:
+        data: dict[str, dict[str, Any]] = json.loads((dest_dir / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    return data
+
+
+def _save_verified(dest_dir: Path, verified: dict[str, dict[str, Any]]) -> None:
+    tmp_path = dest_dir / (MANIFEST_NAME + ".tmp")
+    tmp_path.write_text(json.dumps(verified, sort_keys=True))
+    tmp_path.replace(dest_dir / MANIFEST_NAME)
+
+
+def _is_current(dest: Path, entry: ManifestEntry, recorded: dict[str, Any] | None) -> bool:
+    try:
+        stat = dest.stat()
+    except FileNotFoundError:
+        return False
+    if stat.st_size != entry.size:
+        return False
+    if (
+        recorded
+        and recorded.get("crc32c") == entry.crc32c
+        and recorded.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        return True
+    return entry.crc32c is None or crc32c_of(dest) == entry.crc32c
+
+
+def _part_path(dest: Path) -> Path:
+    return dest.with_name(dest.name + _PART_SUFFIX)
+
+
+def _remaining_bytes(dest: Path, entry: ManifestEntry) -> int:
+    part = _part_path(dest)
+    done = part.stat().st_size if part.exists() else 0
+    return entry.size - done if done <= entry.size else entry.size
+
+
+def _download_entry(
+    bucket: Any, entry: ManifestEntry, dest: Path, progress: DownloadProgress
+) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part = _part_path(dest)
+    offset = part.stat().st_size if part.exists() else 0
+    if offset > entry.size:
+        part.unlink()
+        offset = 0
+
+    if offset < entry.size:
+        blob = bucket.blob(entry.blob_name)
+        with part.open("ab") as fh:
+            blob.download_to_file(
+                _CountingWriter(fh, progress), start=offset or None, checksum=None
+            )
+    elif not part.exists():
+        part.touch()
+
+    if entry.crc32c is not None and crc32c_of(part) != entry.crc32c:
+        part.unlink()
+        raise RuntimeError(f"CRC32C mismatch for {entry.blob_name}")
+    part.replace(dest)
+
+
+def sync_prefix(
+    bucket: Any,
+    prefix: str,
+    dest_dir: Path,
+    *,
+    workers: int,
+    progress: DownloadProgress,
+) -> int:
+    entries = list_manifest(bucket, prefix)
+    verified = _load_verified(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    pending = [
+        e for e in entries if not _is_current(dest_dir / e.rel_path, e, verified.get(e.rel_path))
+    ]
+    progress.files_total = len(pending)
+    progress.bytes_total = sum(_remaining_bytes(dest_dir / e.rel_path, e) for e in pending)
+    progress.started_at = time.monotonic()
+
+    def _run(entry: ManifestEntry) -> None:
+        _download_entry(bucket, entry, dest_dir / entry.rel_path, progress)
+        progress.file_done()
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        list(pool.map(_run, pending))
+
+    verified = {}
+    for entry in entries:
+        stat = (dest_dir / entry.rel_path).stat()
+        verified[entry.rel_path] = {
+            "size": entry.size,
+            "crc32c": entry.crc32c,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+    _save_verified(dest_dir, verified)
+
+    logger.info(
+        "Synced %d/%d files (%d bytes) from gs://%s/%s",
+        len(pending),
+        len(entries),
+        progress.bytes_total,
+        bucket.name,
+        prefix,
+    )
+    return len(pending)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any, Final
+
+from app.services.bhsa.clause import extract_clause, renumber_clauses, strip_positional
+from app.services.book_context.generation.types import ClauseExtract
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"BHSAIDX1"
+_PREAMBLE = struct.Struct("<8sQ")
+_OFFSET_TYPECODE: Final = "Q"
+_OFFSET_SIZE = array(_OFFSET_TYPECODE).itemsize
+
+
+def _encode_record(data: ClauseExtract) -> bytes:
+    record = strip_positional(data)
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def build_index(tf_api: Any, path: str | Path) -> int:
+    F = tf_api.api.F
+    L = tf_api.api.L
+    T = tf_api.api.T
+
+    books: dict[str, dict[str, list[int]]] = {}
+    offsets = array(_OFFSET_TYPECODE, [0])
+    chunks: list[bytes] = []
+    size = 0
+
+    for book_node in F.otype.s("book"):
+        book = T.sectionFromNode(book_node)[0]
+        chapters: dict[str, list[int]] = {}
+        for ch_node in L.d(book_node, otype="chapter"):
+            chapter = T.sectionFromNode(ch_node)[1]
+            verse_starts: list[int] = []
+            for verse_node in L.d(ch_node, otype="verse"):
+                verse = T.sectionFromNode(verse_node)[2]
+                verse_starts.append(len(offsets) - 1)
+                for clause_node in L.d(verse_node, otype="clause"):
+                    chunk = _encode_record(extract_clause(clause_node, verse, 0, None, F, L, T))
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    offsets.append(size)
+            verse_starts.append(len(offsets) - 1)
+            chapters[str(chapter)] = verse_starts
+        books[book] = chapters
+
+    header = json.dumps(
+        {"byteorder": sys.byteorder, "clause_count": len(offsets) - 1, "books": books},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    header += b" " * (-(len(header) + _PREAMBLE.size) % _OFFSET_SIZE)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("wb") as fh:
+        fh.write(_PREAMBLE.pack(_MAGIC, len(header)))
+        fh.write(header)
+        offsets.tofile(fh)
+        for chunk in chunks:
+            fh.write(chunk)
+    tmp_path.replace(path)
+
+    logger.info("Wrote BHSA clause index with %d clauses to %s", len(offsets) - 1, path)
+    return len(offsets) - 1
+
+
+class ClauseIndex:
+    def __init__(self, buffer: Any) -> None:
+        view = memoryview(buffer)
+        magic, header_len = _PREAMBLE.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("Not a BHSA clause index")
+
+        header_end = _PREAMBLE.size + header_len
+        header = json.loads(bytes(view[_PREAMBLE.size : header_end]))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError("BHSA clause index was built on a different byte order")
+
+        count = header["clause_count"]
+        offsets_end = header_end + (count + 1) * _OFFSET_SIZE
+        self._books: dict[str, dict[int, list[int]]] = {
+            book: {int(ch): starts for ch, starts in chapters.items()}
+            for book, chapters in header["books"].items()
+        }
+        self._offsets = view[header_end:offsets_end].cast(_OFFSET_TYPECODE)
+        self._payload = view[offsets_end:]
+        self.clause_count: int = count
+
+    def _verse_starts(self, book: str, chapter: int) -> list[int] | None:
+        return self._books.get(book, {}).get(chapter)
+
+    def _records(self, first: int, last: int) -> list[dict[str, Any]]:
+        offsets = self._offsets
+        return [
+            json.loads(bytes(self._payload[offsets[i] : offsets[i + 1]]))
+            for i in range(first, last)
+        ]
+
+    def verse_counts(self, book: str) -> dict[int, int]:
+        return {ch: len(starts) - 1 for ch, starts in self._books.get(book, {}).items()}
+
+    def verse_records(self, book: str, chapter: int, verse: int) -> list[dict[str, Any]] | None:
+        starts = self._verse_starts(book, chapter)
+        if not starts or not 1 <= verse < len(starts):
+            return None
+        return self._records(starts[verse - 1], starts[verse])
+
+    def stream_book(self, book: str, chapter_count: int) -> Generator[dict[str, Any], None, None]:
+        for chapter in range(1, chapter_count + 1):
+            starts = self._verse_starts(book, chapter)
+            if not starts:
+                yield {"chapter": chapter, "verse_count": 0, "clauses": []}
+                continue
+            yield {
+                "chapter": chapter,
+                "verse_count": len(starts) - 1,
+                "clauses": renumber_clauses(self._records(starts[0], starts[-1])),
+            }
+
+
+def open_index(path: str | Path) -> ClauseIndex:
+    with Path(path).open("rb") as fh:
+        mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    return ClauseIndex(mapped)
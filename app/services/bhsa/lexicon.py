@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+_LEX_SUFFIXES = "/=[]"
+
+
+def _absent(_node: Any) -> Any:
+    return None
+
+
+def _first_accessor(F: Any, attrs: tuple[str, ...]) -> Callable[[Any], Any] | None:
+    for attr in attrs:
+        if hasattr(F, attr):
+            accessor: Callable[[Any], Any] = getattr(F, attr).v
+            return accessor
+    return None
+
+
+def _strip(value: str | None) -> str | None:
+    return value.rstrip(_LEX_SUFFIXES) if value else None
+
+
+@dataclass(frozen=True, slots=True)
+class Lexeme:
+    lemma: str | None
+    lemma_ascii: str | None
+    name: str | None
+    lex_utf8: str | None
+    lex: str | None
+    gloss: str
+    nametype: str
+    is_ki: bool
+
+
+class WordFeatures:
+    def __init__(self, F: Any) -> None:
+        self.F = F
+        self.sp: Callable[[Any], Any] = F.sp.v
+        self.pdp = F.pdp.v if hasattr(F, "pdp") else _absent
+        self.vs = F.vs.v if hasattr(F, "vs") else _absent
+        self.vt = F.vt.v if hasattr(F, "vt") else _absent
+        self._lex = F.lex.v if hasattr(F, "lex") else _absent
+        self._language = F.language.v if hasattr(F, "language") else _absent
+        self._lemma = _first_accessor(F, ("lex_utf8", "g_lex_utf8", "lex"))
+        self._name = _first_accessor(F, ("lex_utf8", "lex"))
+        self._utf8 = [getattr(F, a).v for a in ("lex_utf8", "g_lex_utf8") if hasattr(F, a)]
+        self._gloss = F.gloss.v if hasattr(F, "gloss") else _absent
+        self._nametype = F.nametype.v if hasattr(F, "nametype") else _absent
+        self._interned = hasattr(F, "lex") and hasattr(F, "lex_utf8")
+        self._lexemes: dict[tuple[str | None, str], Lexeme] = {}
+
+    def lexeme(self, w: Any) -> Lexeme:
+        if not self._interned:
+            return self._build(w)
+        # lex values are unique only within a language: Hebrew and Aramaic share e.g. BR/.
+        key = (self._language(w), self._lex(w))
+        lexeme = self._lexemes.get(key)
+        if lexeme is None:
+            lexeme = self._lexemes[key] = self._build(w)
+        return lexeme
+
+    def preload(self, words: Iterable[Any]) -> int:
+        for w in words:
+            self.lexeme(w)
+        return len(self._lexemes)
+
+    def _build(self, w: Any) -> Lexeme:
+        lex_utf8 = None
+        for accessor in self._utf8:
+            lex_utf8 = accessor(w)
+            if lex_utf8:
+                break
+        lex_ascii = self._lex(w)
+        return Lexeme(
+            lemma=_strip(self._lemma(w)) if self._lemma else None,
+            lemma_ascii=_strip(lex_ascii),
+            name=_strip(self._name(w)) if self._name else None,
+            lex_utf8=_strip(lex_utf8) or None,
+            lex=_strip(lex_ascii) or None,
+            gloss=self._gloss(w) or "",
+            nametype=self._nametype(w) or "",
+            is_ki=lex_ascii == "KJ/",
+        )
+
+
+_current: WordFeatures | None = None
+
+
+def word_features(F: Any) -> WordFeatures:
+    global _current
+
+    current = _current
+    if current is None or current.F is not F:
+        current = _current = WordFeatures(F)
+    return current
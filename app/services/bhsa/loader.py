@@ -1,34 +1,60 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import tempfile
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from app.core.config import Settings, get_settings
-from app.models.bhsa import BHSAStatus
-from app.services.bhsa.passage import extract_passage
+from app.models.bhsa import BHSAStatus, PassageCacheStats
+from app.services.bhsa.cache import PassageCache
+from app.services.bhsa.gcs_sync import DownloadProgress, sync_prefix
+from app.services.bhsa.index import ClauseIndex, open_index
+from app.services.bhsa.lexicon import word_features
+from app.services.bhsa.reference import normalize_book_name
+from app.services.bhsa.structure import (
+    ChapterStructure,
+    attach_structure,
+    build_structure,
+    structure_for,
+)
+from app.services.storage import gcs
 
 logger = logging.getLogger(__name__)
 
+_GCS_PREFIX = "text-fabric-data/"
+
 _tf_api: Any = None
+_index: ClauseIndex | None = None
 _is_loaded: bool = False
 _is_loading: bool = False
 _message: str = "Not loaded"
+_passage_cache = PassageCache()
+_download_progress: DownloadProgress | None = None
+_index_fetch_lock = threading.Lock()
 
 
 def get_status() -> BHSAStatus:
+    progress = _download_progress
+    message = _message
+    if _is_loading and progress is not None and progress.files_done < progress.files_total:
+        message = progress.describe()
     return BHSAStatus(
         is_loaded=_is_loaded,
         is_loading=_is_loading,
-        message=_message,
+        message=message,
+        download_bytes_done=progress.bytes_done if progress else 0,
+        download_bytes_total=progress.bytes_total if progress else 0,
+        download_bytes_per_second=progress.bytes_per_second if progress else 0.0,
     )
 
 
 def load(*, settings: Settings | None = None, force: bool = False) -> None:
-    from tf.app import use
-
-    global _tf_api, _is_loaded, _is_loading, _message
+    global _tf_api, _index, _is_loaded, _is_loading, _message
 
     if _is_loaded and not force:
         _message = "Data already loaded"
@@ -43,18 +69,20 @@ def load(*, settings: Settings | None = None, force: bool = False) -> None:
     try:
         _message = "Initializing BHSA data load..."
 
-        bucket = settings.gcs_bucket_name
-        if bucket:
-            _download_from_gcs(bucket)
-
-        data_path = settings.bhsa_data_path
-        if data_path:
-            _message = f"Loading Text-Fabric from {data_path}..."
-            _tf_api = use(data_path, silent=False)
+        if settings.bhsa_index_only:
+            _tf_api = None
+            _index = _open_index(settings.bhsa_index_path, settings.gcs_bucket_name)
+            if _index is None:
+                raise RuntimeError("BHSA_INDEX_ONLY requires an existing BHSA_INDEX_PATH")
         else:
-            _message = "Loading Text-Fabric (ETCBC/bhsa)..."
-            _tf_api = use("ETCBC/bhsa", silent=False)
-
+            _tf_api = _load_text_fabric(settings)
+            _message = "Building BHSA book structure and lexeme tables..."
+            attach_structure(_tf_api, build_structure(_tf_api))
+            F = _tf_api.api.F
+            word_features(F).preload(F.otype.s("word"))
+            _index = _open_index(settings.bhsa_index_path, settings.gcs_bucket_name)
+
+        _passage_cache.clear()
         _is_loaded = True
         _message = "BHSA Data Ready"
     except Exception as exc:
@@ -64,69 +92,144 @@ def load(*, settings: Settings | None = None, force: bool = False) -> None:
         _is_loading = False
 
 
-def _download_from_gcs(bucket_name: str) -> None:
+def _load_text_fabric(settings: Settings) -> Any:
+    from tf.app import use
+
     global _message
 
+    bucket = settings.gcs_bucket_name
+    if bucket:
+        _download_from_gcs(bucket, settings.bhsa_download_workers)
+
+    data_path = settings.bhsa_data_path
+    if data_path:
+        _message = f"Loading Text-Fabric from {data_path}..."
+        return use(data_path, silent=False)
+    _message = "Loading Text-Fabric (ETCBC/bhsa)..."
+    return use("ETCBC/bhsa", silent=False)
+
+
+def _download_from_gcs(bucket_name: str, workers: int) -> None:
+    global _message, _download_progress
+
     try:
-        from google.cloud import storage
+        bucket = gcs.get_bucket(bucket_name)
     except ImportError:
         logger.warning("google-cloud-storage not installed, skipping GCS")
         return
 
     tf_data_dir = Path(os.path.expanduser("~/text-fabric-data"))
-    github_dir = tf_data_dir / "github"
+    _message = f"Checking BHSA data against GCS manifest ({bucket_name})..."
+    _download_progress = DownloadProgress()
 
-    if github_dir.exists():
-        logger.info("Local BHSA data found at %s, skipping download", github_dir)
+    try:
+        count = sync_prefix(
+            bucket,
+            _GCS_PREFIX,
+            tf_data_dir,
+            workers=workers,
+            progress=_download_progress,
+        )
+    except Exception:
+        if not (tf_data_dir / "github").exists():
+            raise
+        logger.exception("GCS sync failed, falling back to local BHSA data at %s", tf_data_dir)
         return
 
-    _message = f"Downloading from GCS ({bucket_name})..."
-    tf_data_dir.mkdir(parents=True, exist_ok=True)
-
-    client = storage.Client()
-    bucket = client.bucket(bucket_name)
-    blobs = list(bucket.list_blobs(prefix="text-fabric-data/"))
-
-    count = 0
-    for blob in blobs:
-        rel_path = blob.name.replace("text-fabric-data/", "", 1)
-        if not rel_path or rel_path.endswith("/"):
-            continue
-        dest = tf_data_dir / rel_path
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        blob.download_to_filename(str(dest))
-        count += 1
-        if count % 50 == 0:
-            _message = f"Downloading: {count}/{len(blobs)} files..."
-
     logger.info("Downloaded %d files from GCS", count)
     _message = "GCS download complete, initializing TF..."
 
 
-def fetch_passage(ref: str) -> dict[str, Any]:
-    if not _is_loaded or _tf_api is None:
+def _download_index_from_gcs(bucket_name: str, index_path: Path) -> None:
+    global _message
+
+    try:
+        bucket = gcs.get_bucket(bucket_name)
+    except ImportError:
+        logger.warning("google-cloud-storage not installed, skipping GCS")
+        return
+
+    blob_name = f"bhsa/{index_path.name}"
+    _message = f"Downloading BHSA clause index from GCS ({bucket_name}/{blob_name})..."
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+
+    blob = bucket.get_blob(blob_name)
+    if blob is None:
+        logger.warning("BHSA clause index not found in GCS at %s", blob_name)
+        return
+    with tempfile.NamedTemporaryFile(
+        dir=index_path.parent, prefix=f"{index_path.name}.", suffix=".part", delete=False
+    ) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        blob.download_to_filename(str(tmp_path))
+        tmp_path.replace(index_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    logger.info("Downloaded BHSA clause index to %s", index_path)
+
+
+def fetch_index(index_path: str, bucket_name: str = "") -> Path | None:
+    if not index_path:
+        return None
+    path = Path(index_path)
+    with _index_fetch_lock:
+        if not path.is_file() and bucket_name:
+            _download_index_from_gcs(bucket_name, path)
+    return path if path.is_file() else None
+
+
+def _open_index(index_path: str, bucket_name: str = "") -> ClauseIndex | None:
+    global _message
+
+    path = fetch_index(index_path, bucket_name)
+    if path is None:
+        if index_path:
+            logger.warning("BHSA clause index not found at %s, using Text-Fabric", index_path)
+        return None
+
+    _message = f"Mapping BHSA clause index from {index_path}..."
+    return open_index(path)
+
+
+def get_clause_source() -> Any:
+    if not _is_loaded or (_index is None and _tf_api is None):
         raise RuntimeError("BHSA not loaded — call /api/bhsa/load first")
-    return extract_passage(_tf_api, ref)
+    return _index if _index is not None else _tf_api
 
 
-def get_verse_counts(book: str) -> dict[int, int]:
+def fetch_passage(ref: str) -> dict[str, Any]:
+    return _passage_cache.fetch(get_clause_source(), ref)
+
+
+async def afetch_passage(ref: str) -> dict[str, Any]:
+    from app.services.bhsa import worker_pool
+
+    if worker_pool.is_running():
+        return await worker_pool.fetch_passage(ref)
+    return await asyncio.to_thread(fetch_passage, ref)
+
 
-    if not _is_loaded or _tf_api is None:
+def fetch_passages(refs: list[str]) -> Iterator[tuple[str, dict[str, Any] | None, str | None]]:
+    return _passage_cache.fetch_many(get_clause_source(), refs)
+
+
+def get_cache_stats() -> PassageCacheStats:
+    return _passage_cache.stats()
+
+
+def get_book_structure(book: str) -> dict[int, ChapterStructure]:
+    if not _is_loaded:
         raise RuntimeError("BHSA not loaded — call /api/bhsa/load first")
+    structure = structure_for(_tf_api) if _tf_api is not None else None
+    if structure is None:
+        raise RuntimeError("BHSA book structure is not available in index-only mode")
+    return structure.get(normalize_book_name(book), {})
 
-    from app.services.bhsa.reference import normalize_book_name
 
+def get_verse_counts(book: str) -> dict[int, int]:
+    source = get_clause_source()
     bhsa_book = normalize_book_name(book)
-    T = _tf_api.api.T
-    L = _tf_api.api.L
-    F = _tf_api.api.F
-
-    counts: dict[int, int] = {}
-    for node in F.otype.s("book"):
-        if T.sectionFromNode(node)[0] == bhsa_book:
-            for ch_node in L.d(node, otype="chapter"):
-                ch_num = T.sectionFromNode(ch_node)[1]
-                verse_count = len(L.d(ch_node, otype="verse"))
-                counts[ch_num] = verse_count
-            break
-    return counts
+    if isinstance(source, ClauseIndex):
+        return source.verse_counts(bhsa_book)
+    return {ch: c.verse_count for ch, c in get_book_structure(bhsa_book).items()}
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from typing import Any
 
-from app.services.bhsa.clause import extract_clause
-from app.services.bhsa.reference import parse_reference
+from app.services.bhsa.clause import extract_clause, strip_positional
+from app.services.bhsa.reference import format_reference, parse_reference
+from app.services.bhsa.structure import chapter_structure
 from app.services.book_context.generation.types import ClauseExtract
 
 _CLAUSE_OTYPE = "clause"
@@ -14,6 +15,16 @@ def extract_passage(tf_api: Any, ref: str) -> dict[str, Any]:
     return _extract_verses(tf_api, book, chapter, start_verse, end_verse)
 
 
+def _verse_node(tf_api: Any, book: str, chapter: int, verse: int) -> Any:
+    structure = chapter_structure(tf_api, book, chapter)
+    if structure is not None:
+        return structure.verse_node(verse)
+    try:
+        return tf_api.api.T.nodeFromSection((book, chapter, verse))
+    except Exception:
+        return None
+
+
 def _extract_verses(
     tf_api: Any,
     book: str,
@@ -31,11 +42,10 @@ def _extract_verses(
     actual_end = start_verse
 
     for verse_num in range(start_verse, end_verse + 1):
-        try:
-            verse_node = T.nodeFromSection((book, chapter, verse_num))
-        except Exception:
+        verse_node = _verse_node(tf_api, book, chapter, verse_num)
+        if verse_node is None:
             if verse_num == start_verse:
-                raise ValueError(f"Could not find {book} {chapter}:{verse_num}") from None
+                raise ValueError(f"Could not find {book} {chapter}:{verse_num}")
             break
 
         actual_end = verse_num
@@ -45,13 +55,28 @@ def _extract_verses(
             clause_id += 1
             prev_type = data["clause_type"]
 
-    if start_verse == actual_end:
-        ref_str = f"{book} {chapter}:{start_verse}"
-    else:
-        ref_str = f"{book} {chapter}:{start_verse}-{actual_end}"
-
     return {
-        "reference": ref_str,
+        "reference": format_reference(book, chapter, start_verse, actual_end),
         "source_lang": "hbo",
         "clauses": clauses,
     }
+
+
+def extract_verse_records(
+    tf_api: Any,
+    book: str,
+    chapter: int,
+    verse: int,
+) -> list[dict[str, Any]] | None:
+    F = tf_api.api.F
+    L = tf_api.api.L
+    T = tf_api.api.T
+
+    verse_node = _verse_node(tf_api, book, chapter, verse)
+    if verse_node is None:
+        return None
+
+    return [
+        strip_positional(extract_clause(clause_node, verse, 0, None, F, L, T))
+        for clause_node in L.d(verse_node, otype=_CLAUSE_OTYPE)
+    ]
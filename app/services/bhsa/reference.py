@@ -133,3 +133,9 @@ def parse_reference(ref: str) -> tuple[str, int, int, int]:
         return book, chapter, verse, verse
 
     raise ValueError(f"Could not parse reference: {ref}")
+
+
+def format_reference(book: str, chapter: int, start_verse: int, end_verse: int) -> str:
+    if start_verse == end_verse:
+        return f"{book} {chapter}:{start_verse}"
+    return f"{book} {chapter}:{start_verse}-{end_verse}"
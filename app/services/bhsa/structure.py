@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ChapterStructure:
+    verse_nodes: tuple[int, ...]
+
+    @property
+    def first_verse_node(self) -> int | None:
+        return self.verse_nodes[0] if self.verse_nodes else None
+
+    @property
+    def verse_count(self) -> int:
+        return len(self.verse_nodes)
+
+    def verse_node(self, verse: int) -> int | None:
+        if 1 <= verse <= len(self.verse_nodes):
+            return self.verse_nodes[verse - 1]
+        return None
+
+
+CorpusStructure = dict[str, dict[int, ChapterStructure]]
+
+_MISSING_CHAPTER = ChapterStructure(verse_nodes=())
+
+_current: tuple[Any, CorpusStructure] | None = None
+
+
+def build_structure(tf_api: Any) -> CorpusStructure:
+    F = tf_api.api.F
+    L = tf_api.api.L
+    T = tf_api.api.T
+
+    structure: CorpusStructure = {}
+    for book_node in F.otype.s("book"):
+        chapters: dict[int, ChapterStructure] = {}
+        for ch_node in L.d(book_node, otype="chapter"):
+            chapters[T.sectionFromNode(ch_node)[1]] = ChapterStructure(
+                verse_nodes=tuple(L.d(ch_node, otype="verse"))
+            )
+        structure[T.sectionFromNode(book_node)[0]] = chapters
+    return structure
+
+
+def attach_structure(tf_api: Any, structure: CorpusStructure) -> None:
+    global _current
+    _current = (tf_api, structure)
+
+
+def structure_for(tf_api: Any) -> CorpusStructure | None:
+    current = _current
+    if current is not None and current[0] is tf_api:
+        return current[1]
+    return None
+
+
+def chapter_structure(tf_api: Any, book: str, chapter: int) -> ChapterStructure | None:
+    structure = structure_for(tf_api)
+    if structure is None:
+        return None
+    return structure.get(book, {}).get(chapter, _MISSING_CHAPTER)
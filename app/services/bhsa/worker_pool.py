@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from app.core.config import Settings, get_settings
+from app.services.bhsa import loader
+from app.services.book_context.generation.bhsa_collection import collect_bhsa_data
+from app.services.book_context.generation.types import CollectBHSAOutput
+
+logger = logging.getLogger(__name__)
+
+_pool: ProcessPoolExecutor | None = None
+_settings: Settings | None = None
+_ready = threading.Event()
+_stopped = threading.Event()
+_rebuilt = False
+_lock = threading.Lock()
+
+
+def _init_worker(full_corpus: bool) -> None:
+    settings = get_settings()
+    if not full_corpus:
+        settings = settings.model_copy(update={"bhsa_index_only": True})
+    loader.load(settings=settings)
+
+
+def _ping() -> bool:
+    return loader.get_status().is_loaded
+
+
+def _fetch_passage_job(ref: str) -> dict[str, Any]:
+    return loader.fetch_passage(ref)
+
+
+def _collect_bhsa_job(book_name: str, chapter_count: int) -> CollectBHSAOutput:
+    return collect_bhsa_data(loader.get_clause_source(), book_name, chapter_count)
+
+
+def is_running() -> bool:
+    return _pool is not None and _ready.is_set()
+
+
+def start(settings: Settings | None = None) -> None:
+    global _settings, _rebuilt
+
+    settings = settings or get_settings()
+    workers = settings.bhsa_worker_processes
+    if _pool is not None or workers <= 0:
+        return
+    if not settings.bhsa_worker_full_corpus and not settings.bhsa_index_path:
+        logger.warning(
+            "BHSA_WORKER_PROCESSES is set but workers load only the clause index; "
+            "set BHSA_INDEX_PATH or BHSA_WORKER_FULL_CORPUS=true. Extraction stays in-process."
+        )
+        return
+
+    _settings = settings
+    _rebuilt = False
+    _stopped.clear()
+    threading.Thread(target=_fetch_index_and_open, args=(settings,), daemon=True).start()
+    logger.info("Starting BHSA extraction pool with %d worker processes", workers)
+
+
+def shutdown() -> None:
+    global _pool
+
+    with _lock:
+        _stopped.set()
+        _ready.clear()
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _fetch_index_and_open(settings: Settings) -> None:
+    # Workers would each download a missing index on their own, so fetch it once here.
+    index = loader.fetch_index(settings.bhsa_index_path, settings.gcs_bucket_name)
+    if index is None and not settings.bhsa_worker_full_corpus:
+        logger.error(
+            "BHSA clause index is not available at %s; extraction stays in-process",
+            settings.bhsa_index_path,
+        )
+        return
+    with _lock:
+        if _pool is None and not _stopped.is_set():
+            _open_pool(settings)
+
+
+def _open_pool(settings: Settings) -> None:
+    global _pool
+
+    workers = settings.bhsa_worker_processes
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(settings.bhsa_worker_full_corpus,),
+    )
+    _ready.clear()
+    _pool = pool
+    pings = [pool.submit(_ping) for _ in range(workers)]
+    threading.Thread(target=_await_ready, args=(pool, pings), daemon=True).start()
+
+
+def _await_ready(pool: ProcessPoolExecutor, pings: list[Future[bool]]) -> None:
+    wait(pings)
+    loaded = all(
+        not ping.cancelled() and ping.exception() is None and ping.result() for ping in pings
+    )
+    with _lock:
+        if _pool is not pool:
+            return
+        if loaded:
+            _ready.set()
+            logger.info("BHSA extraction pool is ready")
+        else:
+            logger.error("BHSA worker processes failed to load; extraction stays in-process")
+            _discard(pool)
+
+
+def _discard(pool: ProcessPoolExecutor) -> None:
+    global _pool
+
+    pool.shutdown(wait=False, cancel_futures=True)
+    if _pool is pool:
+        _pool = None
+        _ready.clear()
+
+
+def _recover(pool: ProcessPoolExecutor) -> None:
+    global _rebuilt
+
+    with _lock:
+        if _pool is not pool:
+            return
+        _discard(pool)
+        if _rebuilt or _settings is None:
+            logger.error("BHSA worker pool broke again; extraction stays in-process")
+            return
+        _rebuilt = True
+        logger.warning("BHSA worker pool broke; rebuilding it")
+        _open_pool(_settings)
+
+
+async def _submit(timeout: float, fn: Any, *args: Any) -> Any:
+    pool = _pool
+    if pool is None:
+        raise RuntimeError("BHSA worker pool is not running")
+    try:
+        future = asyncio.wrap_future(pool.submit(fn, *args))
+        return await asyncio.wait_for(future, timeout=timeout)
+    except BrokenProcessPool:
+        _recover(pool)
+    return await asyncio.wait_for(asyncio.to_thread(fn, *args), timeout=timeout)
+
+
+async def fetch_passage(ref: str) -> dict[str, Any]:
+    settings = _settings or get_settings()
+    result: dict[str, Any] = await _submit(
+        settings.bhsa_passage_timeout_seconds, _fetch_passage_job, ref
+    )
+    return result
+
+
+async def collect_bhsa(book_name: str, chapter_count: int) -> CollectBHSAOutput:
+    settings = _settings or get_settings()
+    result: CollectBHSAOutput = await _submit(
+        settings.bhsa_collect_timeout_seconds, _collect_bhsa_job, book_name, chapter_count
+    )
+    return result
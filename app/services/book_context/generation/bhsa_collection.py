@@ -4,7 +4,10 @@ from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any
 
-from app.services.book_context.generation.bhsa_stream import stream_book_clauses
+from app.services.book_context.generation.bhsa_stream import (
+    astream_book_clauses,
+    stream_book_clauses,
+)
 from app.services.book_context.generation.types import (
     BHSAEntity,
     BHSAEntryRef,
@@ -42,7 +45,7 @@ def _classify_nametype(nametype: str) -> str:
 
 
 @dataclass
-class _SummaryAcc:
+class SummaryAcc:
     lines: list[str] = field(default_factory=list)
     current_ch: int | None = None
     clause_count: int = 0
@@ -51,7 +54,7 @@ class _SummaryAcc:
     verse_summaries: dict[int, list[str]] = field(default_factory=dict)
 
 
-def _summary_flush_chapter(acc: _SummaryAcc) -> None:
+def _summary_flush_chapter(acc: SummaryAcc) -> None:
     if acc.current_ch is None:
         return
     acc.lines.append(f"\n=== Chapter {acc.current_ch} ({acc.clause_count} clauses) ===")
@@ -64,7 +67,7 @@ def _summary_flush_chapter(acc: _SummaryAcc) -> None:
         acc.lines.append(f"  v{v}: {combined[:200]}")
 
 
-def summary_start_chapter(acc: _SummaryAcc, ch: int) -> None:
+def summary_start_chapter(acc: SummaryAcc, ch: int) -> None:
     _summary_flush_chapter(acc)
     acc.current_ch = ch
     acc.clause_count = 0
@@ -73,7 +76,7 @@ def summary_start_chapter(acc: _SummaryAcc, ch: int) -> None:
     acc.verse_summaries = {}
 
 
-def summary_consume(acc: _SummaryAcc, ch: int, clause: ClauseExtract) -> None:
+def summary_consume(acc: SummaryAcc, ch: int, clause: ClauseExtract) -> None:
     acc.clause_count += 1
     v = clause["verse"]
     if v not in acc.verse_summaries:
@@ -89,13 +92,13 @@ def summary_consume(acc: _SummaryAcc, ch: int, clause: ClauseExtract) -> None:
         )
 
 
-def summary_build(acc: _SummaryAcc) -> str:
+def summary_build(acc: SummaryAcc) -> str:
     _summary_flush_chapter(acc)
     return "\n".join(acc.lines)
 
 
 @dataclass
-class _EntitiesAcc:
+class EntitiesAcc:
     appearances: dict[str, list[BHSAEntryRef]] = field(default_factory=dict)
     first: dict[str, BHSAEntryRef] = field(default_factory=dict)
     last: dict[str, BHSAEntryRef] = field(default_factory=dict)
@@ -103,7 +106,7 @@ class _EntitiesAcc:
     types: dict[str, str] = field(default_factory=dict)
 
 
-def entities_consume(acc: _EntitiesAcc, ch: int, clause: ClauseExtract) -> None:
+def entities_consume(acc: EntitiesAcc, ch: int, clause: ClauseExtract) -> None:
     v = clause["verse"]
     ref: BHSAEntryRef = {"chapter": ch, "verse": v}
 
@@ -124,7 +127,7 @@ def entities_consume(acc: _EntitiesAcc, ch: int, clause: ClauseExtract) -> None:
             acc.types[heb_name] = nt
 
 
-def entities_build(acc: _EntitiesAcc) -> list[BHSAEntity]:
+def entities_build(acc: EntitiesAcc) -> list[BHSAEntity]:
     entities: list[BHSAEntity] = []
     for name in sorted(acc.appearances.keys()):
         raw_nametype = acc.types.get(name, "")
@@ -146,12 +149,12 @@ def entities_build(acc: _EntitiesAcc) -> list[BHSAEntity]:
 
 
 @dataclass
-class _CommonNounsAcc:
+class CommonNounsAcc:
     min_appearances: int = _MIN_APPEARANCES
     aggregates: dict[tuple[str, str], dict[str, Any]] = field(default_factory=dict)
 
 
-def common_nouns_consume(acc: _CommonNounsAcc, ch: int, clause: ClauseExtract) -> None:
+def common_nouns_consume(acc: CommonNounsAcc, ch: int, clause: ClauseExtract) -> None:
     v = clause["verse"]
     ref: BHSAEntryRef = {"chapter": ch, "verse": v}
     for cw in clause.get("content_words", []):
@@ -189,7 +192,7 @@ def common_nouns_consume(acc: _CommonNounsAcc, ch: int, clause: ClauseExtract) -
             bucket["binyan_counter"][binyan] += 1
 
 
-def common_nouns_build(acc: _CommonNounsAcc) -> list[CommonNounCandidate]:
+def common_nouns_build(acc: CommonNounsAcc) -> list[CommonNounCandidate]:
     candidates: list[CommonNounCandidate] = []
     for bucket in acc.aggregates.values():
         appearance_count = len(bucket["appears_in"])
@@ -220,21 +223,47 @@ def common_nouns_build(acc: _CommonNounsAcc) -> list[CommonNounCandidate]:
     return candidates[:_TOP_N]
 
 
-def collect_bhsa_data(tf_api: Any, book_name: str, chapter_count: int) -> CollectBHSAOutput:
-    summary = _SummaryAcc()
-    entities = _EntitiesAcc()
-    common = _CommonNounsAcc(min_appearances=_min_appearances_for(chapter_count))
+def _collect_chapter(
+    summary: SummaryAcc,
+    entities: EntitiesAcc,
+    common: CommonNounsAcc,
+    chapter_data: dict[str, Any],
+) -> None:
+    ch = chapter_data["chapter"]
+    summary_start_chapter(summary, ch)
+    for clause in chapter_data["clauses"]:
+        summary_consume(summary, ch, clause)
+        entities_consume(entities, ch, clause)
+        common_nouns_consume(common, ch, clause)
 
-    for chapter_data in stream_book_clauses(tf_api, book_name, chapter_count):
-        ch = chapter_data["chapter"]
-        summary_start_chapter(summary, ch)
-        for clause in chapter_data["clauses"]:
-            summary_consume(summary, ch, clause)
-            entities_consume(entities, ch, clause)
-            common_nouns_consume(common, ch, clause)
 
+def _collect_output(
+    summary: SummaryAcc, entities: EntitiesAcc, common: CommonNounsAcc
+) -> CollectBHSAOutput:
     return CollectBHSAOutput(
         bhsa_summary=summary_build(summary),
         bhsa_entities=entities_build(entities),
         bhsa_common_nouns=common_nouns_build(common),
     )
+
+
+def collect_bhsa_data(tf_api: Any, book_name: str, chapter_count: int) -> CollectBHSAOutput:
+    summary = SummaryAcc()
+    entities = EntitiesAcc()
+    common = CommonNounsAcc(min_appearances=_min_appearances_for(chapter_count))
+
+    for chapter_data in stream_book_clauses(tf_api, book_name, chapter_count):
+        _collect_chapter(summary, entities, common, chapter_data)
+
+    return _collect_output(summary, entities, common)
+
+
+async def acollect_bhsa_data(tf_api: Any, book_name: str, chapter_count: int) -> CollectBHSAOutput:
+    summary = SummaryAcc()
+    entities = EntitiesAcc()
+    common = CommonNounsAcc(min_appearances=_min_appearances_for(chapter_count))
+
+    async for chapter_data in astream_book_clauses(tf_api, book_name, chapter_count):
+        _collect_chapter(summary, entities, common, chapter_data)
+
+    return _collect_output(summary, entities, common)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from app.services.book_context.generation.bhsa_collection import (
-    _CommonNounsAcc,
+    CommonNounsAcc,
     _min_appearances_for,
     common_nouns_build,
     common_nouns_consume,
@@ -17,7 +17,7 @@ __all__ = ["extract_common_noun_candidates"]
 def extract_common_noun_candidates(
     tf_api: Any, book_name: str, chapter_count: int
 ) -> dict[str, list[CommonNounCandidate]]:
-    acc = _CommonNounsAcc(min_appearances=_min_appearances_for(chapter_count))
+    acc = CommonNounsAcc(min_appearances=_min_appearances_for(chapter_count))
     for chapter_data in stream_book_clauses(tf_api, book_name, chapter_count):
         ch = chapter_data["chapter"]
         for clause in chapter_data["clauses"]:
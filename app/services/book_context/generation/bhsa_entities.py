@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from app.services.book_context.generation.bhsa_collection import (
-    _EntitiesAcc,
+    EntitiesAcc,
     entities_build,
     entities_consume,
 )
@@ -14,7 +14,7 @@ from app.services.book_context.generation.types import BHSAEntity
 def extract_bhsa_entities(
     tf_api: Any, book_name: str, chapter_count: int
 ) -> dict[str, list[BHSAEntity]]:
-    acc = _EntitiesAcc()
+    acc = EntitiesAcc()
     for chapter_data in stream_book_clauses(tf_api, book_name, chapter_count):
         ch = chapter_data["chapter"]
         for clause in chapter_data["clauses"]:
@@ -1,17 +1,28 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Generator
 from typing import Any
 
 from app.services.bhsa.clause import extract_clause
+from app.services.bhsa.index import ClauseIndex
+from app.services.bhsa.structure import chapter_structure
 from app.services.book_context.generation.types import ClauseExtract
 
+_MAX_BUFFERED_CHAPTERS = 2
+_DONE = object()
+
 
 def stream_book_clauses(
     tf_api: Any,
     book_name: str,
     chapter_count: int,
 ) -> Generator[dict[str, Any], None, None]:
+    if isinstance(tf_api, ClauseIndex):
+        yield from tf_api.stream_book(book_name, chapter_count)
+        return
+
     T = tf_api.api.T
     F = tf_api.api.F
     L = tf_api.api.L
@@ -21,25 +32,76 @@ def stream_book_clauses(
         clause_id = 1
         prev_type: str | None = None
 
-        verse_num = 1
-        while True:
-            try:
-                verse_node = T.nodeFromSection((book_name, chapter, verse_num))
-            except (KeyError, ValueError, TypeError):
-                break
-            if verse_node is None:
-                break
-
+        verse_nodes = _chapter_verse_nodes(tf_api, book_name, chapter)
+        for verse_num, verse_node in enumerate(verse_nodes, start=1):
             for clause_node in L.d(verse_node, otype="clause"):
                 data = extract_clause(clause_node, verse_num, clause_id, prev_type, F, L, T)
                 clauses.append(data)
                 clause_id += 1
                 prev_type = data["clause_type"]
 
-            verse_num += 1
-
         yield {
             "chapter": chapter,
-            "verse_count": verse_num - 1,
+            "verse_count": len(verse_nodes),
             "clauses": clauses,
         }
+
+
+def _chapter_verse_nodes(tf_api: Any, book_name: str, chapter: int) -> tuple[Any, ...]:
+    structure = chapter_structure(tf_api, book_name, chapter)
+    if structure is not None:
+        return structure.verse_nodes
+
+    T = tf_api.api.T
+    verse_nodes: list[Any] = []
+    while True:
+        try:
+            verse_node = T.nodeFromSection((book_name, chapter, len(verse_nodes) + 1))
+        except (KeyError, ValueError, TypeError):
+            break
+        if verse_node is None:
+            break
+        verse_nodes.append(verse_node)
+    return tuple(verse_nodes)
+
+
+async def astream_book_clauses(
+    tf_api: Any,
+    book_name: str,
+    chapter_count: int,
+    *,
+    max_buffered_chapters: int = _MAX_BUFFERED_CHAPTERS,
+) -> AsyncIterator[dict[str, Any]]:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=max(max_buffered_chapters, 1))
+    stop = threading.Event()
+
+    def _put(item: Any) -> None:
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    def _produce() -> None:
+        result: Any = _DONE
+        try:
+            for chapter_data in stream_book_clauses(tf_api, book_name, chapter_count):
+                if stop.is_set():
+                    return
+                _put(chapter_data)
+        except Exception as exc:
+            result = exc
+        if not stop.is_set():
+            _put(result)
+
+    producer = loop.run_in_executor(None, _produce)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        while not queue.empty():
+            queue.get_nowait()
+        await producer
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from app.services.book_context.generation.bhsa_collection import (
-    _SummaryAcc,
+    SummaryAcc,
     summary_build,
     summary_consume,
     summary_start_chapter,
@@ -12,7 +12,7 @@ from app.services.book_context.generation.bhsa_stream import stream_book_clauses
 
 
 def build_bhsa_summary(tf_api: Any, book_name: str, chapter_count: int) -> str:
-    acc = _SummaryAcc()
+    acc = SummaryAcc()
     for chapter_data in stream_book_clauses(tf_api, book_name, chapter_count):
         ch = chapter_data["chapter"]
         summary_start_chapter(acc, ch)
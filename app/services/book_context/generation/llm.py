@@ -1,18 +1,18 @@
 from __future__ import annotations
 
-import asyncio
-import logging
 from typing import Any
 
+from langchain_core.exceptions import OutputParserException
 from langchain_google_genai import ChatGoogleGenerativeAI
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from app.core.config import Settings, get_settings
+from app.services.common.retry import is_transient, with_retries
 
-logger = logging.getLogger(__name__)
 
-MAX_RETRIES = 3
-RETRY_BASE_DELAY = 2
+def _retryable(exc: Exception) -> bool:
+    # A malformed structured answer may parse on the next sample.
+    return is_transient(exc) or isinstance(exc, OutputParserException | ValidationError)
 
 
 async def call_llm(
@@ -29,28 +29,11 @@ async def call_llm(
         max_output_tokens=65536,
     )
 
-    last_exc: Exception | None = None
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            if output_schema:
-                structured = llm.with_structured_output(output_schema)
-                return await structured.ainvoke(prompt)
-            result = await llm.ainvoke(prompt)
-            return result.content
-        except Exception as exc:
-            last_exc = exc
-            if attempt < MAX_RETRIES:
-                delay = RETRY_BASE_DELAY**attempt
-                logger.warning(
-                    "LLM call attempt %d/%d failed (%s), retrying in %ds...",
-                    attempt,
-                    MAX_RETRIES,
-                    exc,
-                    delay,
-                )
-                await asyncio.sleep(delay)
-            else:
-                logger.error("LLM call failed after %d attempts: %s", MAX_RETRIES, exc)
-
-    assert last_exc is not None
-    raise last_exc
+    async def _invoke() -> Any:
+        if output_schema:
+            structured = llm.with_structured_output(output_schema)
+            return await structured.ainvoke(prompt)
+        result = await llm.ainvoke(prompt)
+        return result.content
+
+    return await with_retries("LLM call", _invoke, retry_if=_retryable)
@@ -4,20 +4,24 @@ from dataclasses import asdict
 from typing import Any
 
 from app.services.bhsa import loader as bhsa_loader
+from app.services.bhsa import worker_pool as bhsa_worker_pool
 from app.services.bhsa.reference import normalize_book_name
-from app.services.book_context.generation.bhsa_collection import collect_bhsa_data
+from app.services.book_context.generation.bhsa_collection import acollect_bhsa_data
 from app.services.book_context.generation.state import BCDGenerationState
 
 
-def collect_bhsa(state: BCDGenerationState) -> dict[str, Any]:
+async def collect_bhsa(state: BCDGenerationState) -> dict[str, Any]:
     if not bhsa_loader.get_status().is_loaded:
         raise RuntimeError("BHSA data is not loaded. Cannot generate Book Context.")
 
-    tf_api = bhsa_loader._tf_api
     book_name = normalize_book_name(state["book_name"])
     chapter_count = state["chapter_count"]
 
-    result = collect_bhsa_data(tf_api, book_name, chapter_count)
+    if bhsa_worker_pool.is_running():
+        result = await bhsa_worker_pool.collect_bhsa(book_name, chapter_count)
+    else:
+        tf_api = bhsa_loader.get_clause_source()
+        result = await acollect_bhsa_data(tf_api, book_name, chapter_count)
 
     if not result.bhsa_summary.strip():
         raise RuntimeError(
@@ -58,25 +58,22 @@ async def run_bcd_generation(
         state["user_feedback"] = user_feedback
 
     steps = [
-        (1, "collect_bhsa", collect_bhsa, False),
-        (2, "structural_outline", generate_structural_outline, True),
-        (3, "participants", generate_participants, True),
-        (4, "discourse", generate_discourse_threads, True),
-        (5, "context_sections", generate_context_sections, True),
+        (1, "collect_bhsa", collect_bhsa),
+        (2, "structural_outline", generate_structural_outline),
+        (3, "participants", generate_participants),
+        (4, "discourse", generate_discourse_threads),
+        (5, "context_sections", generate_context_sections),
     ]
 
     batch_aware = {"participants", "context_sections"}
 
     try:
-        for order, step_name, node_fn, is_async in steps:
+        for order, step_name, node_fn in steps:
             async with track_step(db, bcd_id, step_name, order, input_summary=step_name) as log:
-                if is_async:
-                    if step_name in batch_aware:
-                        result = await node_fn(state, db=db, log=log)  # type: ignore[operator,misc]
-                    else:
-                        result = await node_fn(state)  # type: ignore[operator,misc]
+                if step_name in batch_aware:
+                    result = await node_fn(state, db=db, log=log)  # type: ignore[operator,misc]
                 else:
-                    result = node_fn(state)  # type: ignore[operator]
+                    result = await node_fn(state)  # type: ignore[operator,misc]
                 state.update(result)  # type: ignore[typeddict-item]
                 log.output_summary = f"Completed {step_name}"
     except Exception as exc:
@@ -1,3 +1,4 @@
 from app.services.common.get_or_raise import get_or_raise
+from app.services.common.retry import is_transient, with_retries
 
-__all__ = ["get_or_raise"]
+__all__ = ["get_or_raise", "is_transient", "with_retries"]
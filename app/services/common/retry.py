@@ -0,0 +1,65 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import httpx
+from qdrant_client.http.exceptions import ResponseHandlingException
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 2
+
+T = TypeVar("T")
+
+
+def _status_code(exc: BaseException) -> int | None:
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Timeouts, connection failures, and 408/429/5xx responses."""
+    if isinstance(
+        exc, TimeoutError | ConnectionError | httpx.TransportError | ResponseHandlingException
+    ):
+        return True
+    status = _status_code(exc)
+    return status is not None and (status in (408, 429) or status >= 500)
+
+
+async def with_retries(
+    label: str,
+    call: Callable[[], Awaitable[T]],
+    *,
+    retry_if: Callable[[Exception], bool] = is_transient,
+) -> T:
+    """Await call(), retrying errors that pass retry_if with exponential backoff."""
+    last_exc: Exception | None = None
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            return await call()
+        except Exception as exc:
+            if not retry_if(exc):
+                raise
+            last_exc = exc
+            if attempt < MAX_RETRIES:
+                delay = RETRY_BASE_DELAY**attempt
+                logger.warning(
+                    "%s attempt %d/%d failed (%s), retrying in %ds...",
+                    label,
+                    attempt,
+                    MAX_RETRIES,
+                    exc,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+            else:
+                logger.error("%s failed after %d attempts: %s", label, MAX_RETRIES, exc)
+
+    assert last_exc is not None
+    raise last_exc
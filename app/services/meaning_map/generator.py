@@ -5,6 +5,7 @@ from typing import Any
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from qdrant_client import AsyncQdrantClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings, get_settings
 from app.models.meaning_map import ProseMeaningMap
@@ -220,6 +221,7 @@ def _build_generation_prompt(
 
 
 async def generate_meaning_map(
+    db: AsyncSession,
     reference: str,
     *,
     settings: Settings | None = None,
@@ -232,7 +234,7 @@ async def generate_meaning_map(
         raise GenerationError("BHSA data is not loaded. Contact an administrator.")
 
     try:
-        bhsa_data = bhsa_loader.fetch_passage(reference)
+        bhsa_data = await bhsa_loader.afetch_passage(reference)
     except Exception as e:
         raise GenerationError(f"BHSA extraction failed for {reference}: {e}") from e
 
@@ -244,10 +246,12 @@ async def generate_meaning_map(
 
     try:
         rag_result = await rag_query(
+            db,
             qdrant_client,
             RagNamespace.MEANING_MAP_DOCS,
             f"How to create a Bible Meaning Map for {reference}",
             settings=settings,
+            use_cache=True,
         )
     except Exception as e:
         raise GenerationError(f"RAG query failed for {reference}: {e}") from e
@@ -1,2 +1,4 @@
 GCS_OC_BUCKET = "tripod-image-uploads"
 GCS_OC_PROJECT = "gen-lang-client-0886209230"
+
+SPLIT_UPLOAD_CONCURRENCY = 4
@@ -1,27 +1,35 @@
+from pathlib import Path
+
 from app.services.oral_collector.constants import GCS_OC_BUCKET, GCS_OC_PROJECT
+from app.services.storage import gcs
 
 GCS_PUBLIC_BASE = f"https://storage.googleapis.com/{GCS_OC_BUCKET}/"
 
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 async def upload_gcs_blob(blob_name: str, data: bytes, content_type: str) -> str:
     """Upload data to GCS and return the public URL."""
-    from google.cloud import storage
+    await gcs.upload_bytes(GCS_OC_BUCKET, blob_name, data, content_type, project=GCS_OC_PROJECT)
+    return f"{GCS_PUBLIC_BASE}{blob_name}"
 
-    client = storage.Client(project=GCS_OC_PROJECT)
-    bucket = client.bucket(GCS_OC_BUCKET)
-    blob = bucket.blob(blob_name)
-    blob.upload_from_string(data, content_type=content_type)
+
+async def upload_gcs_file(blob_name: str, path: Path, content_type: str) -> str:
+    """Upload a local file to GCS in resumable chunks and return the public URL."""
+    await gcs.upload_file(
+        GCS_OC_BUCKET,
+        blob_name,
+        path,
+        content_type,
+        chunk_size=UPLOAD_CHUNK_SIZE,
+        project=GCS_OC_PROJECT,
+    )
     return f"{GCS_PUBLIC_BASE}{blob_name}"
 
 
 async def copy_gcs_blob(source_name: str, dest_name: str) -> None:
     """Copy a blob within the OC bucket."""
-    from google.cloud import storage
-
-    client = storage.Client(project=GCS_OC_PROJECT)
-    bucket = client.bucket(GCS_OC_BUCKET)
-    source_blob = bucket.blob(source_name)
-    bucket.copy_blob(source_blob, bucket, dest_name)
+    await gcs.copy_blob(GCS_OC_BUCKET, source_name, dest_name, project=GCS_OC_PROJECT)
 
 
 def blob_name_from_url(gcs_url: str) -> str | None:
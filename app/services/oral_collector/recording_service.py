@@ -35,24 +35,15 @@ from app.models.oc_recording import (
 )
 from app.services.oral_collector.constants import GCS_OC_BUCKET, GCS_OC_PROJECT
 from app.services.oral_collector.gcs_utils import GCS_PUBLIC_BASE, content_type_for_format
+from app.services.storage import gcs
 
 logger = logging.getLogger(__name__)
 
-_gcs_client = None
 _signing_credentials = None
 
 RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024
 
 
-def _get_gcs_client():  # type: ignore[no-untyped-def]
-    from google.cloud import storage
-
-    global _gcs_client
-    if _gcs_client is None:
-        _gcs_client = storage.Client(project=GCS_OC_PROJECT)
-    return _gcs_client
-
-
 def _get_signing_info() -> tuple[str, str]:
     global _signing_credentials
     if _signing_credentials is None:
@@ -222,7 +213,7 @@ async def delete_recording(db: AsyncSession, recording_id: str) -> None:
 
     recording = await get_recording(db, recording_id)
     if recording.upload_status in ACTIVE_UPLOAD_STATUSES and recording.gcs_url:
-        _delete_gcs_blob(recording.gcs_url)
+        await _delete_gcs_blob(recording.gcs_url)
     await db.delete(recording)
     await db.commit()
 
@@ -254,7 +245,7 @@ async def clear_stale_recordings(
 
     for recording in recordings:
         if recording.gcs_url:
-            _delete_gcs_blob(recording.gcs_url)
+            await _delete_gcs_blob(recording.gcs_url)
         await db.delete(recording)
 
     await db.commit()
@@ -279,8 +270,7 @@ async def generate_upload_url(
 
     blob_path = _gcs_blob_path(recording.project_id, recording.genre_id, recording_id, fmt)
 
-    client = _get_gcs_client()
-    bucket = client.bucket(GCS_OC_BUCKET)
+    bucket = gcs.get_bucket(GCS_OC_BUCKET, GCS_OC_PROJECT)
     blob = bucket.blob(blob_path)
 
     ct = content_type_for_format(fmt)
@@ -289,8 +279,9 @@ async def generate_upload_url(
     expiry_minutes = min(SIGNED_URL_EXPIRY_MINUTES + extra_minutes, 60)
     expiry = timedelta(minutes=expiry_minutes)
 
-    sa_email, access_token = _get_signing_info()
-    upload_url = blob.generate_signed_url(
+    sa_email, access_token = await gcs.run(_get_signing_info)
+    upload_url = await gcs.run(
+        blob.generate_signed_url,
         version="v4",
         expiration=expiry,
         method="PUT",
@@ -355,14 +346,14 @@ async def generate_resumable_upload_url(
 
     blob_path = _gcs_blob_path(recording.project_id, recording.genre_id, recording_id, fmt)
 
-    client = _get_gcs_client()
-    bucket = client.bucket(GCS_OC_BUCKET)
+    bucket = gcs.get_bucket(GCS_OC_BUCKET, GCS_OC_PROJECT)
     blob = bucket.blob(blob_path)
 
     ct = content_type_for_format(fmt)
     file_size = recording.file_size_bytes or 0
 
-    session_uri = blob.create_resumable_upload_session(
+    session_uri = await gcs.run(
+        blob.create_resumable_upload_session,
         content_type=ct,
         size=file_size if file_size > 0 else None,
         origin=origin,
@@ -379,16 +370,13 @@ async def generate_resumable_upload_url(
     )
 
 
-def _delete_gcs_blob(gcs_url: str) -> None:
+async def _delete_gcs_blob(gcs_url: str) -> None:
 
     try:
         if not gcs_url.startswith(GCS_PUBLIC_BASE):
             logger.warning("Unexpected GCS URL format: %s", gcs_url)
             return
         blob_name = gcs_url[len(GCS_PUBLIC_BASE) :]
-        client = _get_gcs_client()
-        bucket = client.bucket(GCS_OC_BUCKET)
-        blob = bucket.blob(blob_name)
-        blob.delete()
+        await gcs.delete_blob(GCS_OC_BUCKET, blob_name, project=GCS_OC_PROJECT)
     except Exception:
         logger.exception("Failed to delete GCS blob: %s", gcs_url)
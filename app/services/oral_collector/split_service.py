@@ -4,6 +4,7 @@ import tempfile
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Protocol
 
 import inngest
 from sqlalchemy import select
@@ -15,7 +16,8 @@ from app.core.inngest_client import inngest_client
 from app.db.models.oc_recording import OC_Recording
 from app.inngest.schemas import SplitRequestedPayload, SplitSegmentData
 from app.models.oc_recording import SplitSegment
-from app.services.oral_collector.gcs_utils import content_type_for_format, upload_gcs_blob
+from app.services.oral_collector.constants import SPLIT_UPLOAD_CONCURRENCY
+from app.services.oral_collector.gcs_utils import content_type_for_format, upload_gcs_file
 from app.services.oral_collector.recording_service import (
     FORMAT_EXTENSIONS,
     _gcs_blob_path,
@@ -26,34 +28,67 @@ from app.services.oral_collector.recording_service import (
 logger = logging.getLogger(__name__)
 
 
-async def _download_audio(gcs_url: str) -> bytes:
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def _download_audio(gcs_url: str, dest: Path) -> int:
 
     import httpx
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(gcs_url, timeout=120.0)
+    written = 0
+    async with (
+        httpx.AsyncClient() as client,
+        client.stream("GET", gcs_url, timeout=120.0) as resp,
+    ):
         resp.raise_for_status()
-        return resp.content
+        with dest.open("wb") as fh:
+            async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                fh.write(chunk)
+                written += len(chunk)
+    return written
+
+
+class _SegmentRange(Protocol):
+    start_seconds: float
+    end_seconds: float
+    gain_db: float | None
+
+
+def _gain_or_copy(seg: _SegmentRange) -> list[str]:
+
+    if seg.gain_db:
+        return ["-af", f"volume={seg.gain_db}dB"]
+    return ["-c", "copy"]
+
 
+def _ffmpeg_split_args(input_path: Path, cuts: list[tuple[Path, _SegmentRange]]) -> list[str]:
 
-async def _ffmpeg_split_segment(
-    input_path: Path, output_path: Path, start: float, end: float
-) -> None:
+    cmd = ["ffmpeg", "-y", "-i", str(input_path)]
+    for output_path, seg in cuts:
+        cmd += ["-ss", str(seg.start_seconds), "-to", str(seg.end_seconds)]
+        cmd += _gain_or_copy(seg)
+        cmd.append(str(output_path))
+    return cmd
 
-    duration = end - start
-    cmd = [
+
+def _ffmpeg_cut_args(source: str, output_path: Path, seg: _SegmentRange) -> list[str]:
+
+    return [
         "ffmpeg",
         "-y",
-        "-i",
-        str(input_path),
         "-ss",
-        str(start),
+        str(seg.start_seconds),
+        "-i",
+        source,
         "-t",
-        str(duration),
-        "-c",
-        "copy",
+        str(seg.end_seconds - seg.start_seconds),
+        *_gain_or_copy(seg),
         str(output_path),
     ]
+
+
+async def _run_ffmpeg(cmd: list[str]) -> None:
+
     proc = await asyncio.create_subprocess_exec(
         *cmd,
         stdout=asyncio.subprocess.PIPE,
@@ -64,6 +99,38 @@ async def _ffmpeg_split_segment(
         raise RuntimeError(f"FFmpeg failed: {stderr.decode()}")
 
 
+async def _ffmpeg_split_segments(input_path: Path, cuts: list[tuple[Path, _SegmentRange]]) -> None:
+
+    await _run_ffmpeg(_ffmpeg_split_args(input_path, cuts))
+
+
+async def _ffmpeg_cut_segment(source: str, output_path: Path, seg: _SegmentRange) -> None:
+
+    await _run_ffmpeg(_ffmpeg_cut_args(source, output_path, seg))
+
+
+async def _upload_segments(
+    uploads: list[tuple[str, Path]],
+    content_type: str,
+    *,
+    concurrency: int = SPLIT_UPLOAD_CONCURRENCY,
+) -> list[str]:
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _upload(blob_path: str, path: Path) -> str:
+        async with semaphore:
+            return await upload_gcs_file(blob_path, path, content_type)
+
+    tasks = [asyncio.create_task(_upload(blob_path, path)) for blob_path, path in uploads]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
 async def request_split(
     db: AsyncSession,
     recording_id: str,
@@ -187,40 +254,38 @@ async def split_recording(
     if not recording.gcs_url:
         raise NotFoundError("Recording has no uploaded audio file")
 
-    audio_data = await _download_audio(recording.gcs_url)
     fmt = recording.format.lower()
     ext = FORMAT_EXTENSIONS.get(fmt, f".{fmt}")
 
-    new_ids: list[str] = []
-
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp = Path(tmp_dir)
         input_file = tmp / f"original{ext}"
-        input_file.write_bytes(audio_data)
+        await _download_audio(recording.gcs_url, input_file)
+
+        output_files = [tmp / f"segment_{i}{ext}" for i in range(len(segments))]
+        await _ffmpeg_split_segments(input_file, list(zip(output_files, segments, strict=True)))
+
+        new_ids = [str(uuid.uuid4()) for _ in segments]
+        gcs_urls = await _upload_segments(
+            [
+                (_gcs_blob_path(recording.project_id, recording.genre_id, new_id, fmt), output)
+                for new_id, output in zip(new_ids, output_files, strict=True)
+            ],
+            content_type_for_format(fmt),
+        )
 
         for i, seg in enumerate(segments):
-            new_id = str(uuid.uuid4())
-            output_file = tmp / f"segment_{i}{ext}"
-
-            await _ffmpeg_split_segment(input_file, output_file, seg.start_seconds, seg.end_seconds)
-
-            segment_bytes = output_file.read_bytes()
-            blob_path = _gcs_blob_path(recording.project_id, recording.genre_id, new_id, fmt)
-            content_type = content_type_for_format(fmt)
-            gcs_url = await upload_gcs_blob(blob_path, segment_bytes, content_type)
-
-            duration = seg.end_seconds - seg.start_seconds
             new_recording = OC_Recording(
-                id=new_id,
+                id=new_ids[i],
                 project_id=recording.project_id,
                 genre_id=recording.genre_id,
                 subcategory_id=recording.subcategory_id,
                 user_id=recording.user_id,
                 title=f"{recording.title or 'Recording'} (segment {i + 1})",
-                duration_seconds=duration,
-                file_size_bytes=len(segment_bytes),
+                duration_seconds=seg.end_seconds - seg.start_seconds,
+                file_size_bytes=output_files[i].stat().st_size,
                 format=recording.format,
-                gcs_url=gcs_url,
+                gcs_url=gcs_urls[i],
                 upload_status=UploadStatus.VERIFIED,
                 cleaning_status=CleaningStatus.NONE,
                 splitting_status=SplittingStatus.NONE,
@@ -229,7 +294,6 @@ async def split_recording(
                 uploaded_at=datetime.now(UTC),
             )
             db.add(new_recording)
-            new_ids.append(new_id)
 
         await db.commit()
 
@@ -1,11 +1,17 @@
 from app.services.rag.delete_document import delete_document
 from app.services.rag.list_documents import list_documents
+from app.services.rag.purge_namespace import begin_purge, get_purge_status, purge_namespace
 from app.services.rag.query import query
+from app.services.rag.stream_query import stream_query
 from app.services.rag.upload_document import upload_document
 
 __all__ = [
+    "begin_purge",
     "delete_document",
+    "get_purge_status",
     "list_documents",
+    "purge_namespace",
     "query",
+    "stream_query",
     "upload_document",
 ]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import logging
+
+from cachetools import LRUCache  # type: ignore[import-untyped]
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.rag import RagNamespaceVersion
+from app.models.rag import QueryResponse, RagNamespace
+from app.services.rag.embedding_cache import cache_session, text_hash
+
+logger = logging.getLogger(__name__)
+
+_ANSWER_ENTRIES = 256
+
+AnswerKey = tuple[str, str, str, int, int]
+
+_answers: LRUCache[AnswerKey, QueryResponse] = LRUCache(maxsize=_ANSWER_ENTRIES)
+
+
+def answer_key(
+    collection: str, namespace: RagNamespace, question: str, top_k: int, version: int
+) -> AnswerKey:
+    return (collection, namespace.value, text_hash(question.casefold()), top_k, version)
+
+
+def get_answer(key: AnswerKey) -> QueryResponse | None:
+    cached: QueryResponse | None = _answers.get(key)
+    return cached.model_copy(deep=True) if cached is not None else None
+
+
+def set_answer(key: AnswerKey, response: QueryResponse) -> None:
+    _answers[key] = response.model_copy(deep=True)
+
+
+def clear() -> None:
+    _answers.clear()
+
+
+async def get_version(db: AsyncSession, namespace: RagNamespace) -> int | None:
+    async with cache_session(db) as session:
+        try:
+            row = await session.get(RagNamespaceVersion, namespace.value)
+            return row.version if row is not None else 0
+        except Exception:
+            logger.warning(
+                "Could not read RAG namespace version; answer cache bypassed", exc_info=True
+            )
+            return None
+
+
+async def bump_version(db: AsyncSession, namespace: RagNamespace) -> int | None:
+    async with cache_session(db) as session:
+        try:
+            result = await session.execute(
+                update(RagNamespaceVersion)
+                .where(RagNamespaceVersion.namespace == namespace.value)
+                .values(version=RagNamespaceVersion.version + 1)
+                .returning(RagNamespaceVersion.version)
+            )
+            version = result.scalar_one_or_none()
+            if version is None:
+                session.add(RagNamespaceVersion(namespace=namespace.value, version=1))
+                version = 1
+            await session.commit()
+            return version
+        except Exception:
+            logger.warning(
+                "Could not bump RAG namespace version %s", namespace.value, exc_info=True
+            )
+            return None
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import FieldCondition, Filter, MatchValue
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings, get_settings
 from app.models.rag import RagNamespace
+from app.services.rag import answer_cache, document_registry
 
 
 async def delete_document(
+    db: AsyncSession,
     client: AsyncQdrantClient,
     namespace: RagNamespace,
     doc_id: str,
@@ -16,28 +19,21 @@ async def delete_document(
 ) -> int:
     settings = settings or get_settings()
 
-    existing = await client.scroll(
-        collection_name=settings.qdrant_collection,
-        scroll_filter=Filter(
-            must=[
-                FieldCondition(key="namespace", match=MatchValue(value=namespace.value)),
-                FieldCondition(key="doc_id", match=MatchValue(value=doc_id)),
-            ]
-        ),
-        limit=10_000,
-        with_payload=False,
-        with_vectors=False,
+    doc_filter = Filter(
+        must=[
+            FieldCondition(key="namespace", match=MatchValue(value=namespace.value)),
+            FieldCondition(key="doc_id", match=MatchValue(value=doc_id)),
+        ]
     )
-    deleted_count = len(existing[0])
-
-    await client.delete(
-        collection_name=settings.qdrant_collection,
-        points_selector=Filter(
-            must=[
-                FieldCondition(key="namespace", match=MatchValue(value=namespace.value)),
-                FieldCondition(key="doc_id", match=MatchValue(value=doc_id)),
-            ]
-        ),
+    existing = await client.count(
+        collection_name=settings.qdrant_collection, count_filter=doc_filter, exact=True
     )
+    if existing.count == 0:
+        await document_registry.record_delete(db, namespace, doc_id)
+        return 0
+
+    await client.delete(collection_name=settings.qdrant_collection, points_selector=doc_filter)
+    await document_registry.record_delete(db, namespace, doc_id)
+    await answer_cache.bump_version(db, namespace)
 
-    return deleted_count
+    return existing.count
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import base64
+import json
+import logging
+from datetime import UTC, datetime
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import ExtendedPointId, FieldCondition, Filter, MatchValue
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.rag import RagDocument
+from app.models.rag import DocumentInfo, RagNamespace
+
+logger = logging.getLogger(__name__)
+
+_SCROLL_PAGE = 1000
+
+
+def encode_cursor(uploaded_at: datetime, doc_id: str) -> str:
+    raw = json.dumps([uploaded_at.isoformat(), doc_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        uploaded_at, doc_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(uploaded_at), str(doc_id)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid document cursor") from exc
+
+
+def to_document_info(row: RagDocument) -> DocumentInfo:
+    return DocumentInfo(
+        doc_id=row.doc_id,
+        filename=row.filename,
+        namespace=row.namespace,
+        chunk_count=row.chunk_count,
+        uploaded_at=row.uploaded_at.isoformat(),
+    )
+
+
+async def record_upload(
+    db: AsyncSession,
+    namespace: RagNamespace,
+    doc_id: str,
+    *,
+    doc_key: str | None,
+    filename: str,
+    chunk_count: int,
+    uploaded_at: datetime,
+) -> None:
+    try:
+        row = await db.get(RagDocument, doc_id)
+        if row is None:
+            row = RagDocument(doc_id=doc_id, namespace=namespace.value)
+            db.add(row)
+        row.doc_key = doc_key
+        row.filename = filename
+        row.chunk_count = chunk_count
+        row.uploaded_at = uploaded_at
+        await db.commit()
+    except Exception:
+        logger.warning("Could not record RAG document %s in the registry", doc_id, exc_info=True)
+        await db.rollback()
+
+
+async def record_delete(db: AsyncSession, namespace: RagNamespace, doc_id: str) -> int | None:
+    try:
+        row = await db.get(RagDocument, doc_id)
+        if row is None or row.namespace != namespace.value:
+            return None
+        chunk_count = row.chunk_count
+        await db.delete(row)
+        await db.commit()
+        return chunk_count
+    except Exception:
+        logger.warning("Could not remove RAG document %s from the registry", doc_id, exc_info=True)
+        await db.rollback()
+        return None
+
+
+async def clear_namespace(db: AsyncSession, namespace: RagNamespace) -> int:
+    result = await db.execute(delete(RagDocument).where(RagDocument.namespace == namespace.value))
+    await db.commit()
+    return int(result.rowcount)  # type: ignore[attr-defined]
+
+
+async def rebuild(
+    db: AsyncSession,
+    client: AsyncQdrantClient,
+    collection_name: str,
+    namespace: RagNamespace,
+) -> int:
+    docs: dict[str, RagDocument] = {}
+    offset: ExtendedPointId | None = None
+    while True:
+        points, offset = await client.scroll(
+            collection_name=collection_name,
+            scroll_filter=Filter(
+                must=[FieldCondition(key="namespace", match=MatchValue(value=namespace.value))]
+            ),
+            limit=_SCROLL_PAGE,
+            offset=offset,
+            with_payload=["doc_id", "doc_key", "filename", "uploaded_at"],
+            with_vectors=False,
+        )
+        for point in points:
+            payload = point.payload or {}
+            doc_id = payload.get("doc_id", "")
+            doc = docs.get(doc_id)
+            if doc is None:
+                uploaded_at = payload.get("uploaded_at")
+                doc = docs[doc_id] = RagDocument(
+                    doc_id=doc_id,
+                    namespace=namespace.value,
+                    doc_key=payload.get("doc_key"),
+                    filename=payload.get("filename", "unknown"),
+                    chunk_count=0,
+                    uploaded_at=(
+                        datetime.fromisoformat(uploaded_at) if uploaded_at else datetime.now(UTC)
+                    ),
+                )
+            doc.chunk_count += 1
+        if offset is None:
+            break
+
+    await db.execute(delete(RagDocument).where(RagDocument.namespace == namespace.value))
+    db.add_all(docs.values())
+    await db.commit()
+    return len(docs)
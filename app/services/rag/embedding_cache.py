@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from array import array
+from datetime import UTC, datetime, timedelta
+
+from cachetools import LRUCache  # type: ignore[import-untyped]
+from langchain_core.embeddings import Embeddings
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings
+from app.db.models.rag import RagEmbedding
+from app.models.rag import EmbeddingCacheStats
+
+logger = logging.getLogger(__name__)
+
+_MEMORY_ENTRIES = 2048
+
+CacheKey = tuple[str, str, str]
+
+_memory: LRUCache[CacheKey, tuple[list[float], float]] = LRUCache(maxsize=_MEMORY_ENTRIES)
+_lock = threading.Lock()
+_counters = {
+    "memory_hits": 0,
+    "db_hits": 0,
+    "misses": 0,
+    "embedded_texts": 0,
+    "embedded_chars": 0,
+}
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def _pack(vector: list[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(data: bytes) -> list[float]:
+    values = array("f")
+    values.frombytes(data)
+    return values.tolist()
+
+
+# Cache I/O runs on db's engine in its own session, so it never commits or rolls back db.
+def cache_session(db: AsyncSession) -> AsyncSession:
+    return AsyncSession(bind=db.bind, expire_on_commit=False)
+
+
+def _count(name: str, n: int) -> None:
+    with _lock:
+        _counters[name] += n
+
+
+def get_stats() -> EmbeddingCacheStats:
+    with _lock:
+        return EmbeddingCacheStats(**_counters, cached_entries=len(_memory))
+
+
+def clear() -> None:
+    with _lock:
+        _memory.clear()
+        for name in _counters:
+            _counters[name] = 0
+
+
+class CachedEmbeddings(Embeddings):
+    def __init__(
+        self,
+        inner: Embeddings,
+        model: str,
+        *,
+        ttl_seconds: float,
+        db: AsyncSession | None = None,
+    ) -> None:
+        self.inner = inner
+        self.model = model
+        self.ttl_seconds = ttl_seconds
+        self.db = db
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.inner.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.inner.embed_query(text)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self._aembed(texts, "document")
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return (await self._aembed([text], "query"))[0]
+
+    async def _aembed(self, texts: list[str], task: str) -> list[list[float]]:
+        hashes = [text_hash(t) for t in texts]
+        by_hash = dict(zip(hashes, texts, strict=True))
+
+        found = self._from_memory(task, list(by_hash))
+        _count("memory_hits", len(found))
+
+        missing = [h for h in by_hash if h not in found]
+        db = self.db
+        if missing and db is not None:
+            from_db = await self._from_db(db, task, missing)
+            _count("db_hits", len(from_db))
+            self._remember(task, from_db)
+            found.update(from_db)
+            missing = [h for h in missing if h not in found]
+
+        if missing:
+            _count("misses", len(missing))
+            pending = [by_hash[h] for h in missing]
+            if task == "query":
+                vectors = [await self.inner.aembed_query(pending[0])]
+            else:
+                vectors = await self.inner.aembed_documents(pending)
+            _count("embedded_texts", len(pending))
+            _count("embedded_chars", sum(len(t) for t in pending))
+            embedded = dict(zip(missing, vectors, strict=True))
+            self._remember(task, embedded)
+            if db is not None:
+                await self._store(db, task, embedded)
+            found.update(embedded)
+
+        return [found[h] for h in hashes]
+
+    def _from_memory(self, task: str, hashes: list[str]) -> dict[str, list[float]]:
+        now = time.monotonic()
+        found: dict[str, list[float]] = {}
+        with _lock:
+            for h in hashes:
+                entry = _memory.get((self.model, task, h))
+                if entry is not None and now - entry[1] < self.ttl_seconds:
+                    found[h] = entry[0]
+        return found
+
+    def _remember(self, task: str, vectors: dict[str, list[float]]) -> None:
+        now = time.monotonic()
+        with _lock:
+            for h, vector in vectors.items():
+                _memory[(self.model, task, h)] = (vector, now)
+
+    async def _from_db(
+        self, db: AsyncSession, task: str, hashes: list[str]
+    ) -> dict[str, list[float]]:
+        cutoff = datetime.now(UTC) - timedelta(seconds=self.ttl_seconds)
+        async with cache_session(db) as session:
+            try:
+                rows = await session.execute(
+                    select(
+                        RagEmbedding.text_hash, RagEmbedding.vector, RagEmbedding.created_at
+                    ).where(
+                        RagEmbedding.model == self.model,
+                        RagEmbedding.task == task,
+                        RagEmbedding.text_hash.in_(hashes),
+                    )
+                )
+                return {
+                    text_hash: _unpack(vector)
+                    for text_hash, vector, created_at in rows
+                    if created_at.replace(tzinfo=created_at.tzinfo or UTC) >= cutoff
+                }
+            except Exception:
+                logger.warning("Embedding cache lookup failed; embedding without it", exc_info=True)
+                return {}
+
+    async def _store(self, db: AsyncSession, task: str, vectors: dict[str, list[float]]) -> None:
+        now = datetime.now(UTC)
+        async with cache_session(db) as session:
+            try:
+                await session.execute(
+                    delete(RagEmbedding).where(
+                        RagEmbedding.model == self.model,
+                        RagEmbedding.task == task,
+                        RagEmbedding.text_hash.in_(list(vectors)),
+                    )
+                )
+                session.add_all(
+                    RagEmbedding(
+                        model=self.model,
+                        task=task,
+                        text_hash=h,
+                        dimensions=len(vector),
+                        vector=_pack(vector),
+                        created_at=now,
+                    )
+                    for h, vector in vectors.items()
+                )
+                await session.commit()
+            except Exception:
+                logger.warning("Embedding cache write failed", exc_info=True)
+
+
+def cached_embeddings(settings: Settings, db: AsyncSession | None = None) -> CachedEmbeddings:
+    inner = GoogleGenerativeAIEmbeddings(
+        model=settings.google_embedding_model,
+        google_api_key=settings.google_api_key,  # type: ignore[call-arg]
+    )
+    return CachedEmbeddings(
+        inner,
+        settings.google_embedding_model,
+        ttl_seconds=settings.rag_embedding_cache_ttl_seconds,
+        db=db,
+    )
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import math
+
+from langchain_core.embeddings import Embeddings
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings
+from app.services.rag.embedding_cache import cached_embeddings
+from app.services.rag.sparse import tokenize
+
+LOCAL_MODEL = "local-hashing"
+
+
+class HashingEmbeddings(Embeddings):
+    def __init__(self, dimensions: int) -> None:
+        self.dimensions = dimensions
+
+    def _embed(self, text: str) -> list[float]:
+        tokens = tokenize(text)
+        features = tokens + [f"{a} {b}" for a, b in itertools.pairwise(tokens)]
+        vector = [0.0] * self.dimensions
+        for feature in features:
+            h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest())
+            vector[h % self.dimensions] += -1.0 if h >> 63 else 1.0
+        norm = math.sqrt(sum(v * v for v in vector))
+        return [v / norm for v in vector] if norm else vector
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed(text)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return self.embed_query(text)
+
+
+def embeddings_for(settings: Settings, db: AsyncSession | None = None) -> Embeddings:
+    if settings.rag_embedding_provider == "local":
+        return HashingEmbeddings(settings.rag_embedding_dimensions)
+    return cached_embeddings(settings, db)
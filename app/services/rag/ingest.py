@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import PointStruct
+
+from app.services.common.retry import with_retries
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
+
+async def embed_and_upsert(
+    client: AsyncQdrantClient,
+    embeddings: Embeddings,
+    texts: Sequence[str],
+    build_point: Callable[[int, list[float]], PointStruct],
+    *,
+    collection_name: str,
+    batch_size: int,
+    concurrency: int,
+) -> None:
+    step = max(batch_size, 1)
+    batches = [range(start, min(start + step, len(texts))) for start in range(0, len(texts), step)]
+    if not batches:
+        return
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _run(batch: range, *, wait: bool) -> None:
+        async with semaphore:
+            batch_texts = [texts[i] for i in batch]
+            vectors = await with_retries(
+                f"Embedding chunks {batch.start}-{batch.stop - 1}",
+                lambda: embeddings.aembed_documents(batch_texts),
+            )
+            points = [build_point(i, v) for i, v in zip(batch, vectors, strict=True)]
+            await with_retries(
+                f"Upserting chunks {batch.start}-{batch.stop - 1}",
+                lambda: client.upsert(collection_name=collection_name, points=points, wait=wait),
+            )
+
+    *head, last = batches
+    tasks = [asyncio.create_task(_run(batch, wait=False)) for batch in head]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    await _run(last, wait=True)
@@ -1,44 +1,44 @@
 from __future__ import annotations
 
-from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import FieldCondition, Filter, MatchValue
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import Settings, get_settings
+from app.db.models.rag import RagDocument
 from app.models.rag import DocumentInfo, RagNamespace
+from app.services.rag.document_registry import (
+    decode_cursor,
+    encode_cursor,
+    to_document_info,
+)
 
 
 async def list_documents(
-    client: AsyncQdrantClient,
+    db: AsyncSession,
     namespace: RagNamespace,
     *,
-    settings: Settings | None = None,
-) -> list[DocumentInfo]:
-    settings = settings or get_settings()
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> tuple[list[DocumentInfo], str | None]:
+    stmt = select(RagDocument).where(RagDocument.namespace == namespace.value)
+    if cursor:
+        after_uploaded_at, after_doc_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            or_(
+                RagDocument.uploaded_at > after_uploaded_at,
+                and_(
+                    RagDocument.uploaded_at == after_uploaded_at,
+                    RagDocument.doc_id > after_doc_id,
+                ),
+            )
+        )
+    stmt = stmt.order_by(RagDocument.uploaded_at, RagDocument.doc_id)
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
 
-    points, _ = await client.scroll(
-        collection_name=settings.qdrant_collection,
-        scroll_filter=Filter(
-            must=[
-                FieldCondition(key="namespace", match=MatchValue(value=namespace.value)),
-            ]
-        ),
-        limit=10_000,
-        with_payload=True,
-        with_vectors=False,
-    )
+    rows = list((await db.execute(stmt)).scalars())
 
-    docs: dict[str, dict] = {}
-    for point in points:
-        payload = point.payload or {}
-        doc_id = payload.get("doc_id", "")
-        if doc_id not in docs:
-            docs[doc_id] = {
-                "doc_id": doc_id,
-                "filename": payload.get("filename", "unknown"),
-                "namespace": payload.get("namespace", namespace.value),
-                "uploaded_at": payload.get("uploaded_at", ""),
-                "chunk_count": 0,
-            }
-        docs[doc_id]["chunk_count"] += 1
-
-    return [DocumentInfo(**doc) for doc in docs.values()]
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].uploaded_at, rows[-1].doc_id)
+    return [to_document_info(row) for row in rows], next_cursor
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+    ExtendedPointId,
+    PointStruct,
+    Record,
+)
+
+from app.core.config import Settings
+from app.core.qdrant import SPARSE_VECTOR_NAME, create_collection
+from app.services.rag.sparse import document_vector
+
+logger = logging.getLogger(__name__)
+
+_COPY_BATCH = 256
+LIVE_ALIAS_SUFFIX = "_live"
+
+
+@dataclass(frozen=True, slots=True)
+class CollectionMigration:
+    alias: str
+    source: str | None
+    target: str
+    points: int
+    dropped: str | None
+
+
+async def _aliased_collection(client: AsyncQdrantClient, name: str) -> str | None:
+    aliases = await client.get_aliases()
+    for alias in aliases.aliases:
+        if alias.alias_name == name:
+            return alias.collection_name
+    return None
+
+
+async def resolve_collection(client: AsyncQdrantClient, name: str) -> str | None:
+    aliased = await _aliased_collection(client, name)
+    if aliased is not None:
+        return aliased
+    return name if await client.collection_exists(name) else None
+
+
+def _to_point(record: Record) -> PointStruct:
+    vector: Any = record.vector or {}
+    if not isinstance(vector, dict):
+        vector = {"": vector}
+    text = (record.payload or {}).get("text")
+    if SPARSE_VECTOR_NAME not in vector and text:
+        vector = {**vector, SPARSE_VECTOR_NAME: document_vector(text)}
+    return PointStruct(id=record.id, vector=vector, payload=record.payload)
+
+
+async def _copy_points(client: AsyncQdrantClient, source: str, target: str, batch_size: int) -> int:
+    copied = 0
+    offset: ExtendedPointId | None = None
+    while True:
+        records, offset = await client.scroll(
+            collection_name=source,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True,
+        )
+        if records:
+            await client.upsert(
+                collection_name=target,
+                points=[_to_point(record) for record in records],
+                wait=True,
+            )
+            copied += len(records)
+            logger.info("Copied %d points from %s to %s", copied, source, target)
+        if offset is None:
+            return copied
+
+
+async def migrate_collection(
+    client: AsyncQdrantClient,
+    settings: Settings,
+    *,
+    batch_size: int = _COPY_BATCH,
+    keep_old: bool = False,
+    suffix: str | None = None,
+    alias: str | None = None,
+) -> CollectionMigration:
+    name = settings.qdrant_collection
+    source = await resolve_collection(client, name)
+    # A plain collection cannot be replaced by an alias of the same name without deleting
+    # it first, so it keeps serving while a new alias takes over.
+    alias = (alias or f"{name}{LIVE_ALIAS_SUFFIX}") if source == name else name
+    target = f"{alias}_{suffix or datetime.now(UTC).strftime('%Y%m%d%H%M%S')}"
+    if target == source:
+        raise ValueError(f"Target collection '{target}' is already live")
+
+    await create_collection(client, target, settings)
+    copied = 0
+    if source is not None:
+        copied = await _copy_points(client, source, target, batch_size)
+        expected = (await client.count(collection_name=source, exact=True)).count
+        actual = (await client.count(collection_name=target, exact=True)).count
+        if actual != expected:
+            await client.delete_collection(target)
+            raise RuntimeError(
+                f"Copied {actual} of {expected} points from '{source}'; migration aborted"
+            )
+
+    previous = await _aliased_collection(client, alias)
+    operations: list[CreateAliasOperation | DeleteAliasOperation] = []
+    if previous is not None:
+        operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias)))
+    operations.append(
+        CreateAliasOperation(create_alias=CreateAlias(collection_name=target, alias_name=alias))
+    )
+    await client.update_collection_aliases(change_aliases_operations=operations)
+
+    dropped = None
+    if previous is not None and not keep_old:
+        await client.delete_collection(previous)
+        dropped = previous
+
+    return CollectionMigration(
+        alias=alias, source=source, target=target, points=copied, dropped=dropped
+    )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime, timedelta
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import FieldCondition, Filter, MatchValue, PointIdsList
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings, get_settings
+from app.db.models.rag import RagPurgeJob
+from app.models.rag import NamespacePurgeStatus, RagNamespace
+from app.services.rag import answer_cache, document_registry
+
+logger = logging.getLogger(__name__)
+
+_PURGE_BATCH = 1000
+
+# Job state lives in rag_purge_jobs so every instance sees the same purge. A job
+# that stops reporting progress (its instance died) can be claimed again.
+_STALE_AFTER = timedelta(minutes=15)
+
+
+def _to_status(row: RagPurgeJob) -> NamespacePurgeStatus:
+    return NamespacePurgeStatus(
+        namespace=row.namespace,
+        status=row.status,
+        total_chunks=row.total_chunks,
+        deleted_chunks=row.deleted_chunks,
+        deleted_documents=row.deleted_documents,
+        message=row.message,
+    )
+
+
+async def get_purge_status(db: AsyncSession, namespace: RagNamespace) -> NamespacePurgeStatus:
+    row = await db.get(RagPurgeJob, namespace.value, populate_existing=True)
+    if row is None:
+        return NamespacePurgeStatus(
+            namespace=namespace.value, status="idle", message="No purge run"
+        )
+    return _to_status(row)
+
+
+async def begin_purge(db: AsyncSession, namespace: RagNamespace) -> NamespacePurgeStatus | None:
+    now = datetime.now(UTC)
+    job = NamespacePurgeStatus(namespace=namespace.value, status="running", message="Purge queued")
+    claimed = await db.execute(
+        update(RagPurgeJob)
+        .where(
+            RagPurgeJob.namespace == namespace.value,
+            or_(RagPurgeJob.status != "running", RagPurgeJob.updated_at < now - _STALE_AFTER),
+        )
+        .values(**job.model_dump(exclude={"namespace"}), updated_at=now)
+        .returning(RagPurgeJob.namespace)
+    )
+    if claimed.scalar_one_or_none() is None:
+        if await db.get(RagPurgeJob, namespace.value) is not None:
+            await db.rollback()
+            return None
+        db.add(RagPurgeJob(**job.model_dump(), updated_at=now))
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return None
+    return job
+
+
+async def _save(db: AsyncSession, job: NamespacePurgeStatus) -> None:
+    try:
+        row = await db.get(RagPurgeJob, job.namespace)
+        if row is None:
+            row = RagPurgeJob(namespace=job.namespace)
+            db.add(row)
+        for field, value in job.model_dump(exclude={"namespace"}).items():
+            setattr(row, field, value)
+        row.updated_at = datetime.now(UTC)
+        await db.commit()
+    except Exception:
+        logger.warning("Could not record purge progress for %s", job.namespace, exc_info=True)
+        await db.rollback()
+
+
+async def purge_namespace(
+    db: AsyncSession,
+    client: AsyncQdrantClient,
+    namespace: RagNamespace,
+    *,
+    settings: Settings | None = None,
+    batch_size: int = _PURGE_BATCH,
+) -> NamespacePurgeStatus:
+    settings = settings or get_settings()
+    job = NamespacePurgeStatus(
+        namespace=namespace.value, status="running", message="Counting chunks"
+    )
+    await _save(db, job)
+    ns_filter = Filter(
+        must=[FieldCondition(key="namespace", match=MatchValue(value=namespace.value))]
+    )
+
+    try:
+        job.total_chunks = (
+            await client.count(
+                collection_name=settings.qdrant_collection, count_filter=ns_filter, exact=True
+            )
+        ).count
+        while True:
+            points, _ = await client.scroll(
+                collection_name=settings.qdrant_collection,
+                scroll_filter=ns_filter,
+                limit=batch_size,
+                with_payload=False,
+                with_vectors=False,
+            )
+            if not points:
+                break
+            await client.delete(
+                collection_name=settings.qdrant_collection,
+                points_selector=PointIdsList(points=[point.id for point in points]),
+                wait=True,
+            )
+            job.deleted_chunks += len(points)
+            job.message = f"Deleted {job.deleted_chunks}/{job.total_chunks} chunks"
+            await _save(db, job)
+
+        job.deleted_documents = await document_registry.clear_namespace(db, namespace)
+        await answer_cache.bump_version(db, namespace)
+    except Exception as exc:
+        logger.exception("Purge of RAG namespace %s failed", namespace.value)
+        await db.rollback()
+        job.status = "failed"
+        job.message = f"Purge failed after {job.deleted_chunks} chunks: {exc}"
+    else:
+        job.status = "done"
+        job.message = f"Deleted {job.deleted_chunks} chunks from {job.deleted_documents} documents"
+    await _save(db, job)
+    return job
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+from langchain_google_genai import ChatGoogleGenerativeAI
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import FieldCondition, Filter, MatchValue
+from qdrant_client.models import FieldCondition, Filter, Fusion, FusionQuery, MatchValue, Prefetch
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings, get_settings
+from app.core.qdrant import SPARSE_VECTOR_NAME, search_params
 from app.models.rag import QueryResponse, RagNamespace, SourceChunk
+from app.services.rag import answer_cache
+from app.services.rag.embeddings import embeddings_for
 from app.services.rag.prompts import NO_CONTEXT_ANSWER, build_rag_prompt
+from app.services.rag.rerank import rerank
+from app.services.rag.sparse import query_vector
 
 if TYPE_CHECKING:
     from langchain_core.embeddings import Embeddings
@@ -16,6 +22,7 @@ if TYPE_CHECKING:
 
 
 async def query(
+    db: AsyncSession,
     client: AsyncQdrantClient,
     namespace: RagNamespace,
     question: str,
@@ -24,59 +31,124 @@ async def query(
     settings: Settings | None = None,
     embeddings: Embeddings | None = None,
     llm: BaseChatModel | None = None,
+    use_cache: bool = False,
 ) -> QueryResponse:
     settings = settings or get_settings()
     k = top_k or settings.rag_top_k
 
-    embeddings = embeddings or GoogleGenerativeAIEmbeddings(
-        model=settings.google_embedding_model,
-        google_api_key=settings.google_api_key,  # type: ignore[call-arg]
-    )
-    question_vector = await embeddings.aembed_query(question)
+    key = None
+    if use_cache:
+        version = await answer_cache.get_version(db, namespace)
+        if version is not None:
+            key = answer_cache.answer_key(
+                settings.qdrant_collection, namespace, question, k, version
+            )
+            cached = answer_cache.get_answer(key)
+            if cached is not None:
+                return cached
+
+    embeddings = embeddings or embeddings_for(settings, db)
+    response = await _retrieve_and_answer(client, namespace, question, k, settings, embeddings, llm)
+    if key is not None and response.sources:
+        answer_cache.set_answer(key, response)
+    return response
 
-    results = await client.query_points(
-        collection_name=settings.qdrant_collection,
-        query=question_vector,
-        query_filter=Filter(
-            must=[
-                FieldCondition(key="namespace", match=MatchValue(value=namespace.value)),
-            ]
-        ),
-        limit=k,
-        with_payload=True,
+
+async def retrieve_context(
+    client: AsyncQdrantClient,
+    namespace: RagNamespace,
+    question: str,
+    k: int,
+    settings: Settings,
+    embeddings: Embeddings,
+) -> tuple[list[SourceChunk], list[str]]:
+    question_vector = await embeddings.aembed_query(question)
+    namespace_filter = Filter(
+        must=[
+            FieldCondition(key="namespace", match=MatchValue(value=namespace.value)),
+        ]
     )
 
-    sources: list[SourceChunk] = []
-    context_parts: list[str] = []
-    for point in results.points:
-        payload = point.payload or {}
-        chunk_text = payload.get("text", "")
-        sources.append(
-            SourceChunk(
-                filename=payload.get("filename", "unknown"),
-                chunk_index=payload.get("chunk_index", 0),
-                text=chunk_text,
-                score=point.score,
-            )
+    if settings.rag_hybrid_search:
+        candidates = max(k, settings.rag_rerank_candidates)
+        results = await client.query_points(
+            collection_name=settings.qdrant_collection,
+            prefetch=[
+                Prefetch(
+                    query=question_vector,
+                    filter=namespace_filter,
+                    params=search_params(settings),
+                    limit=candidates,
+                ),
+                Prefetch(
+                    query=query_vector(question),
+                    using=SPARSE_VECTOR_NAME,
+                    filter=namespace_filter,
+                    limit=candidates,
+                ),
+            ],
+            query=FusionQuery(fusion=Fusion.RRF),
+            query_filter=namespace_filter,
+            limit=candidates,
+            with_payload=True,
+        )
+    else:
+        results = await client.query_points(
+            collection_name=settings.qdrant_collection,
+            query=question_vector,
+            query_filter=namespace_filter,
+            search_params=search_params(settings),
+            limit=k,
+            with_payload=True,
         )
-        context_parts.append(chunk_text)
 
-    if not context_parts:
-        return QueryResponse(answer=NO_CONTEXT_ANSWER, sources=[])
+    sources = [
+        SourceChunk(
+            filename=(point.payload or {}).get("filename", "unknown"),
+            chunk_index=(point.payload or {}).get("chunk_index", 0),
+            text=(point.payload or {}).get("text", ""),
+            score=point.score,
+        )
+        for point in results.points
+    ]
+    if settings.rag_hybrid_search:
+        sources = rerank(question, sources, k)
+    return sources, [source.text for source in sources]
+
 
-    llm = llm or ChatGoogleGenerativeAI(
+def chat_model(settings: Settings, llm: BaseChatModel | None) -> BaseChatModel:
+    return llm or ChatGoogleGenerativeAI(
         model=settings.google_llm_model,
         google_api_key=settings.google_api_key,
     )
-    response = await llm.ainvoke(build_rag_prompt(context_parts, question))
 
-    content = response.content
+
+def content_text(content: str | list[Any]) -> str:
     if isinstance(content, list):
-        content = "".join(
+        return "".join(
             block.get("text", "") if isinstance(block, dict) else str(block) for block in content
         )
+    return content
+
+
+async def _retrieve_and_answer(
+    client: AsyncQdrantClient,
+    namespace: RagNamespace,
+    question: str,
+    k: int,
+    settings: Settings,
+    embeddings: Embeddings,
+    llm: BaseChatModel | None,
+) -> QueryResponse:
+    sources, context_parts = await retrieve_context(
+        client, namespace, question, k, settings, embeddings
+    )
+    if not context_parts:
+        return QueryResponse(answer=NO_CONTEXT_ANSWER, sources=[])
+
+    response = await chat_model(settings, llm).ainvoke(build_rag_prompt(context_parts, question))
 
     return QueryResponse(
-        answer=content,
+        answer=content_text(response.content),
         sources=sources,
     )
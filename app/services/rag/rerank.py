@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from app.models.rag import SourceChunk
+from app.services.rag.sparse import tokenize
+
+FUSION_WEIGHT = 0.5
+COVERAGE_WEIGHT = 0.35
+PHRASE_WEIGHT = 0.15
+
+
+def _has_phrase(query_tokens: list[str], chunk_tokens: list[str]) -> bool:
+    n = len(query_tokens)
+    if n < 2:
+        return False
+    return any(chunk_tokens[i : i + n] == query_tokens for i in range(len(chunk_tokens) - n + 1))
+
+
+def rerank(question: str, candidates: list[SourceChunk], top_k: int) -> list[SourceChunk]:
+    if not candidates:
+        return []
+    query_tokens = tokenize(question)
+    query_terms = set(query_tokens)
+    best_fused = max(c.score for c in candidates) or 1.0
+
+    scored: list[tuple[float, int, SourceChunk]] = []
+    for rank, candidate in enumerate(candidates):
+        chunk_tokens = tokenize(candidate.text)
+        coverage = len(query_terms & set(chunk_tokens)) / len(query_terms) if query_terms else 0.0
+        score = (
+            FUSION_WEIGHT * candidate.score / best_fused
+            + COVERAGE_WEIGHT * coverage
+            + PHRASE_WEIGHT * _has_phrase(query_tokens, chunk_tokens)
+        )
+        scored.append((score, rank, candidate))
+
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return [
+        candidate.model_copy(update={"score": round(score, 6)})
+        for score, _, candidate in scored[:top_k]
+    ]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+import zlib
+from collections import Counter
+
+from qdrant_client.models import SparseVector
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+BM25_AVG_TOKENS = 160
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _TOKEN_RE.findall(stripped)
+
+
+def _token_id(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8"))
+
+
+def _to_sparse(weights: dict[int, float]) -> SparseVector:
+    indices = sorted(weights)
+    return SparseVector(indices=indices, values=[weights[i] for i in indices])
+
+
+def document_vector(text: str) -> SparseVector:
+    tokens = tokenize(text)
+    length_norm = 1 - BM25_B + BM25_B * len(tokens) / BM25_AVG_TOKENS
+    weights: dict[int, float] = {}
+    for token, tf in Counter(tokens).items():
+        token_id = _token_id(token)
+        weight = tf * (BM25_K1 + 1) / (tf + BM25_K1 * length_norm)
+        weights[token_id] = weights.get(token_id, 0.0) + weight
+    return _to_sparse(weights)
+
+
+def query_vector(text: str) -> SparseVector:
+    return _to_sparse({_token_id(token): 1.0 for token in set(tokenize(text))})
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+from qdrant_client import AsyncQdrantClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings, get_settings
+from app.models.rag import (
+    QueryResponse,
+    QueryStreamError,
+    QueryStreamSources,
+    QueryStreamToken,
+    RagNamespace,
+)
+from app.services.rag import answer_cache
+from app.services.rag.embeddings import embeddings_for
+from app.services.rag.prompts import NO_CONTEXT_ANSWER, build_rag_prompt
+from app.services.rag.query import chat_model, content_text, retrieve_context
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+    from langchain_core.language_models import BaseChatModel
+
+logger = logging.getLogger(__name__)
+
+QueryStreamEvent = tuple[str, BaseModel]
+
+
+async def stream_query(
+    db: AsyncSession,
+    client: AsyncQdrantClient,
+    namespace: RagNamespace,
+    question: str,
+    top_k: int | None = None,
+    *,
+    settings: Settings | None = None,
+    embeddings: Embeddings | None = None,
+    llm: BaseChatModel | None = None,
+    use_cache: bool = False,
+) -> AsyncIterator[QueryStreamEvent]:
+    settings = settings or get_settings()
+    k = top_k or settings.rag_top_k
+
+    key = None
+    if use_cache:
+        version = await answer_cache.get_version(db, namespace)
+        if version is not None:
+            key = answer_cache.answer_key(
+                settings.qdrant_collection, namespace, question, k, version
+            )
+            cached = answer_cache.get_answer(key)
+            if cached is not None:
+                yield "sources", QueryStreamSources(sources=cached.sources)
+                yield "token", QueryStreamToken(text=cached.answer)
+                yield "done", cached
+                return
+
+    try:
+        sources, context_parts = await retrieve_context(
+            client, namespace, question, k, settings, embeddings or embeddings_for(settings, db)
+        )
+    except Exception as e:
+        logger.exception("RAG retrieval failed for streamed query")
+        yield "error", QueryStreamError(detail=f"Retrieval failed: {e}")
+        return
+
+    yield "sources", QueryStreamSources(sources=sources)
+    if not context_parts:
+        yield "token", QueryStreamToken(text=NO_CONTEXT_ANSWER)
+        yield "done", QueryResponse(answer=NO_CONTEXT_ANSWER, sources=[])
+        return
+
+    parts: list[str] = []
+    try:
+        async for chunk in chat_model(settings, llm).astream(
+            build_rag_prompt(context_parts, question)
+        ):
+            text = content_text(chunk.content)
+            if text:
+                parts.append(text)
+                yield "token", QueryStreamToken(text=text)
+    except Exception as e:
+        logger.exception("RAG answer streaming failed")
+        yield "error", QueryStreamError(detail=f"Answer generation failed: {e}")
+        return
+
+    response = QueryResponse(answer="".join(parts), sources=sources)
+    if key is not None:
+        answer_cache.set_answer(key, response)
+    yield "done", response
@@ -1,27 +1,89 @@
 from __future__ import annotations
 
+import hashlib
 import uuid
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import PointStruct
+from qdrant_client.models import (
+    ExtendedPointId,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    PointIdsList,
+    PointStruct,
+    PointVectors,
+    SetPayload,
+    SetPayloadOperation,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings, get_settings
+from app.core.qdrant import SPARSE_VECTOR_NAME
 from app.models.rag import DocumentUploadResponse, RagNamespace
+from app.services.rag import answer_cache, document_registry
+from app.services.rag.embeddings import embeddings_for
+from app.services.rag.ingest import embed_and_upsert
+from app.services.rag.sparse import document_vector
 from app.services.rag.splitters import split_markdown
 
 if TYPE_CHECKING:
     from langchain_core.embeddings import Embeddings
 
+_SCROLL_PAGE = 1000
+
+
+def chunk_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def document_id(namespace: RagNamespace, doc_key: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"tripod-rag:{namespace.value}:{doc_key}"))
+
+
+async def _existing_chunks(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    namespace: RagNamespace,
+    doc_id: str,
+    *,
+    with_sparse: bool,
+) -> tuple[dict[str, list[ExtendedPointId]], set[ExtendedPointId]]:
+    by_hash: dict[str, list[ExtendedPointId]] = {}
+    without_sparse: set[ExtendedPointId] = set()
+    offset: ExtendedPointId | None = None
+    while True:
+        points, offset = await client.scroll(
+            collection_name=collection_name,
+            scroll_filter=Filter(
+                must=[
+                    FieldCondition(key="namespace", match=MatchValue(value=namespace.value)),
+                    FieldCondition(key="doc_id", match=MatchValue(value=doc_id)),
+                ]
+            ),
+            limit=_SCROLL_PAGE,
+            offset=offset,
+            with_payload=["content_hash"],
+            with_vectors=[SPARSE_VECTOR_NAME] if with_sparse else False,
+        )
+        for point in points:
+            content_hash = (point.payload or {}).get("content_hash", "")
+            by_hash.setdefault(content_hash, []).append(point.id)
+            if with_sparse and SPARSE_VECTOR_NAME not in (point.vector or {}):
+                without_sparse.add(point.id)
+        if offset is None:
+            return by_hash, without_sparse
+
 
 async def upload_document(
+    db: AsyncSession,
     client: AsyncQdrantClient,
     namespace: RagNamespace,
     filename: str,
     content: str,
     *,
+    doc_key: str | None = None,
     settings: Settings | None = None,
     embeddings: Embeddings | None = None,
 ) -> DocumentUploadResponse:
@@ -35,41 +97,109 @@ async def upload_document(
     if not chunks:
         raise ValueError("Document is empty or could not be split into chunks")
 
-    chunk_texts = [chunk.page_content for chunk in chunks]
+    embeddings = embeddings or embeddings_for(settings, db)
 
-    embeddings = embeddings or GoogleGenerativeAIEmbeddings(
-        model=settings.google_embedding_model,
-        google_api_key=settings.google_api_key,  # type: ignore[call-arg]
-    )
-    vectors = await embeddings.aembed_documents(chunk_texts)
-
-    doc_id = str(uuid.uuid4())
-    now = datetime.now(UTC).isoformat()
-    points = [
-        PointStruct(
-            id=str(uuid.uuid4()),
-            vector=vector,
-            payload={
-                "namespace": namespace.value,
-                "doc_id": doc_id,
-                "filename": filename,
-                "chunk_index": idx,
-                "text": chunk.page_content,
-                "headers": chunk.metadata,
-                "uploaded_at": now,
-            },
+    doc_id = document_id(namespace, doc_key) if doc_key else str(uuid.uuid4())
+    uploaded_at = datetime.now(UTC)
+    now = uploaded_at.isoformat()
+    hashes = [chunk_hash(chunk.page_content) for chunk in chunks]
+
+    def _payload(idx: int) -> dict[str, Any]:
+        chunk = chunks[idx]
+        return {
+            "namespace": namespace.value,
+            "doc_id": doc_id,
+            "doc_key": doc_key,
+            "filename": filename,
+            "chunk_index": idx,
+            "content_hash": hashes[idx],
+            "text": chunk.page_content,
+            "headers": chunk.metadata,
+            "uploaded_at": now,
+        }
+
+    existing, without_sparse = (
+        await _existing_chunks(
+            client,
+            settings.qdrant_collection,
+            namespace,
+            doc_id,
+            with_sparse=settings.rag_hybrid_search,
         )
-        for idx, (chunk, vector) in enumerate(zip(chunks, vectors, strict=True))
-    ]
+        if doc_key
+        else ({}, set())
+    )
+    kept: list[tuple[int, ExtendedPointId]] = []
+    changed: list[int] = []
+    for idx, content_hash in enumerate(hashes):
+        ids = existing.get(content_hash)
+        if ids:
+            kept.append((idx, ids.pop()))
+        else:
+            changed.append(idx)
+    vanished = [point_id for ids in existing.values() for point_id in ids]
 
-    await client.upsert(
+    def _point(position: int, vector: list[float]) -> PointStruct:
+        idx = changed[position]
+        point_vector: Any = vector
+        if settings.rag_hybrid_search:
+            point_vector = {
+                "": vector,
+                SPARSE_VECTOR_NAME: document_vector(chunks[idx].page_content),
+            }
+        return PointStruct(id=str(uuid.uuid4()), vector=point_vector, payload=_payload(idx))
+
+    await embed_and_upsert(
+        client,
+        embeddings,
+        [chunks[idx].page_content for idx in changed],
+        _point,
         collection_name=settings.qdrant_collection,
-        points=points,
+        batch_size=settings.rag_embed_batch_size,
+        concurrency=settings.rag_embed_concurrency,
+    )
+
+    if kept:
+        await client.batch_update_points(
+            collection_name=settings.qdrant_collection,
+            update_operations=[
+                SetPayloadOperation(set_payload=SetPayload(payload=_payload(idx), points=[pid]))
+                for idx, pid in kept
+            ],
+        )
+    unindexed = [(idx, pid) for idx, pid in kept if pid in without_sparse]
+    if unindexed:
+        await client.update_vectors(
+            collection_name=settings.qdrant_collection,
+            points=[
+                PointVectors(
+                    id=pid,
+                    vector={SPARSE_VECTOR_NAME: document_vector(chunks[idx].page_content)},
+                )
+                for idx, pid in unindexed
+            ],
+        )
+    if vanished:
+        await client.delete(
+            collection_name=settings.qdrant_collection,
+            points_selector=PointIdsList(points=vanished),
+        )
+    await document_registry.record_upload(
+        db,
+        namespace,
+        doc_id,
+        doc_key=doc_key,
+        filename=filename,
+        chunk_count=len(chunks),
+        uploaded_at=uploaded_at,
     )
+    await answer_cache.bump_version(db, namespace)
 
     return DocumentUploadResponse(
         doc_id=doc_id,
         filename=filename,
         namespace=namespace.value,
         chunk_count=len(chunks),
+        embedded_chunks=len(changed),
+        removed_chunks=len(vanished),
     )
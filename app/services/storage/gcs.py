@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from google.cloud.storage import Blob, Bucket, Client
+
+T = TypeVar("T")
+
+POOL_SIZE = 32
+
+_clients: dict[str | None, Client] = {}
+_executor: ThreadPoolExecutor | None = None
+_lock = threading.Lock()
+
+
+def _new_client(project: str | None) -> Client:
+    import google.auth
+    from google.auth.transport.requests import AuthorizedSession
+    from google.cloud import storage
+    from requests.adapters import HTTPAdapter
+
+    credentials, default_project = google.auth.default(scopes=storage.Client.SCOPE)
+    session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    return storage.Client(
+        project=project or default_project, credentials=credentials, _http=session
+    )
+
+
+def get_client(project: str | None = None) -> Client:
+    with _lock:
+        client = _clients.get(project)
+        if client is None:
+            client = _clients[project] = _new_client(project)
+        return client
+
+
+def get_bucket(bucket_name: str, project: str | None = None) -> Bucket:
+    return get_client(project).bucket(bucket_name)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="gcs")
+        return _executor
+
+
+async def run(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(fn, *args, **kwargs))
+
+
+async def upload_bytes(
+    bucket_name: str,
+    blob_name: str,
+    data: bytes,
+    content_type: str,
+    *,
+    project: str | None = None,
+) -> None:
+    blob = get_bucket(bucket_name, project).blob(blob_name)
+    await run(blob.upload_from_string, data, content_type=content_type)
+
+
+async def upload_file(
+    bucket_name: str,
+    blob_name: str,
+    path: Path,
+    content_type: str,
+    *,
+    chunk_size: int | None = None,
+    project: str | None = None,
+) -> None:
+    blob = get_bucket(bucket_name, project).blob(blob_name, chunk_size=chunk_size)
+    await run(blob.upload_from_filename, str(path), content_type=content_type)
+
+
+async def copy_blob(
+    bucket_name: str, source_name: str, dest_name: str, *, project: str | None = None
+) -> None:
+    bucket = get_bucket(bucket_name, project)
+    await run(bucket.copy_blob, bucket.blob(source_name), bucket, dest_name)
+
+
+async def get_blob(bucket_name: str, blob_name: str, *, project: str | None = None) -> Blob | None:
+    return await run(get_bucket(bucket_name, project).get_blob, blob_name)
+
+
+async def delete_blob(bucket_name: str, blob_name: str, *, project: str | None = None) -> None:
+    await run(get_bucket(bucket_name, project).blob(blob_name).delete)
+
+
+def shutdown() -> None:
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+        _clients.clear()
@@ -2,6 +2,8 @@ import uuid
 
 from fastapi import UploadFile
 
+from app.services.storage import gcs
+
 GCS_UPLOADS_BUCKET = "tripod-image-uploads"
 GCS_PROJECT = "gen-lang-client-0886209230"
 
@@ -10,8 +12,6 @@ MAX_FILE_SIZE = 5 * 1024 * 1024
 
 
 async def upload_image(file: UploadFile, folder: str = "images") -> str:
-    from google.cloud import storage
-
     if file.content_type not in ALLOWED_CONTENT_TYPES:
         raise ValueError(f"Unsupported file type: {file.content_type}")
 
@@ -22,10 +22,9 @@ async def upload_image(file: UploadFile, folder: str = "images") -> str:
     ext = _extension_for(file.content_type)
     blob_name = f"{folder}/{uuid.uuid4().hex}{ext}"
 
-    client = storage.Client(project=GCS_PROJECT)
-    bucket = client.bucket(GCS_UPLOADS_BUCKET)
-    blob = bucket.blob(blob_name)
-    blob.upload_from_string(contents, content_type=file.content_type)
+    await gcs.upload_bytes(
+        GCS_UPLOADS_BUCKET, blob_name, contents, file.content_type, project=GCS_PROJECT
+    )
 
     return f"https://storage.googleapis.com/{GCS_UPLOADS_BUCKET}/{blob_name}"
 
@@ -0,0 +1,32 @@
+"""One-shot backfill for the rag_documents registry from existing Qdrant payloads.
+
+Delegates to app.services.rag.document_registry.rebuild, which scrolls each namespace
+once and replaces its registry rows. Safe to re-run — every run rebuilds from Qdrant.
+"""
+
+import asyncio
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.core.qdrant import close_qdrant, get_qdrant_client, init_qdrant
+from app.models.rag import RagNamespace
+from app.services.rag import document_registry
+
+
+async def main() -> None:
+    settings = get_settings()
+    await init_qdrant()
+    try:
+        client = get_qdrant_client()
+        async with AsyncSessionLocal() as db:
+            for namespace in RagNamespace:
+                count = await document_registry.rebuild(
+                    db, client, settings.qdrant_collection, namespace
+                )
+                print(f"{namespace.value}: registered {count} documents.")
+    finally:
+        await close_qdrant()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,354 @@
+"""Benchmark BHSA clause extraction against a generated Text-Fabric fixture corpus.
+
+Builds a small synthetic corpus with the real Text-Fabric API in a temporary directory
+(no network), prepares it the way the loader does, then times clauses/sec and peak
+traced memory for extract_passage, stream_book_clauses, the three BCD collection
+accumulators and collect_bhsa_data.
+
+    uv run python scripts/bench_bhsa.py             # compare against the baseline
+    uv run python scripts/bench_bhsa.py --update    # rewrite the baseline
+
+Exits non-zero when any benchmark's throughput falls more than --threshold below the
+baseline. Baselines are machine-specific: regenerate them on the machine you compare on.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from app.services.bhsa.lexicon import word_features
+from app.services.bhsa.passage import extract_passage
+from app.services.bhsa.structure import attach_structure, build_structure
+from app.services.book_context.generation.bhsa_collection import (
+    CommonNounsAcc,
+    EntitiesAcc,
+    SummaryAcc,
+    collect_bhsa_data,
+    common_nouns_build,
+    common_nouns_consume,
+    entities_build,
+    entities_consume,
+    summary_build,
+    summary_consume,
+    summary_start_chapter,
+)
+from app.services.book_context.generation.bhsa_stream import stream_book_clauses
+
+BOOK = "Ruth"
+DEFAULT_THRESHOLD = 0.25
+
+_WORD_FEATURES = (
+    "g_word_utf8",
+    "trailer_utf8",
+    "sp",
+    "pdp",
+    "lex",
+    "lex_utf8",
+    "gloss",
+    "vs",
+    "vt",
+    "nametype",
+)
+_VERBS = [
+    ("HLK[", "הלך", "walk"),
+    (">MR[", "אמר", "say"),
+    ("BW>[", "בוא", "come"),
+    ("CWB[", "שׁוב", "return"),
+    ("JCB[", "ישׁב", "sit"),
+    ("LQX[", "לקח", "take"),
+]
+_NOUNS = [
+    (">JC/", "אישׁ", "man"),
+    (">CH/", "אשׁה", "woman"),
+    ("FDH/", "שׂדה", "field"),
+    ("LXM/", "לחם", "bread"),
+    ("BJT/", "בית", "house"),
+    ("JWM/", "יום", "day"),
+    ("<JR/", "עיר", "town"),
+]
+_NAMES = [
+    ("NMJ/", "נעמי", "Naomi", "pers"),
+    ("RWT/", "רות", "Ruth", "pers"),
+    ("BT_LXM/", "בית לחם", "Bethlehem", "topo"),
+    ("MW>B/", "מואב", "Moab", "gens,topo"),
+]
+_CLAUSE_TYPES = ["Way0", "WayX", "NmCl", "xQtX", "Way0", "ZQtX"]
+
+
+@dataclass(frozen=True)
+class FixtureShape:
+    chapters: int = 20
+    verses_per_chapter: int = 30
+    clauses_per_verse: int = 3
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    name: str
+    clauses: int
+    seconds: float
+    clauses_per_second: float
+    peak_memory_bytes: int
+
+
+def build_fixture_corpus(dest: Path, shape: FixtureShape) -> Path:
+    from tf.convert.walker import CV
+    from tf.fabric import Fabric
+
+    tf_dir = dest / "tf"
+    cv = CV(Fabric(locations=str(tf_dir), silent="deep"), silent="deep")
+
+    def _word(**features: Any) -> None:
+        w = cv.slot()
+        cv.feature(w, g_word_utf8=features["lex_utf8"], trailer_utf8=" ", **features)
+
+    def _director(cv: Any) -> None:
+        book = cv.node("book")
+        cv.feature(book, book=BOOK)
+        n = 0
+        for ch in range(1, shape.chapters + 1):
+            chapter = cv.node("chapter")
+            cv.feature(chapter, book=BOOK, chapter=ch)
+            for v in range(1, shape.verses_per_chapter + 1):
+                verse = cv.node("verse")
+                cv.feature(verse, book=BOOK, chapter=ch, verse=v)
+                for _ in range(shape.clauses_per_verse):
+                    n += 1
+                    clause = cv.node("clause")
+                    cv.feature(clause, typ=_CLAUSE_TYPES[n % len(_CLAUSE_TYPES)])
+
+                    lex, utf8, gloss = _VERBS[n % len(_VERBS)]
+                    phrase = cv.node("phrase")
+                    cv.feature(phrase, function="Pred")
+                    _word(
+                        sp="verb",
+                        pdp="verb",
+                        lex=lex,
+                        lex_utf8=utf8,
+                        gloss=gloss,
+                        vs="qal",
+                        vt="wayq",
+                    )
+                    cv.terminate(phrase)
+
+                    lex, utf8, gloss, nametype = _NAMES[n % len(_NAMES)]
+                    phrase = cv.node("phrase")
+                    cv.feature(phrase, function="Subj")
+                    _word(
+                        sp="nmpr",
+                        pdp="nmpr",
+                        lex=lex,
+                        lex_utf8=utf8,
+                        gloss=gloss,
+                        nametype=nametype,
+                    )
+                    cv.terminate(phrase)
+
+                    phrase = cv.node("phrase")
+                    cv.feature(phrase, function="Objc" if n % 2 else "Cmpl")
+                    _word(sp="art", pdp="art", lex="H", lex_utf8="ה", gloss="the")
+                    for offset in (0, 3):
+                        lex, utf8, gloss = _NOUNS[(n + offset) % len(_NOUNS)]
+                        _word(sp="subs", pdp="subs", lex=lex, lex_utf8=utf8, gloss=gloss)
+                    cv.terminate(phrase)
+
+                    cv.terminate(clause)
+                cv.terminate(verse)
+            cv.terminate(chapter)
+        cv.terminate(book)
+
+    ok = cv.walk(
+        _director,
+        "word",
+        otext={
+            "sectionTypes": "book,chapter,verse",
+            "sectionFeatures": "book,chapter,verse",
+            "fmt:text-orig-full": "{g_word_utf8}{trailer_utf8}",
+        },
+        generic={"name": "BHSA benchmark fixture"},
+        intFeatures={"chapter", "verse"},
+        featureMeta={
+            name: {"description": f"fixture {name}"}
+            for name in ("book", "chapter", "verse", "typ", "function", *_WORD_FEATURES)
+        },
+        generateTf=True,
+    )
+    if not ok:
+        raise RuntimeError(f"Could not build the BHSA benchmark fixture in {tf_dir}")
+    return tf_dir
+
+
+def load_fixture_corpus(tf_dir: Path) -> Any:
+    from tf.fabric import Fabric
+
+    api = Fabric(locations=str(tf_dir), silent="deep").loadAll(silent="deep")
+    if not api:
+        raise RuntimeError(f"Could not load the BHSA benchmark fixture from {tf_dir}")
+    tf_api = SimpleNamespace(api=api)
+    attach_structure(tf_api, build_structure(tf_api))
+    word_features(api.F).preload(api.F.otype.s("word"))
+    return tf_api
+
+
+def _measure(name: str, run: Callable[[], int], repeat: int) -> BenchResult:
+    run()
+    best = float("inf")
+    clauses = 0
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        clauses = run()
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchResult(
+        name=name,
+        clauses=clauses,
+        seconds=best,
+        clauses_per_second=clauses / best if best > 0 else 0.0,
+        peak_memory_bytes=peak,
+    )
+
+
+def run_benchmarks(tf_api: Any, shape: FixtureShape, *, repeat: int = 3) -> list[BenchResult]:
+    refs = [f"{BOOK} {ch}:1-{shape.verses_per_chapter}" for ch in range(1, shape.chapters + 1)]
+
+    def _passages() -> int:
+        return sum(len(extract_passage(tf_api, ref)["clauses"]) for ref in refs)
+
+    def _stream() -> int:
+        return sum(len(c["clauses"]) for c in stream_book_clauses(tf_api, BOOK, shape.chapters))
+
+    chapters = list(stream_book_clauses(tf_api, BOOK, shape.chapters))
+    total = sum(len(c["clauses"]) for c in chapters)
+
+    def _summary() -> int:
+        acc = SummaryAcc()
+        for chapter in chapters:
+            summary_start_chapter(acc, chapter["chapter"])
+            for clause in chapter["clauses"]:
+                summary_consume(acc, chapter["chapter"], clause)
+        summary_build(acc)
+        return total
+
+    def _entities() -> int:
+        acc = EntitiesAcc()
+        for chapter in chapters:
+            for clause in chapter["clauses"]:
+                entities_consume(acc, chapter["chapter"], clause)
+        entities_build(acc)
+        return total
+
+    def _common_nouns() -> int:
+        acc = CommonNounsAcc(min_appearances=1)
+        for chapter in chapters:
+            for clause in chapter["clauses"]:
+                common_nouns_consume(acc, chapter["chapter"], clause)
+        common_nouns_build(acc)
+        return total
+
+    def _collect() -> int:
+        collect_bhsa_data(tf_api, BOOK, shape.chapters)
+        return total
+
+    return [
+        _measure("extract_passage", _passages, repeat),
+        _measure("stream_book_clauses", _stream, repeat),
+        _measure("summary_accumulator", _summary, repeat),
+        _measure("entities_accumulator", _entities, repeat),
+        _measure("common_nouns_accumulator", _common_nouns, repeat),
+        _measure("collect_bhsa_data", _collect, repeat),
+    ]
+
+
+def write_baseline(path: Path, shape: FixtureShape, results: list[BenchResult]) -> None:
+    data = {
+        "fixture": asdict(shape),
+        "results": {r.name: asdict(r) for r in results},
+    }
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def read_baseline(path: Path) -> tuple[FixtureShape, dict[str, dict[str, Any]]]:
+    data = json.loads(path.read_text())
+    return FixtureShape(**data["fixture"]), data["results"]
+
+
+def find_regressions(
+    results: list[BenchResult],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.name)
+        if expected is None:
+            continue
+        floor = expected["clauses_per_second"] * (1 - threshold)
+        if result.clauses_per_second < floor:
+            regressions.append(
+                f"{result.name}: {result.clauses_per_second:,.0f} clauses/s is below "
+                f"{floor:,.0f} ({threshold:.0%} under baseline "
+                f"{expected['clauses_per_second']:,.0f})"
+            )
+    return regressions
+
+
+DEFAULT_BASELINE = Path(__file__).with_name("bhsa_benchmark_baseline.json")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update", action="store_true", help="write results as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = None
+    shape = FixtureShape()
+    if args.baseline.exists() and not args.update:
+        shape, baseline = read_baseline(args.baseline)
+
+    with tempfile.TemporaryDirectory(prefix="bhsa-bench-") as tmp:
+        tf_api = load_fixture_corpus(build_fixture_corpus(Path(tmp), shape))
+        results = run_benchmarks(tf_api, shape, repeat=args.repeat)
+
+    for r in results:
+        print(
+            f"{r.name:<26} {r.clauses:>6} clauses  {r.clauses_per_second:>12,.0f} clauses/s  "
+            f"peak {r.peak_memory_bytes / 1024:>8,.0f} KiB"
+        )
+
+    if baseline is None:
+        write_baseline(args.baseline, shape, results)
+        print(f"Wrote baseline to {args.baseline}")
+        return
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        print("\nThroughput regressions:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.threshold:.0%} of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Benchmark RAG ingestion and retrieval offline with local embeddings and in-memory Qdrant.
+
+Generates synthetic markdown documents, splits them with the production splitter, embeds
+and upserts them through the same batched ingest path as uploads, then times retrieval.
+No network, API keys or database are needed.
+
+    uv run python scripts/bench_rag.py
+    uv run python scripts/bench_rag.py --documents 200 --queries 500 --hybrid
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import PointStruct
+
+from app.core.config import Settings
+from app.core.qdrant import MEMORY_LOCATION, SPARSE_VECTOR_NAME, create_collection
+from app.models.rag import RagNamespace
+from app.services.rag.embeddings import embeddings_for
+from app.services.rag.ingest import embed_and_upsert
+from app.services.rag.query import retrieve_context
+from app.services.rag.sparse import document_vector
+from app.services.rag.splitters import split_markdown
+
+NAMESPACE = RagNamespace.MEANING_MAP_DOCS
+_WORDS = [
+    "covenant",
+    "lament",
+    "remnant",
+    "exile",
+    "harvest",
+    "gleaner",
+    "kinsman",
+    "redeemer",
+    "threshing",
+    "floor",
+    "wilderness",
+    "tabernacle",
+    "priest",
+    "prophet",
+    "psalm",
+    "wisdom",
+    "proverb",
+    "judge",
+    "king",
+    "temple",
+    "boaz",
+    "naomi",
+    "ruth",
+    "moab",
+    "bethlehem",
+    "jerusalem",
+    "jordan",
+    "elijah",
+    "elisha",
+    "samuel",
+]
+
+
+def _document(rng: random.Random, sections: int) -> str:
+    return "\n\n".join(
+        f"## Section {s}\n\n" + " ".join(rng.choices(_WORDS, k=120)) for s in range(sections)
+    )
+
+
+async def main(documents: int, queries: int, dimensions: int, hybrid: bool) -> None:
+    settings = Settings(
+        database_url="sqlite+aiosqlite:///:memory:",
+        qdrant_url=MEMORY_LOCATION,
+        rag_embedding_provider="local",
+        rag_embedding_dimensions=dimensions,
+        rag_hybrid_search=hybrid,
+    )
+    rng = random.Random(0)
+    embeddings = embeddings_for(settings)
+    client = AsyncQdrantClient(location=MEMORY_LOCATION)
+    await create_collection(client, settings.qdrant_collection, settings)
+
+    chunks = [
+        chunk
+        for _ in range(documents)
+        for chunk in split_markdown(
+            _document(rng, sections=5), settings.rag_chunk_size, settings.rag_chunk_overlap
+        )
+    ]
+
+    def _point(position: int, vector: list[float]) -> PointStruct:
+        text = chunks[position].page_content
+        point_vector: dict = {"": vector}
+        if hybrid:
+            point_vector[SPARSE_VECTOR_NAME] = document_vector(text)
+        return PointStruct(
+            id=str(uuid.uuid4()),
+            vector=point_vector,
+            payload={"namespace": NAMESPACE.value, "text": text, "chunk_index": position},
+        )
+
+    started = time.perf_counter()
+    await embed_and_upsert(
+        client,
+        embeddings,
+        [chunk.page_content for chunk in chunks],
+        _point,
+        collection_name=settings.qdrant_collection,
+        batch_size=settings.rag_embed_batch_size,
+        concurrency=settings.rag_embed_concurrency,
+    )
+    ingest_seconds = time.perf_counter() - started
+
+    questions = [" ".join(rng.choices(_WORDS, k=6)) for _ in range(queries)]
+    started = time.perf_counter()
+    for question in questions:
+        await retrieve_context(
+            client, NAMESPACE, question, settings.rag_top_k, settings, embeddings
+        )
+    query_seconds = time.perf_counter() - started
+    await client.close()
+
+    print(
+        f"ingest: {len(chunks)} chunks in {ingest_seconds:.2f}s "
+        f"({len(chunks) / ingest_seconds:.0f} chunks/s)"
+    )
+    print(
+        f"query:  {queries} queries in {query_seconds:.2f}s "
+        f"({queries / query_seconds:.0f} queries/s, hybrid={hybrid})"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--hybrid", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.documents, args.queries, args.dimensions, args.hybrid))
@@ -0,0 +1,28 @@
+"""Build the precomputed BHSA clause index used by the BHSA loader.
+
+Loads Text-Fabric once, runs extract_clause over every clause in the corpus and writes
+the result to BHSA_INDEX_PATH (or the path given as the first argument). Point the
+backend at the file with BHSA_INDEX_PATH so passages and whole-book streams are served
+by slicing the index instead of walking Text-Fabric nodes.
+"""
+
+import sys
+
+from app.core.config import get_settings
+from app.services.bhsa import loader
+from app.services.bhsa.index import build_index
+
+
+def main() -> None:
+    settings = get_settings()
+    path = sys.argv[1] if len(sys.argv) > 1 else settings.bhsa_index_path
+    if not path:
+        sys.exit("Usage: build_bhsa_index.py <output path> (or set BHSA_INDEX_PATH)")
+
+    loader.load(settings=settings.model_copy(update={"bhsa_index_path": ""}))
+    count = build_index(loader._tf_api, path)
+    print(f"Done. Indexed {count} clauses into {path}.")
+
+
+if __name__ == "__main__":
+    main()
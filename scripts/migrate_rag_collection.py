@@ -0,0 +1,55 @@
+"""Rebuild the RAG Qdrant collection with the configured vector profile behind an alias.
+
+Creates a new physical collection (QDRANT_QUANTIZATION: none, scalar or binary; quantized
+profiles keep the original vectors on disk and rescore), copies every point with its
+vectors and payload, adding the BM25 sparse vector hybrid search needs to points that
+lack one, verifies the count, then points the collection alias at it in one atomic
+alias update.
+
+    uv run python scripts/migrate_rag_collection.py
+    QDRANT_QUANTIZATION=binary uv run python scripts/migrate_rag_collection.py --keep-old
+
+A plain collection cannot become an alias of the same name without being deleted first,
+so the first run leaves it serving and creates a new alias (<collection>_live, or
+--alias). Set QDRANT_COLLECTION (which otherwise defaults from ENV) to that alias and
+redeploy, then delete the old collection; later runs swap the alias atomically. Pause
+RAG uploads while it runs — writes made during the copy are not carried over.
+"""
+
+import argparse
+import asyncio
+
+from app.core.config import get_settings
+from app.core.qdrant import close_qdrant, get_qdrant_client, init_qdrant
+from app.services.rag.migrate_collection import migrate_collection
+
+
+async def main(batch_size: int, keep_old: bool, alias: str | None) -> None:
+    settings = get_settings()
+    await init_qdrant()
+    try:
+        result = await migrate_collection(
+            get_qdrant_client(), settings, batch_size=batch_size, keep_old=keep_old, alias=alias
+        )
+    finally:
+        await close_qdrant()
+    print(
+        f"Alias '{result.alias}' now points at '{result.target}' "
+        f"({result.points} points copied from {result.source or 'nothing'}"
+        f"{f', dropped {result.dropped}' if result.dropped else ''}; "
+        f"quantization={settings.qdrant_quantization})."
+    )
+    if result.alias != settings.qdrant_collection:
+        print(
+            f"Set QDRANT_COLLECTION={result.alias} and redeploy; '{result.source}' keeps "
+            "serving until then and can be deleted afterwards."
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--keep-old", action="store_true", help="keep the previous collection")
+    parser.add_argument("--alias", help="alias to create when migrating a plain collection")
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size, args.keep_old, args.alias))
@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+from typing import Any
+
+
+class _Feature:
+    def __init__(self, values: dict[int, Any]) -> None:
+        self._values = values
+
+    def v(self, node: int) -> Any:
+        return self._values.get(node)
+
+
+def make_fake_corpus() -> SimpleNamespace:
+    kinds: dict[int, str] = {}
+    children: dict[int, list[int]] = {}
+    sections: dict[int, tuple[Any, ...]] = {}
+    texts: dict[int, str] = {}
+    words: dict[str, dict[int, Any]] = {
+        k: {} for k in ("sp", "lex", "lex_utf8", "gloss", "pdp", "vs", "vt", "nametype")
+    }
+    clause_typ: dict[int, str] = {}
+    phrase_function: dict[int, str] = {}
+    counter = iter(range(1, 10_000))
+
+    def add(kind: str, parent: int | None = None) -> int:
+        node = next(counter)
+        kinds[node] = kind
+        children[node] = []
+        if parent is not None:
+            children[parent].append(node)
+        return node
+
+    def add_word(phrase: int, **feats: Any) -> None:
+        w = add("word", phrase)
+        for key, value in feats.items():
+            words[key][w] = value
+
+    book = add("book")
+    sections[book] = ("Ruth",)
+    layout = {1: [["Way0", "NmCl"], ["WayX"]], 2: [["xQtX", "Way0", "Way0"]]}
+    for ch_num, verses in layout.items():
+        chapter = add("chapter", book)
+        sections[chapter] = ("Ruth", ch_num)
+        for v_num, clause_types in enumerate(verses, start=1):
+            verse = add("verse", chapter)
+            sections[verse] = ("Ruth", ch_num, v_num)
+            for i, typ in enumerate(clause_types):
+                clause = add("clause", verse)
+                clause_typ[clause] = typ
+                texts[clause] = f"clause {ch_num}:{v_num}.{i}"
+                pred = add("phrase", clause)
+                phrase_function[pred] = "Pred"
+                add_word(
+                    pred,
+                    sp="verb",
+                    lex="HLK[",
+                    lex_utf8="הלך",
+                    gloss="walk",
+                    pdp="verb",
+                    vs="qal",
+                    vt="wayq",
+                )
+                subj = add("phrase", clause)
+                phrase_function[subj] = "Subj"
+                add_word(
+                    subj,
+                    sp="nmpr",
+                    lex="NMJ/",
+                    lex_utf8="נעמי",
+                    gloss="Naomi",
+                    pdp="nmpr",
+                    nametype="pers",
+                )
+                add_word(subj, sp="subs", lex=">JC/", lex_utf8="איש", gloss="man", pdp="subs")
+
+    by_section = {sec: node for node, sec in sections.items()}
+
+    def d(node: int, otype: str | None = None) -> list[int]:
+        found: list[int] = []
+        for child in children.get(node, []):
+            if otype is None or kinds[child] == otype:
+                found.append(child)
+            if kinds[child] != "word":
+                found.extend(c for c in d(child, otype) if c not in found)
+        return found
+
+    def node_from_section(section: tuple[Any, ...]) -> int:
+        if section not in by_section:
+            raise KeyError(section)
+        return by_section[section]
+
+    F = SimpleNamespace(
+        otype=SimpleNamespace(s=lambda kind: [n for n, k in kinds.items() if k == kind]),
+        typ=_Feature(clause_typ),
+        function=_Feature(phrase_function),
+        **{key: _Feature(values) for key, values in words.items()},
+    )
+    L = SimpleNamespace(d=d)
+    T = SimpleNamespace(
+        sectionFromNode=lambda n: sections[n],
+        nodeFromSection=node_from_section,
+        text=lambda n: texts.get(n, ""),
+    )
+    return SimpleNamespace(api=SimpleNamespace(F=F, L=L, T=T))
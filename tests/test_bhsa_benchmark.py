@@ -0,0 +1,69 @@
+from pathlib import Path
+
+import pytest
+
+from app.services.bhsa import structure
+from app.services.bhsa.passage import extract_passage
+from scripts.bench_bhsa import (
+    BenchResult,
+    FixtureShape,
+    build_fixture_corpus,
+    find_regressions,
+    load_fixture_corpus,
+    read_baseline,
+    run_benchmarks,
+    write_baseline,
+)
+
+
+def _result(name: str, rate: float) -> BenchResult:
+    return BenchResult(
+        name=name, clauses=100, seconds=100 / rate, clauses_per_second=rate, peak_memory_bytes=1
+    )
+
+
+def test_fixture_corpus_runs_every_benchmark(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(structure, "_current", None)
+    shape = FixtureShape(chapters=2, verses_per_chapter=3, clauses_per_verse=2)
+    tf_api = load_fixture_corpus(build_fixture_corpus(tmp_path, shape))
+
+    passage = extract_passage(tf_api, "Ruth 2:1-3")
+    assert len(passage["clauses"]) == 6
+    assert passage["clauses"][0]["names"]
+    assert passage["clauses"][0]["content_words"]
+
+    results = run_benchmarks(tf_api, shape, repeat=1)
+    assert [r.name for r in results] == [
+        "extract_passage",
+        "stream_book_clauses",
+        "summary_accumulator",
+        "entities_accumulator",
+        "common_nouns_accumulator",
+        "collect_bhsa_data",
+    ]
+    assert all(r.clauses == 12 and r.clauses_per_second > 0 for r in results)
+
+    baseline = tmp_path / "baseline.json"
+    write_baseline(baseline, shape, results)
+    read_shape, recorded = read_baseline(baseline)
+    assert read_shape == shape
+    assert set(recorded) == {r.name for r in results}
+
+
+def test_find_regressions_flags_only_drops_past_threshold() -> None:
+    baseline = {
+        "extract_passage": {"clauses_per_second": 1000.0},
+        "stream_book_clauses": {"clauses_per_second": 1000.0},
+    }
+    results = [
+        _result("extract_passage", 800.0),
+        _result("stream_book_clauses", 700.0),
+        _result("collect_bhsa_data", 1.0),
+    ]
+
+    regressions = find_regressions(results, baseline, threshold=0.25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("stream_book_clauses: 700 clauses/s")
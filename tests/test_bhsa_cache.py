@@ -0,0 +1,132 @@
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.services.bhsa import loader, structure
+from app.services.bhsa.cache import PassageCache
+from app.services.bhsa.passage import extract_passage
+from tests.bhsa_corpus import make_fake_corpus
+
+
+@pytest.fixture()
+def corpus() -> SimpleNamespace:
+    return make_fake_corpus()
+
+
+def test_cache_matches_uncached_extraction(corpus: SimpleNamespace) -> None:
+    cache = PassageCache()
+    for ref in ("Ruth 1:1", "Ruth 1:1-2", "Ruth 1:2-9", "Ruth 2:1"):
+        assert cache.fetch(corpus, ref) == extract_passage(corpus, ref)
+
+
+def test_cache_normalises_reference_before_lookup(corpus: SimpleNamespace) -> None:
+    cache = PassageCache()
+    cache.fetch(corpus, "Ruth 1:1-2")
+    cache.fetch(corpus, "ruth 1:1\u20132")
+
+    stats = cache.stats()
+    assert stats.passage_hits == 1
+    assert stats.passage_misses == 1
+
+
+def test_cache_reuses_verses_across_overlapping_ranges(corpus: SimpleNamespace) -> None:
+    calls: list[tuple[Any, ...]] = []
+    node_from_section = corpus.api.T.nodeFromSection
+
+    def _counting(section: tuple[Any, ...]) -> int:
+        calls.append(section)
+        return node_from_section(section)
+
+    corpus.api.T.nodeFromSection = _counting
+    cache = PassageCache()
+    cache.fetch(corpus, "Ruth 1:1")
+    cache.fetch(corpus, "Ruth 1:1-2")
+
+    assert calls == [("Ruth", 1, 1), ("Ruth", 1, 2)]
+    stats = cache.stats()
+    assert stats.verse_hits == 1
+    assert stats.verse_misses == 2
+
+
+def test_cache_returns_independent_copies(corpus: SimpleNamespace) -> None:
+    cache = PassageCache()
+    first = cache.fetch(corpus, "Ruth 1:1-2")
+    first["clauses"][0]["clause_id"] = 99
+    second = cache.fetch(corpus, "Ruth 1:2")
+
+    assert cache.fetch(corpus, "Ruth 1:1-2")["clauses"][0]["clause_id"] == 1
+    assert second["clauses"][0]["clause_id"] == 1
+
+
+def test_cache_copies_nested_clause_lists(corpus: SimpleNamespace) -> None:
+    cache = PassageCache()
+    clause = cache.fetch(corpus, "Ruth 1:1")["clauses"][0]
+    clause["names"].append("X")
+    clause["subjects"].clear()
+    clause["content_words"][0]["gloss"] = "edited"
+    clause["name_glosses"].clear()
+
+    assert cache.fetch(corpus, "Ruth 1:1") == extract_passage(corpus, "Ruth 1:1")
+
+
+def test_cache_respects_clause_budget(corpus: SimpleNamespace) -> None:
+    cache = PassageCache(passage_clauses=2, verse_clauses=2)
+    cache.fetch(corpus, "Ruth 1:1-2")
+
+    stats = cache.stats()
+    assert stats.cached_passages == 0
+    assert stats.cached_clauses <= 4
+
+
+def test_cache_missing_start_verse_raises(corpus: SimpleNamespace) -> None:
+    with pytest.raises(ValueError, match="Could not find Ruth 3:1"):
+        PassageCache().fetch(corpus, "Ruth 3:1-2")
+
+
+def test_force_reload_clears_cache(
+    monkeypatch: pytest.MonkeyPatch, corpus: SimpleNamespace
+) -> None:
+    cache = PassageCache()
+    monkeypatch.setattr(loader, "_passage_cache", cache)
+    monkeypatch.setattr(loader, "_is_loaded", True)
+    monkeypatch.setattr(loader, "_tf_api", corpus)
+    monkeypatch.setattr(loader, "_index", None)
+    monkeypatch.setattr(loader, "_load_text_fabric", lambda _settings: corpus)
+    monkeypatch.setattr(structure, "_current", None)
+    loader.fetch_passage("Ruth 1:1")
+    assert loader.get_cache_stats().cached_passages == 1
+
+    loader.load(force=True)
+
+    assert loader.get_cache_stats().cached_passages == 0
+    assert loader.get_cache_stats().passage_misses == 0
+
+
+def test_fetch_many_extracts_overlapping_verses_once(corpus: SimpleNamespace) -> None:
+    calls: list[tuple[Any, ...]] = []
+    node_from_section = corpus.api.T.nodeFromSection
+
+    def _counting(section: tuple[Any, ...]) -> int:
+        calls.append(section)
+        return node_from_section(section)
+
+    corpus.api.T.nodeFromSection = _counting
+    refs = ["Ruth 1:1-2", "Ruth 1:2", "Ruth 1:1", "Ruth 2:1"]
+    results = list(PassageCache(verse_clauses=1).fetch_many(corpus, refs))
+
+    assert [ref for ref, _, _ in results] == refs
+    for ref, passage, error in results:
+        assert error is None
+        assert passage == extract_passage(make_fake_corpus(), ref)
+    assert sorted(set(calls)) == sorted(calls)
+
+
+def test_fetch_many_reports_errors_per_reference(corpus: SimpleNamespace) -> None:
+    results = list(PassageCache().fetch_many(corpus, ["nonsense", "Ruth 3:1", "Ruth 2:1"]))
+
+    assert results[0][1] is None
+    assert "Could not parse" in (results[0][2] or "")
+    assert results[1][2] == "Could not find Ruth 3:1"
+    assert results[2][1] is not None
+    assert results[2][2] is None
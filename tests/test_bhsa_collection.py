@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from typing import Any
 
 import pytest
@@ -6,13 +8,14 @@ from app.services.book_context.generation import (
     bhsa_collection,
     bhsa_common_nouns,
     bhsa_entities,
+    bhsa_stream,
     bhsa_summary,
 )
 from app.services.book_context.generation.bhsa_collection import (
-    _CommonNounsAcc,
-    _EntitiesAcc,
+    CommonNounsAcc,
+    EntitiesAcc,
+    SummaryAcc,
     _min_appearances_for,
-    _SummaryAcc,
     collect_bhsa_data,
     common_nouns_build,
     common_nouns_consume,
@@ -88,7 +91,7 @@ def _cw(
 
 
 def test_summary_emits_chapter_header_with_clause_count() -> None:
-    acc = _SummaryAcc()
+    acc = SummaryAcc()
     summary_start_chapter(acc, 1)
     summary_consume(acc, 1, _clause(1, gloss="went out"))
     summary_consume(acc, 1, _clause(2, gloss="returned"))
@@ -99,7 +102,7 @@ def test_summary_emits_chapter_header_with_clause_count() -> None:
 
 
 def test_summary_aggregates_names_and_verbs() -> None:
-    acc = _SummaryAcc()
+    acc = SummaryAcc()
     summary_start_chapter(acc, 1)
     summary_consume(acc, 1, _clause(1, lemma="HLK", binyan="qal", tense="wayq", names=["Naomi"]))
     summary_consume(acc, 1, _clause(2, lemma="ŠWB", binyan="qal", tense="wayq"))
@@ -110,7 +113,7 @@ def test_summary_aggregates_names_and_verbs() -> None:
 
 
 def test_summary_resets_per_chapter() -> None:
-    acc = _SummaryAcc()
+    acc = SummaryAcc()
     summary_start_chapter(acc, 1)
     summary_consume(acc, 1, _clause(1, names=["Naomi"]))
     summary_start_chapter(acc, 2)
@@ -124,7 +127,7 @@ def test_summary_resets_per_chapter() -> None:
 
 
 def test_entities_aggregates_appearances() -> None:
-    acc = _EntitiesAcc()
+    acc = EntitiesAcc()
     entities_consume(
         acc,
         1,
@@ -146,19 +149,19 @@ def test_entities_aggregates_appearances() -> None:
 
 
 def test_entities_skips_mens_nametype() -> None:
-    acc = _EntitiesAcc()
+    acc = EntitiesAcc()
     entities_consume(acc, 1, _clause(1, names=["Foo"], name_types={"Foo": "mens"}))
     assert entities_build(acc) == []
 
 
 def test_common_nouns_filters_low_frequency() -> None:
-    acc = _CommonNounsAcc()
+    acc = CommonNounsAcc()
     common_nouns_consume(acc, 1, _clause(1, content_words=[_cw("rare", "subs", function="Subj")]))
     assert common_nouns_build(acc) == []
 
 
 def test_common_nouns_accepts_min_appearances_override() -> None:
-    acc = _CommonNounsAcc(min_appearances=1)
+    acc = CommonNounsAcc(min_appearances=1)
     common_nouns_consume(
         acc, 1, _clause(1, content_words=[_cw("איפה", "subs", gloss="ephah", function="Objc")])
     )
@@ -200,7 +203,7 @@ def test_collect_bhsa_data_uses_adaptive_threshold(monkeypatch: pytest.MonkeyPat
 
 
 def test_common_nouns_includes_verbs_with_any_function() -> None:
-    acc = _CommonNounsAcc()
+    acc = CommonNounsAcc()
     common_nouns_consume(acc, 1, _clause(1, content_words=[_cw("גאל", "verb", binyan="qal")]))
     common_nouns_consume(acc, 1, _clause(2, content_words=[_cw("גאל", "verb", binyan="qal")]))
     candidates = common_nouns_build(acc)
@@ -297,3 +300,79 @@ def test_collect_bhsa_data_matches_legacy_wrappers(
     assert combined.bhsa_summary == legacy_summary
     assert combined.bhsa_entities == legacy_entities
     assert combined.bhsa_common_nouns == legacy_common
+
+
+async def test_acollect_bhsa_data_matches_sync(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = [
+        {
+            "chapter": ch,
+            "verse_count": 1,
+            "clauses": [
+                _clause(
+                    1,
+                    gloss=f"chapter {ch}",
+                    names=["Naomi"],
+                    name_types={"Naomi": "pers"},
+                    content_words=[_cw("שדה", "subs", gloss="field", function="Cmpl")],
+                )
+            ],
+        }
+        for ch in range(1, 6)
+    ]
+    monkeypatch.setattr(bhsa_collection, "stream_book_clauses", _stream(payload))
+    monkeypatch.setattr(bhsa_stream, "stream_book_clauses", _stream(payload))
+
+    expected = collect_bhsa_data(None, "Ruth", 5)
+    result = await bhsa_collection.acollect_bhsa_data(None, "Ruth", 5)
+
+    assert result == expected
+
+
+async def test_astream_book_clauses_runs_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loop_thread = threading.get_ident()
+    producer_threads: set[int] = set()
+
+    def _fake_stream(_tf_api, _book_name, chapter_count):
+        for ch in range(1, chapter_count + 1):
+            producer_threads.add(threading.get_ident())
+            yield {"chapter": ch, "verse_count": 0, "clauses": []}
+
+    monkeypatch.setattr(bhsa_stream, "stream_book_clauses", _fake_stream)
+    chapters = [c["chapter"] async for c in bhsa_stream.astream_book_clauses(None, "Ruth", 4)]
+
+    assert chapters == [1, 2, 3, 4]
+    assert loop_thread not in producer_threads
+
+
+async def test_astream_book_clauses_applies_backpressure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    produced: list[int] = []
+
+    def _fake_stream(_tf_api, _book_name, chapter_count):
+        for ch in range(1, chapter_count + 1):
+            produced.append(ch)
+            yield {"chapter": ch, "verse_count": 0, "clauses": []}
+
+    monkeypatch.setattr(bhsa_stream, "stream_book_clauses", _fake_stream)
+    stream = bhsa_stream.astream_book_clauses(None, "Isaiah", 66, max_buffered_chapters=1)
+    first = await anext(stream)
+    await asyncio.sleep(0.05)
+
+    assert first["chapter"] == 1
+    assert len(produced) <= 3
+    await stream.aclose()
+    assert len(produced) < 66
+
+
+async def test_astream_book_clauses_propagates_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _failing_stream(_tf_api, _book_name, _chapter_count):
+        yield {"chapter": 1, "verse_count": 0, "clauses": []}
+        raise KeyError("broken section")
+
+    monkeypatch.setattr(bhsa_stream, "stream_book_clauses", _failing_stream)
+    with pytest.raises(KeyError, match="broken section"):
+        async for _ in bhsa_stream.astream_book_clauses(None, "Ruth", 2):
+            pass
@@ -0,0 +1,114 @@
+import base64
+from pathlib import Path
+from typing import Any
+
+import google_crc32c
+import pytest
+
+from app.services.bhsa.gcs_sync import MANIFEST_NAME, DownloadProgress, sync_prefix
+
+_PREFIX = "text-fabric-data/"
+
+
+def _crc(data: bytes) -> str:
+    return base64.b64encode(google_crc32c.Checksum(data).digest()).decode("ascii")
+
+
+class _FakeBlob:
+    def __init__(self, name: str, data: bytes, calls: list[tuple[str, int | None]]) -> None:
+        self.name = name
+        self.size = len(data)
+        self.crc32c = _crc(data)
+        self._data = data
+        self._calls = calls
+
+    def download_to_file(self, fh: Any, start: int | None = None, checksum: Any = None) -> None:
+        self._calls.append((self.name, start))
+        fh.write(self._data[start or 0 :])
+
+
+class _FakeBucket:
+    name = "bucket"
+
+    def __init__(self, files: dict[str, bytes]) -> None:
+        self.calls: list[tuple[str, int | None]] = []
+        self._blobs = {
+            _PREFIX + rel: _FakeBlob(_PREFIX + rel, data, self.calls) for rel, data in files.items()
+        }
+        self._blobs[_PREFIX + "github/"] = _FakeBlob(_PREFIX + "github/", b"", self.calls)
+
+    def list_blobs(self, prefix: str) -> list[_FakeBlob]:
+        return [b for name, b in self._blobs.items() if name.startswith(prefix)]
+
+    def blob(self, name: str) -> _FakeBlob:
+        return self._blobs[name]
+
+
+_FILES = {
+    "github/ETCBC/bhsa/tf/2021/otype.tf": b"otype" * 1000,
+    "github/ETCBC/bhsa/tf/2021/lex.tf": b"lex" * 500,
+    "github/ETCBC/bhsa/tf/2021/empty.tf": b"",
+}
+
+
+def _sync(bucket: _FakeBucket, dest: Path) -> tuple[int, DownloadProgress]:
+    progress = DownloadProgress()
+    count = sync_prefix(bucket, _PREFIX, dest, workers=4, progress=progress)
+    return count, progress
+
+
+def test_sync_downloads_every_file_and_reports_progress(tmp_path: Path) -> None:
+    bucket = _FakeBucket(_FILES)
+    count, progress = _sync(bucket, tmp_path)
+
+    assert count == 3
+    for rel, data in _FILES.items():
+        assert (tmp_path / rel).read_bytes() == data
+    assert progress.files_done == progress.files_total == 3
+    assert progress.bytes_done == progress.bytes_total == sum(len(d) for d in _FILES.values())
+    assert (tmp_path / MANIFEST_NAME).exists()
+
+
+def test_sync_skips_files_matching_manifest(tmp_path: Path) -> None:
+    _sync(_FakeBucket(_FILES), tmp_path)
+    bucket = _FakeBucket(_FILES)
+    count, _ = _sync(bucket, tmp_path)
+
+    assert count == 0
+    assert bucket.calls == []
+
+
+def test_sync_replaces_corrupted_file(tmp_path: Path) -> None:
+    _sync(_FakeBucket(_FILES), tmp_path)
+    target = tmp_path / "github/ETCBC/bhsa/tf/2021/lex.tf"
+    target.write_bytes(b"x" * len(_FILES["github/ETCBC/bhsa/tf/2021/lex.tf"]))
+
+    bucket = _FakeBucket(_FILES)
+    count, _ = _sync(bucket, tmp_path)
+
+    assert count == 1
+    assert target.read_bytes() == _FILES["github/ETCBC/bhsa/tf/2021/lex.tf"]
+
+
+def test_sync_resumes_partial_download(tmp_path: Path) -> None:
+    rel = "github/ETCBC/bhsa/tf/2021/otype.tf"
+    part = tmp_path / (rel + ".part")
+    part.parent.mkdir(parents=True)
+    part.write_bytes(_FILES[rel][:1200])
+
+    bucket = _FakeBucket(_FILES)
+    _, progress = _sync(bucket, tmp_path)
+
+    assert (_PREFIX + rel, 1200) in bucket.calls
+    assert (tmp_path / rel).read_bytes() == _FILES[rel]
+    assert not part.exists()
+    assert progress.bytes_done == progress.bytes_total
+
+
+def test_sync_rejects_checksum_mismatch(tmp_path: Path) -> None:
+    bucket = _FakeBucket(_FILES)
+    bucket.blob(_PREFIX + "github/ETCBC/bhsa/tf/2021/lex.tf").crc32c = _crc(b"other")
+
+    with pytest.raises(RuntimeError, match="CRC32C mismatch"):
+        _sync(bucket, tmp_path)
+    assert not (tmp_path / "github/ETCBC/bhsa/tf/2021/lex.tf").exists()
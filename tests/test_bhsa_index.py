@@ -0,0 +1,138 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.core.config import get_settings
+from app.services.bhsa import loader
+from app.services.bhsa.cache import PassageCache
+from app.services.bhsa.index import ClauseIndex, build_index, open_index
+from app.services.bhsa.passage import extract_passage
+from app.services.book_context.generation.bhsa_stream import stream_book_clauses
+from app.services.storage import gcs
+from tests.bhsa_corpus import make_fake_corpus
+
+
+@pytest.fixture()
+def corpus() -> SimpleNamespace:
+    return make_fake_corpus()
+
+
+@pytest.fixture()
+def index_path(tmp_path: Path, corpus: SimpleNamespace) -> Path:
+    path = tmp_path / "bhsa.idx"
+    assert build_index(corpus, path) == 6
+    return path
+
+
+def test_index_passage_matches_text_fabric_extraction(
+    corpus: SimpleNamespace, index_path: Path
+) -> None:
+    index = open_index(index_path)
+    for ref in ("Ruth 1:1", "Ruth 1:1-2", "Ruth 1:2-9", "Ruth 2:1"):
+        assert PassageCache().fetch(index, ref) == extract_passage(corpus, ref)
+
+
+def test_index_stream_matches_text_fabric_stream(corpus: SimpleNamespace, index_path: Path) -> None:
+    index = open_index(index_path)
+    expected = list(stream_book_clauses(corpus, "Ruth", 3))
+    assert list(stream_book_clauses(index, "Ruth", 3)) == expected
+    assert expected[2] == {"chapter": 3, "verse_count": 0, "clauses": []}
+
+
+def test_index_renumbers_clauses_per_slice(index_path: Path) -> None:
+    clauses = PassageCache().fetch(open_index(index_path), "Ruth 1:2")["clauses"]
+    assert [c["clause_id"] for c in clauses] == [1]
+    assert clauses[0]["chain_position"] == "initial"
+
+
+def test_index_missing_verse_raises(index_path: Path) -> None:
+    with pytest.raises(ValueError, match="Could not find Ruth 4:1"):
+        PassageCache().fetch(open_index(index_path), "Ruth 4:1-3")
+
+
+def test_index_rejects_foreign_file(tmp_path: Path) -> None:
+    path = tmp_path / "bogus.idx"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError, match="Not a BHSA clause index"):
+        open_index(path)
+
+
+def test_fetch_passage_prefers_index(
+    monkeypatch: pytest.MonkeyPatch, corpus: SimpleNamespace, index_path: Path
+) -> None:
+    index = open_index(index_path)
+    monkeypatch.setattr(loader, "_is_loaded", True)
+    monkeypatch.setattr(loader, "_tf_api", corpus)
+    monkeypatch.setattr(loader, "_index", index)
+    monkeypatch.setattr(loader, "_passage_cache", PassageCache())
+
+    assert isinstance(loader.get_clause_source(), ClauseIndex)
+    assert loader.fetch_passage("Ruth 1:1-2") == extract_passage(corpus, "Ruth 1:1-2")
+
+
+def test_index_only_load_skips_text_fabric(
+    monkeypatch: pytest.MonkeyPatch, corpus: SimpleNamespace, index_path: Path
+) -> None:
+    for name, value in (("_tf_api", None), ("_index", None), ("_is_loaded", False)):
+        monkeypatch.setattr(loader, name, value)
+    monkeypatch.setattr(loader, "_passage_cache", PassageCache())
+
+    def _no_text_fabric(_settings: Any) -> None:
+        raise AssertionError("Text-Fabric must not load in index-only mode")
+
+    monkeypatch.setattr(loader, "_load_text_fabric", _no_text_fabric)
+    settings = get_settings().model_copy(
+        update={"bhsa_index_path": str(index_path), "bhsa_index_only": True}
+    )
+    loader.load(settings=settings)
+
+    assert loader.get_status().is_loaded
+    assert loader.get_verse_counts("Ruth") == {1: 2, 2: 1}
+    assert loader.fetch_passage("Ruth 2:1") == extract_passage(corpus, "Ruth 2:1")
+
+
+def test_index_only_load_without_index_fails(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    for name, value in (("_tf_api", None), ("_index", None), ("_is_loaded", False)):
+        monkeypatch.setattr(loader, name, value)
+    settings = get_settings().model_copy(
+        update={
+            "bhsa_index_path": str(tmp_path / "missing.idx"),
+            "bhsa_index_only": True,
+            "gcs_bucket_name": "",
+        }
+    )
+
+    with pytest.raises(RuntimeError, match="BHSA_INDEX_ONLY requires"):
+        loader.load(settings=settings)
+    assert not loader.get_status().is_loaded
+
+
+def test_concurrent_index_downloads_do_not_share_a_temp_file(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    both_downloading = threading.Barrier(2, timeout=5)
+
+    def _download(filename: str) -> None:
+        Path(filename).write_bytes(b"index")
+        both_downloading.wait()
+
+    blob = SimpleNamespace(download_to_filename=_download)
+    bucket = SimpleNamespace(get_blob=lambda _name: blob)
+    monkeypatch.setattr(gcs, "get_bucket", lambda _name: bucket)
+    index_path = tmp_path / "bhsa.idx"
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        downloads = [
+            pool.submit(loader._download_index_from_gcs, "bucket", index_path) for _ in range(2)
+        ]
+        for download in downloads:
+            download.result()
+
+    assert index_path.read_bytes() == b"index"
+    assert [p.name for p in tmp_path.iterdir()] == ["bhsa.idx"]
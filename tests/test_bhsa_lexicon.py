@@ -0,0 +1,86 @@
+from typing import Any
+
+from app.services.bhsa.clause import extract_clause
+from app.services.bhsa.lexicon import WordFeatures, word_features
+from tests.bhsa_corpus import _Feature, make_fake_corpus
+
+
+class _CountingFeature:
+    def __init__(self, feature: Any) -> None:
+        self._feature = feature
+        self.calls = 0
+
+    def v(self, node: int) -> Any:
+        self.calls += 1
+        return self._feature.v(node)
+
+
+def _extract_all(tf_api: Any) -> list[dict[str, Any]]:
+    F, L, T = tf_api.api.F, tf_api.api.L, tf_api.api.T
+    return [
+        dict(extract_clause(c, 1, i, None, F, L, T))
+        for i, c in enumerate(F.otype.s("clause"), start=1)
+    ]
+
+
+def test_lexeme_features_are_interned_per_lex() -> None:
+    tf_api = make_fake_corpus()
+    F = tf_api.api.F
+    F.gloss = _CountingFeature(F.gloss)
+
+    clauses = _extract_all(tf_api)
+
+    assert len(clauses) == 6
+    assert F.gloss.calls == 3
+    first = clauses[0]
+    assert first["lemma"] == "הלך"
+    assert first["lemma_ascii"] == "HLK"
+    assert first["gloss"] == "walk Naomi man"
+    assert first["subjects"] == ["נעמי איש"]
+    assert first["names"] == ["נעמי"]
+    assert first["name_glosses"] == {"נעמי": "Naomi"}
+    assert first["name_types"] == {"נעמי": "pers"}
+    assert first["content_words"][0] == {
+        "lex_utf8": "הלך",
+        "lex": "HLK",
+        "sp": "verb",
+        "gloss": "walk",
+        "pdp": "verb",
+        "function": "Pred",
+        "binyan": "qal",
+        "tense": "wayq",
+    }
+
+
+def test_preload_builds_table_and_features_follow_the_loaded_corpus() -> None:
+    tf_api = make_fake_corpus()
+    F = tf_api.api.F
+
+    features = word_features(F)
+    assert features.preload(F.otype.s("word")) == 3
+    assert word_features(F) is features
+    assert word_features(make_fake_corpus().api.F) is not features
+
+
+def test_lexemes_are_not_interned_without_lex_utf8() -> None:
+    F = make_fake_corpus().api.F
+    del F.lex_utf8
+    features = WordFeatures(F)
+
+    words = F.otype.s("word")
+    assert features.preload(words) == 0
+    assert features.lexeme(words[0]).lemma == "HLK"
+    assert features.lexeme(words[0]).lex_utf8 is None
+
+
+def test_lexemes_sharing_lex_across_languages_are_kept_apart() -> None:
+    F = make_fake_corpus().api.F
+    F.lex = _Feature({1: "BR/", 2: "BR/"})
+    F.lex_utf8 = _Feature({1: "בר", 2: "בר"})
+    F.gloss = _Feature({1: "grain", 2: "son"})
+    F.language = _Feature({1: "Hebrew", 2: "Aramaic"})
+    features = WordFeatures(F)
+
+    assert features.preload([1, 2]) == 2
+    assert features.lexeme(1).gloss == "grain"
+    assert features.lexeme(2).gloss == "son"
@@ -0,0 +1,67 @@
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.services.bhsa import loader, structure
+from app.services.bhsa.cache import PassageCache
+from app.services.bhsa.passage import extract_passage
+from app.services.bhsa.structure import attach_structure, build_structure
+from app.services.book_context.generation.bhsa_stream import stream_book_clauses
+from tests.bhsa_corpus import make_fake_corpus
+
+
+@pytest.fixture()
+def corpus(monkeypatch: pytest.MonkeyPatch) -> Iterator[SimpleNamespace]:
+    monkeypatch.setattr(structure, "_current", None)
+    yield make_fake_corpus()
+
+
+def _forbid_probing(corpus: SimpleNamespace) -> None:
+    def _no_probe(section: tuple[Any, ...]) -> None:
+        raise AssertionError(f"unexpected nodeFromSection{section}")
+
+    corpus.api.T.nodeFromSection = _no_probe
+
+
+def test_build_structure_records_verses(corpus: SimpleNamespace) -> None:
+    ruth = build_structure(corpus)["Ruth"]
+
+    assert sorted(ruth) == [1, 2]
+    assert ruth[1].verse_count == 2
+    assert ruth[2].verse_count == 1
+    assert ruth[1].first_verse_node == ruth[1].verse_nodes[0]
+    assert ruth[2].verse_node(2) is None
+
+
+def test_passage_and_stream_use_structure_without_probing(corpus: SimpleNamespace) -> None:
+    expected_passage = extract_passage(corpus, "Ruth 1:1-5")
+    expected_stream = list(stream_book_clauses(corpus, "Ruth", 3))
+
+    attach_structure(corpus, build_structure(corpus))
+    _forbid_probing(corpus)
+
+    assert extract_passage(corpus, "Ruth 1:1-5") == expected_passage
+    assert list(stream_book_clauses(corpus, "Ruth", 3)) == expected_stream
+    assert PassageCache().fetch(corpus, "Ruth 1:1-5") == expected_passage
+    with pytest.raises(ValueError, match="Could not find Ruth 3:1"):
+        extract_passage(corpus, "Ruth 3:1")
+
+
+def test_structure_ignores_other_tf_api(corpus: SimpleNamespace) -> None:
+    attach_structure(corpus, build_structure(corpus))
+    assert structure.structure_for(make_fake_corpus()) is None
+
+
+def test_loader_verse_counts_come_from_structure(
+    monkeypatch: pytest.MonkeyPatch, corpus: SimpleNamespace
+) -> None:
+    attach_structure(corpus, build_structure(corpus))
+    corpus.api.F.otype.s = lambda _kind: pytest.fail("verse counts must not scan books")
+    monkeypatch.setattr(loader, "_is_loaded", True)
+    monkeypatch.setattr(loader, "_tf_api", corpus)
+    monkeypatch.setattr(loader, "_index", None)
+
+    assert loader.get_verse_counts("ruth") == {1: 2, 2: 1}
+    assert loader.get_book_structure("Ruth")[1].verse_count == 2
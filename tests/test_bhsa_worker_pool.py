@@ -0,0 +1,113 @@
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from app.core.config import get_settings
+from app.services.bhsa import worker_pool
+from app.services.bhsa.index import build_index
+from app.services.bhsa.passage import extract_passage
+from app.services.book_context.generation.bhsa_collection import collect_bhsa_data
+from tests.bhsa_corpus import make_fake_corpus
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for the worker pool"
+        time.sleep(0.05)
+
+
+def _exit_in_worker() -> str:
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return "in-process"
+
+
+def _start(index_path: Path | str) -> None:
+    update = {"bhsa_worker_processes": 1, "bhsa_index_path": str(index_path)}
+    worker_pool.start(get_settings().model_copy(update=update))
+
+
+@pytest.fixture()
+def worker_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[Path]:
+    index_path = tmp_path / "bhsa.idx"
+    build_index(make_fake_corpus(), index_path)
+    monkeypatch.setenv("BHSA_INDEX_PATH", str(index_path))
+    monkeypatch.setenv("GCS_BUCKET_NAME", "")
+    try:
+        yield index_path
+    finally:
+        worker_pool.shutdown()
+
+
+@pytest.fixture()
+def running_pool(worker_env: Path) -> None:
+    _start(worker_env)
+    _wait_for(worker_pool.is_running)
+
+
+def test_pool_disabled_by_default() -> None:
+    worker_pool.start(get_settings().model_copy(update={"bhsa_worker_processes": 0}))
+    assert not worker_pool.is_running()
+
+
+def test_pool_needs_an_index_unless_workers_load_the_corpus() -> None:
+    _start("")
+    assert worker_pool._pool is None
+
+
+def test_pool_is_not_ready_until_workers_load(worker_env: Path) -> None:
+    _start(worker_env)
+
+    assert not worker_pool.is_running()
+    _wait_for(worker_pool.is_running)
+
+
+def test_pool_is_not_started_when_the_index_is_missing(
+    caplog: pytest.LogCaptureFixture, worker_env: Path
+) -> None:
+    _start(worker_env.with_name("missing.idx"))
+
+    _wait_for(lambda: "index is not available" in caplog.text)
+    assert worker_pool._pool is None
+
+
+def test_pool_is_dropped_when_workers_fail_to_load(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch, worker_env: Path
+) -> None:
+    corrupt = worker_env.with_name("corrupt.idx")
+    corrupt.write_bytes(b"not an index")
+    monkeypatch.setenv("BHSA_INDEX_PATH", str(corrupt))
+    _start(corrupt)
+
+    _wait_for(lambda: "failed to load" in caplog.text)
+    assert worker_pool._pool is None
+    assert not worker_pool.is_running()
+
+
+async def test_broken_pool_is_rebuilt_and_job_runs_in_process(running_pool: None) -> None:
+    assert await worker_pool._submit(30, _exit_in_worker) == "in-process"
+
+    _wait_for(worker_pool.is_running)
+    assert await worker_pool.fetch_passage("Ruth 1:1") == extract_passage(
+        make_fake_corpus(), "Ruth 1:1"
+    )
+
+
+async def test_pool_runs_jobs_and_propagates_errors(running_pool: None) -> None:
+    corpus = make_fake_corpus()
+
+    assert worker_pool.is_running()
+    assert await worker_pool.fetch_passage("Ruth 1:1-2") == extract_passage(corpus, "Ruth 1:1-2")
+    assert await worker_pool.collect_bhsa("Ruth", 2) == collect_bhsa_data(corpus, "Ruth", 2)
+    with pytest.raises(ValueError, match="Could not find Ruth 9:1"):
+        await worker_pool.fetch_passage("Ruth 9:1")
+
+
+async def test_pool_enforces_job_timeout(running_pool: None) -> None:
+    with pytest.raises(TimeoutError):
+        await worker_pool._submit(0.05, time.sleep, 2)
@@ -80,6 +80,8 @@ def mock_settings():
         rag_chunk_size=200,
         rag_chunk_overlap=50,
         rag_top_k=3,
+        rag_hybrid_search=False,
+        qdrant_quantization="none",
     )
 
 
@@ -91,7 +93,7 @@ async def test_generate_raises_when_bhsa_not_loaded(mock_bhsa, mock_settings) ->
     )
 
     with pytest.raises(GenerationError, match="BHSA data is not loaded"):
-        await generate_meaning_map("Genesis 1:1-5", settings=mock_settings)
+        await generate_meaning_map(AsyncMock(), "Genesis 1:1-5", settings=mock_settings)
 
 
 @pytest.mark.asyncio
@@ -100,10 +102,12 @@ async def test_generate_raises_when_qdrant_client_none(mock_bhsa, mock_settings)
     mock_bhsa.get_status.return_value = BHSAStatus(
         is_loaded=True, is_loading=False, message="Ready"
     )
-    mock_bhsa.fetch_passage.return_value = FAKE_BHSA_DATA
+    mock_bhsa.afetch_passage = AsyncMock(return_value=FAKE_BHSA_DATA)
 
     with pytest.raises(GenerationError, match="RAG service is not available"):
-        await generate_meaning_map("Genesis 1:1-5", settings=mock_settings, qdrant_client=None)
+        await generate_meaning_map(
+            AsyncMock(), "Genesis 1:1-5", settings=mock_settings, qdrant_client=None
+        )
 
 
 @pytest.mark.asyncio
@@ -116,7 +120,7 @@ async def test_generate_raises_on_llm_failure(
     mock_bhsa.get_status.return_value = BHSAStatus(
         is_loaded=True, is_loading=False, message="Ready"
     )
-    mock_bhsa.fetch_passage.return_value = FAKE_BHSA_DATA
+    mock_bhsa.afetch_passage = AsyncMock(return_value=FAKE_BHSA_DATA)
 
     rag_result = MagicMock()
     rag_result.answer = "Use the Tripod Method for OBT."
@@ -130,7 +134,9 @@ async def test_generate_raises_on_llm_failure(
 
     qdrant = AsyncMock()
     with pytest.raises(GenerationError, match="LLM generation failed"):
-        await generate_meaning_map("Genesis 1:1-5", settings=mock_settings, qdrant_client=qdrant)
+        await generate_meaning_map(
+            AsyncMock(), "Genesis 1:1-5", settings=mock_settings, qdrant_client=qdrant
+        )
 
 
 @pytest.mark.asyncio
@@ -143,7 +149,7 @@ async def test_generate_meaning_map_success(
     mock_bhsa.get_status.return_value = BHSAStatus(
         is_loaded=True, is_loading=False, message="Ready"
     )
-    mock_bhsa.fetch_passage.return_value = FAKE_BHSA_DATA
+    mock_bhsa.afetch_passage = AsyncMock(return_value=FAKE_BHSA_DATA)
 
     rag_result = MagicMock()
     rag_result.answer = "Use the Tripod Method for OBT."
@@ -157,7 +163,7 @@ async def test_generate_meaning_map_success(
 
     qdrant = AsyncMock()
     result = await generate_meaning_map(
-        "Genesis 1:1-5", settings=mock_settings, qdrant_client=qdrant
+        AsyncMock(), "Genesis 1:1-5", settings=mock_settings, qdrant_client=qdrant
     )
     assert result == VALID_MAP
     mock_structured.ainvoke.assert_called_once()
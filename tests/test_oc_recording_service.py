@@ -1,4 +1,5 @@
 from datetime import UTC, datetime
+from unittest.mock import AsyncMock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -235,6 +236,32 @@ async def test_delete_recording(db_session: AsyncSession) -> None:
         await rs.get_recording(db_session, rec.id)
 
 
+@pytest.mark.asyncio
+async def test_delete_uploaded_recording_removes_the_blob(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rs = _import_service()
+    from app.services.oral_collector.gcs_utils import GCS_PUBLIC_BASE
+    from app.services.storage import gcs
+
+    delete_blob = AsyncMock()
+    monkeypatch.setattr(gcs, "delete_blob", delete_blob)
+    user = await make_user(db_session)
+    project_id = await _seed_project(db_session)
+    genre, sub = await _seed_genre(db_session)
+
+    rec = await _seed_recording(
+        db_session, user.id, project_id, genre.id, sub.id, upload_status=UploadStatus.UPLOADED
+    )
+    rec.gcs_url = f"{GCS_PUBLIC_BASE}oral-collector/rec.m4a"
+    await db_session.commit()
+    await rs.delete_recording(db_session, rec.id)
+
+    delete_blob.assert_awaited_once_with(
+        rs.GCS_OC_BUCKET, "oral-collector/rec.m4a", project=rs.GCS_OC_PROJECT
+    )
+
+
 @pytest.mark.asyncio
 async def test_list_recordings(db_session: AsyncSession) -> None:
     rs = _import_service()
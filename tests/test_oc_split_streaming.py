@@ -0,0 +1,213 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from app.inngest import audio_splitting
+from app.inngest.schemas import SplitRequestedPayload, SplitSegmentData
+from app.services.oral_collector import gcs_utils, split_service
+from app.services.storage import gcs
+
+
+class _ChunkedBody(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+@pytest.fixture()
+def mock_http(monkeypatch):
+    requests: list[httpx.Request] = []
+    body = [b"a" * 1000, b"b" * 500, b"c" * 2]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, stream=_ChunkedBody(body))
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    return requests, b"".join(body)
+
+
+async def test_download_audio_streams_to_disk(mock_http, tmp_path: Path) -> None:
+    requests, expected = mock_http
+    dest = tmp_path / "original.wav"
+
+    written = await split_service._download_audio("https://example.com/a.wav", dest)
+
+    assert written == len(expected)
+    assert dest.read_bytes() == expected
+    assert [str(r.url) for r in requests] == ["https://example.com/a.wav"]
+
+
+async def test_download_audio_raises_on_http_error(monkeypatch, tmp_path: Path) -> None:
+    real_client = httpx.AsyncClient
+    transport = httpx.MockTransport(lambda request: httpx.Response(404))
+    monkeypatch.setattr(
+        httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs)
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await split_service._download_audio("https://example.com/a.wav", tmp_path / "a.wav")
+
+
+async def test_upload_gcs_file_uses_resumable_chunks(monkeypatch, tmp_path: Path) -> None:
+    bucket = MagicMock()
+    monkeypatch.setattr(gcs, "get_bucket", MagicMock(return_value=bucket))
+    segment = tmp_path / "segment_0.wav"
+    segment.write_bytes(b"RIFF")
+
+    url = await gcs_utils.upload_gcs_file("oc/segment_0.wav", segment, "audio/wav")
+
+    bucket.blob.assert_called_once_with("oc/segment_0.wav", chunk_size=gcs_utils.UPLOAD_CHUNK_SIZE)
+    bucket.blob.return_value.upload_from_filename.assert_called_once_with(
+        str(segment), content_type="audio/wav"
+    )
+    assert url == f"{gcs_utils.GCS_PUBLIC_BASE}oc/segment_0.wav"
+
+
+def _segment(start: float, end: float, gain_db: float | None = None) -> SplitSegmentData:
+    return SplitSegmentData(
+        start_seconds=start, end_seconds=end, genre_id="g", subcategory_id="s", gain_db=gain_db
+    )
+
+
+def test_split_args_cut_every_segment_from_one_input() -> None:
+    cuts = [
+        (Path("/tmp/segment_0.m4a"), _segment(0.0, 12.5)),
+        (Path("/tmp/segment_1.m4a"), _segment(12.5, 30.0, gain_db=3.0)),
+        (Path("/tmp/segment_2.m4a"), _segment(30.0, 45.0, gain_db=0.0)),
+    ]
+
+    args = split_service._ffmpeg_split_args(Path("/tmp/original.m4a"), cuts)
+
+    assert args[:4] == ["ffmpeg", "-y", "-i", "/tmp/original.m4a"]
+    assert args.count("-i") == 1
+    assert args[4:] == [
+        "-ss", "0.0", "-to", "12.5", "-c", "copy", "/tmp/segment_0.m4a",
+        "-ss", "12.5", "-to", "30.0", "-af", "volume=3.0dB", "/tmp/segment_1.m4a",
+        "-ss", "30.0", "-to", "45.0", "-c", "copy", "/tmp/segment_2.m4a",
+    ]  # fmt: skip
+
+
+async def test_split_segments_runs_a_single_ffmpeg_process(monkeypatch) -> None:
+    proc = MagicMock(returncode=0)
+    proc.communicate = AsyncMock(return_value=(b"", b""))
+    spawn = AsyncMock(return_value=proc)
+    monkeypatch.setattr(split_service.asyncio, "create_subprocess_exec", spawn)
+    cuts = [(Path(f"/tmp/segment_{i}.wav"), _segment(i * 10.0, i * 10.0 + 10)) for i in range(30)]
+
+    await split_service._ffmpeg_split_segments(Path("/tmp/original.wav"), cuts)
+
+    spawn.assert_awaited_once()
+    assert spawn.await_args.args.count("-ss") == 30
+
+
+async def test_split_segments_raises_on_ffmpeg_failure(monkeypatch) -> None:
+    proc = MagicMock(returncode=1)
+    proc.communicate = AsyncMock(return_value=(b"", b"Invalid data"))
+    monkeypatch.setattr(
+        split_service.asyncio, "create_subprocess_exec", AsyncMock(return_value=proc)
+    )
+
+    with pytest.raises(RuntimeError, match="Invalid data"):
+        await split_service._ffmpeg_split_segments(
+            Path("/tmp/a.wav"), [(Path("/tmp/b.wav"), _segment(0, 1))]
+        )
+
+
+async def test_upload_segments_runs_a_bounded_pool_and_keeps_order(monkeypatch) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def fake_upload(blob_path: str, path: Path, content_type: str) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 if blob_path.endswith("0") else 0)
+        in_flight -= 1
+        return f"gs://{blob_path}"
+
+    monkeypatch.setattr(split_service, "upload_gcs_file", fake_upload)
+    uploads = [(f"blob-{i}", Path(f"/tmp/segment_{i}.wav")) for i in range(10)]
+
+    urls = await split_service._upload_segments(uploads, "audio/wav", concurrency=3)
+
+    assert urls == [f"gs://blob-{i}" for i in range(10)]
+    assert peak == 3
+
+
+async def test_upload_segments_cancels_pending_uploads_on_failure(monkeypatch) -> None:
+    started: list[str] = []
+
+    async def fake_upload(blob_path: str, path: Path, content_type: str) -> str:
+        started.append(blob_path)
+        if blob_path == "blob-0":
+            raise RuntimeError("gcs unavailable")
+        await asyncio.sleep(1)
+        return blob_path
+
+    monkeypatch.setattr(split_service, "upload_gcs_file", fake_upload)
+    uploads = [(f"blob-{i}", Path(f"/tmp/segment_{i}.wav")) for i in range(6)]
+
+    with pytest.raises(RuntimeError, match="gcs unavailable"):
+        await split_service._upload_segments(uploads, "audio/wav", concurrency=2)
+
+    assert len(started) < len(uploads)
+
+
+def test_cut_args_seek_the_source_before_opening_it() -> None:
+    args = split_service._ffmpeg_cut_args(
+        "https://example.com/a.m4a", Path("/tmp/segment_3.m4a"), _segment(90.0, 120.5, 2.0)
+    )
+
+    assert args == [
+        "ffmpeg", "-y", "-ss", "90.0", "-i", "https://example.com/a.m4a", "-t", "30.5",
+        "-af", "volume=2.0dB", "/tmp/segment_3.m4a",
+    ]  # fmt: skip
+
+
+def test_segment_ids_are_stable_per_run_and_index() -> None:
+    assert audio_splitting.segment_id("run-1", 0) == audio_splitting.segment_id("run-1", 0)
+    assert audio_splitting.segment_id("run-1", 0) != audio_splitting.segment_id("run-1", 1)
+    assert audio_splitting.segment_id("run-1", 0) != audio_splitting.segment_id("run-2", 0)
+
+
+async def test_split_segment_cuts_and_uploads_only_its_range(monkeypatch) -> None:
+    cuts: list[tuple[str, float, float]] = []
+
+    async def fake_cut(source: str, output_path: Path, seg: SplitSegmentData) -> None:
+        cuts.append((source, seg.start_seconds, seg.end_seconds))
+        output_path.write_bytes(b"x" * 42)
+
+    upload = AsyncMock(return_value="https://storage.example/seg.m4a")
+    monkeypatch.setattr(audio_splitting, "_ffmpeg_cut_segment", fake_cut)
+    monkeypatch.setattr(audio_splitting, "upload_gcs_file", upload)
+    payload = SplitRequestedPayload(
+        recording_id="rec-1",
+        user_id="user-1",
+        segments=[_segment(0.0, 10.0), _segment(10.0, 25.0)],
+        project_id="proj-1",
+        format="m4a",
+        title="Story",
+        recorded_at="2026-03-02T00:00:00+00:00",
+    )
+
+    result = await audio_splitting.split_segment("https://example.com/a.m4a", payload, 1, "seg-id")
+
+    assert cuts == [("https://example.com/a.m4a", 10.0, 25.0)]
+    assert result.id == "seg-id"
+    assert result.index == 1
+    assert result.duration_seconds == 15.0
+    assert result.file_size_bytes == 42
+    assert result.gcs_url == "https://storage.example/seg.m4a"
+    assert upload.await_args.args[2] == "audio/mp4"
@@ -0,0 +1,177 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.rag import RagDocument
+from app.models.rag import RagNamespace
+from app.services.rag import answer_cache
+from app.services.rag.query import query
+
+NAMESPACE = RagNamespace.MEANING_MAP_DOCS
+
+
+@pytest.fixture(autouse=True)
+def _clear_answers():
+    answer_cache.clear()
+    yield
+    answer_cache.clear()
+
+
+@pytest.fixture()
+def settings():
+    return SimpleNamespace(
+        qdrant_collection="meaning_map_test",
+        google_api_key="fake-key",
+        google_llm_model="gemini-3.1-pro-preview",
+        rag_top_k=3,
+        rag_hybrid_search=False,
+        qdrant_quantization="none",
+    )
+
+
+@pytest.fixture()
+def qdrant():
+    point = MagicMock()
+    point.payload = {"filename": "guide.md", "chunk_index": 0, "text": "Maps have three levels."}
+    point.score = 0.9
+    client = AsyncMock()
+    client.query_points = AsyncMock(return_value=MagicMock(points=[point]))
+    return client
+
+
+@pytest.fixture()
+def embeddings():
+    mock = AsyncMock()
+    mock.aembed_query = AsyncMock(return_value=[0.5] * 8)
+    return mock
+
+
+@pytest.fixture()
+def llm():
+    mock = AsyncMock()
+    mock.ainvoke = AsyncMock(return_value=MagicMock(content="Use three levels."))
+    return mock
+
+
+@pytest.fixture()
+def version(monkeypatch):
+    current = {"value": 4}
+
+    async def _get_version(_db, _namespace):
+        return current["value"]
+
+    monkeypatch.setattr(answer_cache, "get_version", _get_version)
+    return current
+
+
+async def _ask(qdrant, settings, embeddings, llm, question="How to map Ruth 1?", top_k=3):
+    return await query(
+        AsyncMock(),
+        qdrant,
+        NAMESPACE,
+        question,
+        top_k,
+        settings=settings,
+        embeddings=embeddings,
+        llm=llm,
+        use_cache=True,
+    )
+
+
+async def test_repeated_question_is_answered_from_cache(
+    qdrant, settings, embeddings, llm, version
+) -> None:
+    first = await _ask(qdrant, settings, embeddings, llm)
+    second = await _ask(qdrant, settings, embeddings, llm, question="how to map  ruth 1?")
+
+    assert second == first
+    llm.ainvoke.assert_awaited_once()
+    qdrant.query_points.assert_awaited_once()
+
+    await _ask(qdrant, settings, embeddings, llm, top_k=5)
+    assert llm.ainvoke.await_count == 2
+
+
+async def test_version_bump_invalidates_cached_answers(
+    qdrant, settings, embeddings, llm, version
+) -> None:
+    await _ask(qdrant, settings, embeddings, llm)
+    version["value"] += 1
+    await _ask(qdrant, settings, embeddings, llm)
+
+    assert llm.ainvoke.await_count == 2
+
+
+async def test_answers_without_sources_are_not_cached(settings, embeddings, llm, version) -> None:
+    empty = AsyncMock()
+    empty.query_points = AsyncMock(return_value=MagicMock(points=[]))
+
+    await _ask(empty, settings, embeddings, llm)
+    await _ask(empty, settings, embeddings, llm)
+
+    assert empty.query_points.await_count == 2
+
+
+async def test_bump_version_creates_and_increments_row(db_session: AsyncSession) -> None:
+    assert await answer_cache.get_version(db_session, NAMESPACE) == 0
+    assert await answer_cache.bump_version(db_session, NAMESPACE) == 1
+    assert await answer_cache.bump_version(db_session, NAMESPACE) == 2
+    assert await answer_cache.get_version(db_session, NAMESPACE) == 2
+
+
+async def test_bump_version_does_not_commit_the_callers_changes(
+    db_session: AsyncSession,
+) -> None:
+    db_session.add(
+        RagDocument(
+            doc_id="doc-1",
+            namespace=NAMESPACE.value,
+            filename="doc.md",
+            chunk_count=1,
+            uploaded_at=datetime.now(UTC),
+        )
+    )
+
+    assert await answer_cache.bump_version(db_session, NAMESPACE) == 1
+    await db_session.rollback()
+
+    assert await db_session.get(RagDocument, "doc-1") is None
+    assert await answer_cache.get_version(db_session, NAMESPACE) == 1
+
+
+async def test_upload_and_delete_bump_namespace_version(
+    db_session, monkeypatch, embeddings
+) -> None:
+    from app.services.rag.delete_document import delete_document
+    from app.services.rag.upload_document import upload_document
+
+    bump = AsyncMock(return_value=1)
+    monkeypatch.setattr(answer_cache, "bump_version", bump)
+    embeddings.aembed_documents = AsyncMock(side_effect=lambda texts: [[0.1] * 8 for _ in texts])
+    client = AsyncMock()
+    client.scroll = AsyncMock(return_value=([], None))
+    client.count = AsyncMock(return_value=SimpleNamespace(count=1))
+    settings = SimpleNamespace(
+        qdrant_collection="meaning_map_test",
+        rag_chunk_size=200,
+        rag_chunk_overlap=50,
+        rag_embed_batch_size=64,
+        rag_embed_concurrency=4,
+        rag_hybrid_search=False,
+    )
+
+    await upload_document(
+        db_session,
+        client,
+        NAMESPACE,
+        "guide.md",
+        "# Guide\n\nText.",
+        settings=settings,
+        embeddings=embeddings,
+    )
+    await delete_document(db_session, client, NAMESPACE, "doc-1", settings=settings)
+
+    assert bump.await_args_list == [((db_session, NAMESPACE),), ((db_session, NAMESPACE),)]
@@ -0,0 +1,122 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rag import RagNamespace
+from app.services.rag import document_registry
+from app.services.rag.list_documents import list_documents
+
+NAMESPACE = RagNamespace.MEANING_MAP_DOCS
+COLLECTION = "meaning_map_test"
+T0 = datetime(2026, 3, 2, tzinfo=UTC)
+
+
+async def _record(db: AsyncSession, doc_id: str, minutes: int, chunk_count: int = 2) -> None:
+    await document_registry.record_upload(
+        db,
+        NAMESPACE,
+        doc_id,
+        doc_key=None,
+        filename=f"{doc_id}.md",
+        chunk_count=chunk_count,
+        uploaded_at=T0 + timedelta(minutes=minutes),
+    )
+
+
+async def test_list_pages_through_documents_in_upload_order(db_session: AsyncSession) -> None:
+    for i, doc_id in enumerate(["doc-a", "doc-b", "doc-c", "doc-d", "doc-e"]):
+        await _record(db_session, doc_id, minutes=i // 2)
+
+    seen: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        page, cursor = await list_documents(db_session, NAMESPACE, cursor=cursor, limit=2)
+        seen.extend(d.doc_id for d in page)
+        pages += 1
+        if cursor is None:
+            break
+
+    assert seen == ["doc-a", "doc-b", "doc-c", "doc-d", "doc-e"]
+    assert pages == 3
+
+
+async def test_list_without_limit_returns_every_document(db_session: AsyncSession) -> None:
+    for i in range(60):
+        await _record(db_session, f"doc-{i:02d}", minutes=i)
+
+    documents, cursor = await list_documents(db_session, NAMESPACE)
+
+    assert len(documents) == 60
+    assert cursor is None
+
+
+async def test_reupload_updates_row_and_delete_returns_chunk_count(
+    db_session: AsyncSession,
+) -> None:
+    await _record(db_session, "doc-a", minutes=0, chunk_count=2)
+    await _record(db_session, "doc-a", minutes=5, chunk_count=7)
+
+    page, _ = await list_documents(db_session, NAMESPACE)
+    assert [(d.doc_id, d.chunk_count) for d in page] == [("doc-a", 7)]
+
+    assert await document_registry.record_delete(db_session, NAMESPACE, "doc-a") == 7
+    assert await document_registry.record_delete(db_session, NAMESPACE, "doc-a") is None
+    assert (await list_documents(db_session, NAMESPACE))[0] == []
+
+
+async def test_invalid_cursor_is_rejected(db_session: AsyncSession) -> None:
+    with pytest.raises(ValueError, match="Invalid document cursor"):
+        await list_documents(db_session, NAMESPACE, cursor="not-a-cursor")
+
+
+async def test_rebuild_replaces_rows_from_qdrant_payloads(db_session: AsyncSession) -> None:
+    await _record(db_session, "stale-doc", minutes=0)
+    client = AsyncQdrantClient(":memory:")
+    await client.create_collection(
+        collection_name=COLLECTION, vectors_config=VectorParams(size=2, distance=Distance.COSINE)
+    )
+    await client.upsert(
+        collection_name=COLLECTION,
+        points=[
+            PointStruct(
+                id=i,
+                vector=[1.0, 0.5],
+                payload={
+                    "namespace": NAMESPACE.value,
+                    "doc_id": doc_id,
+                    "filename": f"{doc_id}.md",
+                    "uploaded_at": T0.isoformat(),
+                },
+            )
+            for i, doc_id in enumerate(["doc-a", "doc-a", "doc-a", "doc-b"])
+        ],
+    )
+
+    rebuilt = await document_registry.rebuild(db_session, client, COLLECTION, NAMESPACE)
+    await client.close()
+
+    page, _ = await list_documents(db_session, NAMESPACE)
+    assert rebuilt == 2
+    assert {d.doc_id: d.chunk_count for d in page} == {"doc-a": 3, "doc-b": 1}
+
+
+async def test_clear_namespace_removes_all_rows(db_session: AsyncSession) -> None:
+    await _record(db_session, "doc-a", minutes=0)
+    await _record(db_session, "doc-b", minutes=1)
+
+    assert await document_registry.clear_namespace(db_session, NAMESPACE) == 2
+    assert (await list_documents(db_session, NAMESPACE))[0] == []
+
+
+async def test_registry_write_failures_are_logged_not_raised(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(db_session, "get", AsyncMock(side_effect=ConnectionError("db down")))
+
+    await _record(db_session, "doc-a", minutes=0)
+    assert await document_registry.record_delete(db_session, NAMESPACE, "doc-a") is None
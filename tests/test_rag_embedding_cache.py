@@ -0,0 +1,130 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.rag import RagDocument, RagEmbedding
+from app.services.rag import embedding_cache
+from app.services.rag.embedding_cache import CachedEmbeddings, text_hash
+
+MODEL = "gemini-embedding-001"
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    embedding_cache.clear()
+    yield
+    embedding_cache.clear()
+
+
+@pytest.fixture()
+def inner():
+    mock = AsyncMock()
+    mock.aembed_query = AsyncMock(side_effect=lambda text: [float(len(text)), 0.5])
+    mock.aembed_documents = AsyncMock(
+        side_effect=lambda texts: [[float(len(t)), 0.25] for t in texts]
+    )
+    return mock
+
+
+def test_text_hash_normalises_whitespace() -> None:
+    assert text_hash("How to  create\na map ") == text_hash("How to create a map")
+    assert text_hash("How to create a map") != text_hash("How to create a Map")
+
+
+async def test_repeated_query_skips_embedding_round_trip(inner) -> None:
+    embeddings = CachedEmbeddings(inner, MODEL, ttl_seconds=60)
+
+    first = await embeddings.aembed_query("How to create a Bible Meaning Map for Ruth 1:1-6")
+    second = await embeddings.aembed_query("How to create a Bible Meaning Map for  Ruth 1:1-6")
+
+    assert first == second
+    inner.aembed_query.assert_awaited_once()
+    stats = embedding_cache.get_stats()
+    assert (stats.memory_hits, stats.misses, stats.embedded_texts) == (1, 1, 1)
+
+
+async def test_documents_embed_only_unseen_unique_texts(inner) -> None:
+    embeddings = CachedEmbeddings(inner, MODEL, ttl_seconds=60)
+
+    await embeddings.aembed_documents(["alpha", "beta"])
+    vectors = await embeddings.aembed_documents(["beta", "gamma", "gamma"])
+
+    assert vectors == [[4.0, 0.25], [5.0, 0.25], [5.0, 0.25]]
+    assert inner.aembed_documents.await_args_list[-1].args == (["gamma"],)
+    assert embedding_cache.get_stats().embedded_chars == len("alphabetagamma")
+
+
+async def test_query_and_document_vectors_are_cached_separately(inner) -> None:
+    embeddings = CachedEmbeddings(inner, MODEL, ttl_seconds=60)
+
+    await embeddings.aembed_documents(["shared text"])
+    await embeddings.aembed_query("shared text")
+
+    inner.aembed_query.assert_awaited_once()
+
+
+async def test_postgres_tier_survives_process_cache_loss(inner, db_session: AsyncSession) -> None:
+    embeddings = CachedEmbeddings(inner, MODEL, ttl_seconds=60, db=db_session)
+    await embeddings.aembed_query("What is a pericope?")
+
+    embedding_cache.clear()
+    vector = await embeddings.aembed_query("What is a pericope?")
+
+    assert vector == [19.0, 0.5]
+    inner.aembed_query.assert_awaited_once()
+    assert embedding_cache.get_stats().db_hits == 1
+
+    other_model = CachedEmbeddings(inner, "text-embedding-005", ttl_seconds=60, db=db_session)
+    await other_model.aembed_query("What is a pericope?")
+    assert inner.aembed_query.await_count == 2
+
+
+async def test_expired_rows_are_re_embedded(inner, db_session: AsyncSession) -> None:
+    embeddings = CachedEmbeddings(inner, MODEL, ttl_seconds=60, db=db_session)
+    await embeddings.aembed_query("stale question")
+
+    await db_session.execute(
+        update(RagEmbedding).values(created_at=datetime.now(UTC) - timedelta(minutes=5))
+    )
+    await db_session.commit()
+    embedding_cache.clear()
+
+    await embeddings.aembed_query("stale question")
+
+    assert inner.aembed_query.await_count == 2
+    rows = (await db_session.execute(select(RagEmbedding))).scalars().all()
+    assert len(rows) == 1
+
+
+async def test_concurrent_batches_are_all_stored(inner, db_session: AsyncSession) -> None:
+    embeddings = CachedEmbeddings(inner, MODEL, ttl_seconds=60, db=db_session)
+
+    batches = [[f"chunk {b}-{i}" for i in range(3)] for b in range(4)]
+    await asyncio.gather(*(embeddings.aembed_documents(batch) for batch in batches))
+
+    rows = (await db_session.execute(select(RagEmbedding))).scalars().all()
+    assert len(rows) == 12
+
+
+async def test_cache_writes_leave_the_callers_transaction_alone(
+    inner, db_session: AsyncSession
+) -> None:
+    pending = RagDocument(
+        doc_id="doc-1",
+        namespace="meaning-map-docs",
+        filename="doc.md",
+        chunk_count=1,
+        uploaded_at=datetime.now(UTC),
+    )
+    db_session.add(pending)
+    embeddings = CachedEmbeddings(inner, MODEL, ttl_seconds=60, db=db_session)
+
+    await embeddings.aembed_documents(["chunk"])
+    await db_session.rollback()
+
+    assert (await db_session.execute(select(RagDocument))).scalars().all() == []
+    assert len((await db_session.execute(select(RagEmbedding))).scalars().all()) == 1
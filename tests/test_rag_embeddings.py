@@ -0,0 +1,91 @@
+import math
+from types import SimpleNamespace
+
+from app.core import qdrant as qdrant_module
+from app.models.rag import RagNamespace
+from app.services.rag.embedding_cache import CachedEmbeddings
+from app.services.rag.embeddings import HashingEmbeddings, embeddings_for
+from app.services.rag.query import retrieve_context
+from app.services.rag.upload_document import upload_document
+
+NAMESPACE = RagNamespace.MEANING_MAP_DOCS
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    return sum(x * y for x, y in zip(a, b, strict=True))
+
+
+def test_hashing_embeddings_are_deterministic_and_normalised() -> None:
+    embeddings = HashingEmbeddings(256)
+
+    first = embeddings.embed_query("The kinsman redeemer at the threshing floor")
+    second = HashingEmbeddings(256).embed_query("The kinsman redeemer at the threshing floor")
+
+    assert first == second
+    assert len(first) == 256
+    assert math.isclose(math.sqrt(sum(v * v for v in first)), 1.0)
+    assert embeddings.embed_query("") == [0.0] * 256
+
+
+def test_hashing_embeddings_rank_related_text_closer() -> None:
+    embeddings = HashingEmbeddings(512)
+    query = embeddings.embed_query("kinsman redeemer")
+    related, unrelated = embeddings.embed_documents(
+        ["Boaz acts as kinsman redeemer for Ruth.", "The temple was built in Jerusalem."]
+    )
+
+    assert _cosine(query, related) > _cosine(query, unrelated)
+
+
+def test_embeddings_for_selects_provider() -> None:
+    local = embeddings_for(
+        SimpleNamespace(rag_embedding_provider="local", rag_embedding_dimensions=64)
+    )
+    google = embeddings_for(
+        SimpleNamespace(
+            rag_embedding_provider="google",
+            google_embedding_model="gemini-embedding-001",
+            google_api_key="fake-key",
+            rag_embedding_cache_ttl_seconds=60,
+        )
+    )
+
+    assert isinstance(local, HashingEmbeddings) and local.dimensions == 64
+    assert isinstance(google, CachedEmbeddings)
+
+
+async def test_in_memory_qdrant_round_trip_with_local_embeddings(db_session, monkeypatch) -> None:
+    settings = SimpleNamespace(
+        env="development",
+        qdrant_collection="meaning_map_test",
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        qdrant_quantization="none",
+        rag_embedding_provider="local",
+        rag_embedding_dimensions=128,
+        rag_chunk_size=200,
+        rag_chunk_overlap=0,
+        rag_embed_batch_size=8,
+        rag_embed_concurrency=2,
+        rag_hybrid_search=False,
+    )
+    monkeypatch.setattr(qdrant_module, "get_settings", lambda: settings)
+
+    await qdrant_module.init_qdrant()
+    client = qdrant_module.get_qdrant_client()
+    try:
+        await upload_document(
+            db_session,
+            client,
+            NAMESPACE,
+            "ruth.md",
+            "## Harvest\n\nRuth gleans barley.\n\n## Redeemer\n\nBoaz is the kinsman redeemer.",
+            settings=settings,
+        )
+        sources, _ = await retrieve_context(
+            client, NAMESPACE, "Who is the kinsman redeemer?", 1, settings, embeddings_for(settings)
+        )
+    finally:
+        await qdrant_module.close_qdrant()
+
+    assert [s.text for s in sources] == ["Boaz is the kinsman redeemer."]
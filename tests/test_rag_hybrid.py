@@ -0,0 +1,172 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from app.core import qdrant as qdrant_module
+from app.core.qdrant import sparse_vectors_config
+from app.models.rag import RagNamespace, SourceChunk
+from app.services.rag.query import retrieve_context
+from app.services.rag.rerank import rerank
+from app.services.rag.sparse import document_vector, query_vector, tokenize
+from app.services.rag.upload_document import upload_document
+
+NAMESPACE = RagNamespace.MEANING_MAP_DOCS
+COLLECTION = "meaning_map_test"
+
+
+@pytest.fixture()
+def settings():
+    return SimpleNamespace(
+        qdrant_collection=COLLECTION,
+        rag_chunk_size=200,
+        rag_chunk_overlap=0,
+        rag_embed_batch_size=8,
+        rag_embed_concurrency=2,
+        rag_hybrid_search=True,
+        qdrant_quantization="none",
+        rag_rerank_candidates=10,
+    )
+
+
+@pytest.fixture()
+def embeddings():
+    mock = AsyncMock()
+    mock.aembed_documents = AsyncMock(side_effect=lambda texts: [[1.0, 0.0] for _ in texts])
+    mock.aembed_query = AsyncMock(return_value=[1.0, 0.0])
+    return mock
+
+
+@pytest.fixture()
+async def qdrant():
+    client = AsyncQdrantClient(":memory:")
+    await client.create_collection(
+        collection_name=COLLECTION,
+        vectors_config=VectorParams(size=2, distance=Distance.COSINE),
+        sparse_vectors_config=sparse_vectors_config(),
+    )
+    yield client
+    await client.close()
+
+
+def test_tokenize_folds_case_and_strips_hebrew_points() -> None:
+    assert tokenize("Hebrew בְּרֵאשִׁית and BARA") == ["hebrew", "בראשית", "and", "bara"]
+
+
+def test_document_vector_weights_repeated_terms_higher() -> None:
+    vector = document_vector("mishpat mishpat tsedaqah")
+    weights = dict(zip(vector.indices, vector.values, strict=True))
+    (mishpat,) = query_vector("mishpat").indices
+    (tsedaqah,) = query_vector("tsedaqah").indices
+
+    assert weights[mishpat] > weights[tsedaqah]
+    assert vector.indices == sorted(vector.indices)
+
+
+def test_rerank_prefers_chunks_covering_the_query() -> None:
+    candidates = [
+        SourceChunk(
+            filename="a.md", chunk_index=0, text="General notes on participants.", score=0.5
+        ),
+        SourceChunk(filename="b.md", chunk_index=0, text="The name Boaz of Bethlehem.", score=0.45),
+    ]
+
+    ranked = rerank("Boaz of Bethlehem", candidates, top_k=1)
+
+    assert [c.filename for c in ranked] == ["b.md"]
+
+
+async def test_hybrid_search_finds_exact_name_that_dense_search_ties(
+    db_session, qdrant, settings, embeddings
+) -> None:
+    sections = [
+        "## Participants\n\nThe gleaner works in the field during the harvest.",
+        "## Names\n\nNaomi calls herself Mara because the Almighty dealt bitterly.",
+        "## Places\n\nThe family travels from Moab back to the town at barley harvest.",
+    ]
+    for i, section in enumerate(sections):
+        await upload_document(
+            db_session,
+            qdrant,
+            NAMESPACE,
+            f"doc{i}.md",
+            section,
+            settings=settings,
+            embeddings=embeddings,
+        )
+
+    sources, context = await retrieve_context(
+        qdrant, NAMESPACE, "Why is she called Mara?", 1, settings, embeddings
+    )
+
+    assert [s.filename for s in sources] == ["doc1.md"]
+    assert "Mara" in context[0]
+
+
+async def test_reupload_adds_sparse_vectors_to_chunks_indexed_before_hybrid(
+    db_session, qdrant, settings, embeddings
+) -> None:
+    content = "## Names\n\nNaomi calls herself Mara because the Almighty dealt bitterly."
+    dense_only = SimpleNamespace(**{**vars(settings), "rag_hybrid_search": False})
+    await upload_document(
+        db_session,
+        qdrant,
+        NAMESPACE,
+        "names.md",
+        content,
+        doc_key="names",
+        settings=dense_only,
+        embeddings=embeddings,
+    )
+
+    result = await upload_document(
+        db_session,
+        qdrant,
+        NAMESPACE,
+        "names.md",
+        content,
+        doc_key="names",
+        settings=settings,
+        embeddings=embeddings,
+    )
+    points, _ = await qdrant.scroll(COLLECTION, with_vectors=True)
+
+    assert result.embedded_chunks == 0
+    assert [set(p.vector) for p in points] == [{"", "text-bm25"}]
+    assert embeddings.aembed_documents.await_count == 1
+
+
+async def test_startup_disables_hybrid_search_on_a_collection_without_sparse_vectors(
+    db_session, settings, embeddings
+) -> None:
+    client = AsyncQdrantClient(":memory:")
+    await client.create_collection(
+        collection_name=COLLECTION, vectors_config=VectorParams(size=2, distance=Distance.COSINE)
+    )
+    try:
+        await qdrant_module._check_hybrid_search(client, COLLECTION, settings)
+        await upload_document(
+            db_session,
+            client,
+            NAMESPACE,
+            "names.md",
+            "## Names\n\nNaomi calls herself Mara.",
+            settings=settings,
+            embeddings=embeddings,
+        )
+        sources, _ = await retrieve_context(client, NAMESPACE, "Mara", 1, settings, embeddings)
+    finally:
+        await client.close()
+
+    assert settings.rag_hybrid_search is False
+    assert [s.filename for s in sources] == ["names.md"]
+
+
+async def test_startup_keeps_hybrid_search_when_the_collection_supports_it(
+    qdrant, settings
+) -> None:
+    await qdrant_module._check_hybrid_search(qdrant, COLLECTION, settings)
+
+    assert settings.rag_hybrid_search is True
@@ -0,0 +1,126 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from qdrant_client.http.exceptions import UnexpectedResponse
+from qdrant_client.models import PointStruct
+
+from app.services.common import retry
+from app.services.rag.ingest import embed_and_upsert
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    monkeypatch.setattr(retry, "RETRY_BASE_DELAY", 0)
+
+
+def _point(idx: int, vector: list[float]) -> PointStruct:
+    return PointStruct(id=idx, vector=vector, payload={"chunk_index": idx})
+
+
+class _RateLimited(Exception):
+    code = 429
+
+
+def _qdrant_error(status_code: int) -> UnexpectedResponse:
+    return UnexpectedResponse(status_code, "error", b"{}", httpx.Headers())
+
+
+class _Embeddings:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.batches: list[list[str]] = []
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        if self.failures:
+            self.failures -= 1
+            raise _RateLimited("429 Resource exhausted")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.batches.append(texts)
+        return [[float(len(t))] for t in texts]
+
+
+async def _ingest(client, embeddings, texts, *, batch_size=3, concurrency=2) -> None:
+    await embed_and_upsert(
+        client,
+        embeddings,
+        texts,
+        _point,
+        collection_name="meaning_map_test",
+        batch_size=batch_size,
+        concurrency=concurrency,
+    )
+
+
+async def test_batches_are_upserted_without_waiting_then_barrier() -> None:
+    client = AsyncMock()
+    embeddings = _Embeddings()
+    texts = [f"chunk {i}" for i in range(10)]
+
+    await _ingest(client, embeddings, texts)
+
+    assert sorted(len(b) for b in embeddings.batches) == [1, 3, 3, 3]
+    assert embeddings.max_in_flight == 2
+    calls = client.upsert.await_args_list
+    assert [c.kwargs["wait"] for c in calls] == [False, False, False, True]
+    assert [p.id for p in calls[-1].kwargs["points"]] == [9]
+    assert sorted(p.id for c in calls for p in c.kwargs["points"]) == list(range(10))
+
+
+async def test_transient_embedding_failures_are_retried() -> None:
+    client = AsyncMock()
+    embeddings = _Embeddings(failures=2)
+
+    await _ingest(client, embeddings, ["a", "b"], batch_size=2)
+
+    assert embeddings.batches == [["a", "b"]]
+    client.upsert.assert_awaited_once()
+
+
+async def test_persistent_failure_is_raised() -> None:
+    client = AsyncMock()
+    client.upsert = AsyncMock(side_effect=_qdrant_error(503))
+
+    with pytest.raises(UnexpectedResponse, match="503"):
+        await _ingest(client, _Embeddings(), ["a", "b", "c", "d"], batch_size=2)
+
+    assert client.upsert.await_count == retry.MAX_RETRIES
+
+
+async def test_permanent_failure_is_raised_without_retrying() -> None:
+    client = AsyncMock()
+    client.upsert = AsyncMock(side_effect=_qdrant_error(400))
+
+    with pytest.raises(UnexpectedResponse, match="400"):
+        await _ingest(client, _Embeddings(), ["a", "b"], batch_size=2)
+
+    client.upsert.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    ("exc", "transient"),
+    [
+        (TimeoutError(), True),
+        (httpx.ConnectError("refused"), True),
+        (_RateLimited(), True),
+        (_qdrant_error(502), True),
+        (_qdrant_error(404), False),
+        (ValueError("bad input"), False),
+    ],
+)
+def test_only_transient_errors_are_retryable(exc: Exception, transient: bool) -> None:
+    assert retry.is_transient(exc) is transient
+
+
+async def test_empty_input_is_a_no_op() -> None:
+    client = AsyncMock()
+
+    await _ingest(client, _Embeddings(), [])
+
+    client.upsert.assert_not_awaited()
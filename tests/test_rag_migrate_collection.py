@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from app.core.config import Settings
+from app.core.qdrant import SPARSE_VECTOR_NAME, quantization_config, search_params
+from app.services.rag.migrate_collection import migrate_collection, resolve_collection
+
+COLLECTION = "meaning_map_test"
+ALIAS = f"{COLLECTION}_live"
+
+
+def _settings(quantization: str, collection: str = ALIAS) -> SimpleNamespace:
+    return SimpleNamespace(
+        qdrant_collection=collection,
+        qdrant_quantization=quantization,
+        qdrant_quantization_oversampling=2.0,
+        rag_embedding_dimensions=3072,
+    )
+
+
+@pytest.fixture()
+async def qdrant():
+    client = AsyncQdrantClient(":memory:")
+    await client.create_collection(
+        collection_name=COLLECTION,
+        vectors_config=VectorParams(size=3072, distance=Distance.COSINE),
+    )
+    await client.upsert(
+        collection_name=COLLECTION,
+        points=[
+            PointStruct(
+                id=i,
+                vector=[float(i + 1)] + [0.0] * 3071,
+                payload={"namespace": "meaning-map-docs", "chunk_index": i, "text": f"chunk {i}"},
+            )
+            for i in range(7)
+        ],
+    )
+    yield client
+    await client.close()
+
+
+def test_profiles_map_to_quantization_and_rescoring() -> None:
+    assert quantization_config(_settings("none")) is None
+    assert search_params(_settings("none")) is None
+    assert quantization_config(_settings("scalar")).scalar.type == "int8"
+    assert quantization_config(_settings("binary")).binary.always_ram is True
+    params = search_params(_settings("binary"))
+    assert params.quantization.rescore is True
+    assert params.quantization.oversampling == 2.0
+
+
+async def _first_migration(qdrant, quantization: str = "binary", **kwargs):
+    return await migrate_collection(
+        qdrant, _settings(quantization, COLLECTION), suffix="v1", **kwargs
+    )
+
+
+async def test_first_migration_keeps_the_plain_collection_serving(qdrant) -> None:
+    result = await _first_migration(qdrant, batch_size=3)
+
+    assert (result.source, result.alias, result.dropped) == (COLLECTION, ALIAS, None)
+    assert result.target == f"{ALIAS}_v1"
+    assert result.points == 7
+    assert await resolve_collection(qdrant, ALIAS) == f"{ALIAS}_v1"
+    assert await resolve_collection(qdrant, COLLECTION) == COLLECTION
+    assert (await qdrant.count(COLLECTION, exact=True)).count == 7
+    assert (await qdrant.count(ALIAS, exact=True)).count == 7
+    info = await qdrant.get_collection(f"{ALIAS}_v1")
+    assert info.config.params.vectors.on_disk is True
+    assert SPARSE_VECTOR_NAME in info.config.params.sparse_vectors
+    points, _ = await qdrant.scroll(ALIAS, limit=10, with_vectors=True)
+    assert all(set(p.vector) == {"", SPARSE_VECTOR_NAME} for p in points)
+
+
+async def test_later_migrations_swap_alias_and_drop_previous(qdrant) -> None:
+    await _first_migration(qdrant)
+    result = await migrate_collection(qdrant, _settings("scalar"), suffix="v2")
+
+    assert result.source == f"{ALIAS}_v1"
+    assert result.dropped == f"{ALIAS}_v1"
+    assert await resolve_collection(qdrant, ALIAS) == f"{ALIAS}_v2"
+    assert not await qdrant.collection_exists(f"{ALIAS}_v1")
+    points, _ = await qdrant.scroll(ALIAS, limit=10, with_vectors=True)
+    assert sorted(p.payload["chunk_index"] for p in points) == list(range(7))
+
+
+async def test_migration_can_keep_the_previous_collection(qdrant) -> None:
+    await _first_migration(qdrant, "none")
+    result = await migrate_collection(qdrant, _settings("scalar"), suffix="v2", keep_old=True)
+
+    assert result.dropped is None
+    assert await qdrant.collection_exists(f"{ALIAS}_v1")
+
+
+async def test_rerunning_the_first_migration_replaces_its_own_alias_target(qdrant) -> None:
+    await _first_migration(qdrant)
+    result = await migrate_collection(qdrant, _settings("scalar", COLLECTION), suffix="v2")
+
+    assert result.source == COLLECTION
+    assert result.dropped == f"{ALIAS}_v1"
+    assert await resolve_collection(qdrant, ALIAS) == f"{ALIAS}_v2"
+    assert await qdrant.collection_exists(COLLECTION)
+
+
+async def test_configured_alias_takes_over_from_the_plain_collection(
+    monkeypatch: pytest.MonkeyPatch, qdrant
+) -> None:
+    monkeypatch.delenv("QDRANT_COLLECTION", raising=False)
+    settings = Settings(qdrant_quantization="binary")
+    assert settings.qdrant_collection == COLLECTION
+    first = await migrate_collection(qdrant, settings, suffix="v1")
+
+    monkeypatch.setenv("QDRANT_COLLECTION", first.alias)
+    settings = Settings(qdrant_quantization="scalar")
+    second = await migrate_collection(qdrant, settings, suffix="v2")
+
+    assert settings.qdrant_collection == ALIAS
+    assert (second.source, second.alias, second.dropped) == (f"{ALIAS}_v1", ALIAS, f"{ALIAS}_v1")
+    assert await resolve_collection(qdrant, settings.qdrant_collection) == f"{ALIAS}_v2"
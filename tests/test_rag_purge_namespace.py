@@ -0,0 +1,121 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.rag import RagPurgeJob
+from app.models.rag import RagNamespace
+from app.services.rag import answer_cache, document_registry
+from app.services.rag.list_documents import list_documents
+from app.services.rag.purge_namespace import (
+    _STALE_AFTER,
+    begin_purge,
+    get_purge_status,
+    purge_namespace,
+)
+
+NAMESPACE = RagNamespace.MEANING_MAP_DOCS
+COLLECTION = "meaning_map_test"
+
+
+@pytest.fixture()
+def settings():
+    return SimpleNamespace(qdrant_collection=COLLECTION)
+
+
+@pytest.fixture()
+async def qdrant():
+    client = AsyncQdrantClient(":memory:")
+    await client.create_collection(
+        collection_name=COLLECTION, vectors_config=VectorParams(size=2, distance=Distance.COSINE)
+    )
+    await client.upsert(
+        collection_name=COLLECTION,
+        points=[
+            PointStruct(
+                id=i,
+                vector=[1.0, 0.5],
+                payload={"namespace": "other" if i % 5 == 0 else NAMESPACE.value},
+            )
+            for i in range(25)
+        ],
+    )
+    yield client
+    await client.close()
+
+
+async def test_purge_deletes_namespace_in_batches_and_reports_progress(
+    db_session, qdrant, settings
+) -> None:
+    for doc_id in ("doc-a", "doc-b", "doc-c"):
+        await document_registry.record_upload(
+            db_session,
+            NAMESPACE,
+            doc_id,
+            doc_key=None,
+            filename=f"{doc_id}.md",
+            chunk_count=1,
+            uploaded_at=datetime.now(UTC),
+        )
+    deletes = AsyncMock(wraps=qdrant.delete)
+    qdrant.delete = deletes
+
+    result = await purge_namespace(db_session, qdrant, NAMESPACE, settings=settings, batch_size=7)
+
+    assert result.status == "done"
+    assert result.total_chunks == 20
+    assert result.deleted_chunks == 20
+    assert result.deleted_documents == 3
+    assert deletes.await_count == 3
+    assert (await qdrant.count(COLLECTION, exact=True)).count == 5
+    assert await get_purge_status(db_session, NAMESPACE) == result
+    assert (await list_documents(db_session, NAMESPACE))[0] == []
+    assert await answer_cache.get_version(db_session, NAMESPACE) == 1
+
+
+async def test_purge_failure_is_reported(db_session, qdrant, settings) -> None:
+    qdrant.delete = AsyncMock(side_effect=RuntimeError("qdrant unavailable"))
+
+    result = await purge_namespace(db_session, qdrant, NAMESPACE, settings=settings)
+
+    assert result.status == "failed"
+    assert result.deleted_chunks == 0
+    assert "qdrant unavailable" in result.message
+    assert await get_purge_status(db_session, NAMESPACE) == result
+    assert await answer_cache.get_version(db_session, NAMESPACE) == 0
+
+
+async def test_begin_purge_refuses_while_running(db_session, test_engine) -> None:
+    assert (await get_purge_status(db_session, NAMESPACE)).status == "idle"
+
+    started = await begin_purge(db_session, NAMESPACE)
+
+    assert started is not None and started.status == "running"
+    # Another instance sees the running job through the database.
+    async with AsyncSession(test_engine) as other:
+        assert (await get_purge_status(other, NAMESPACE)).status == "running"
+        assert await begin_purge(other, NAMESPACE) is None
+
+
+async def test_begin_purge_reclaims_a_stale_job(db_session) -> None:
+    await begin_purge(db_session, NAMESPACE)
+    await db_session.execute(
+        update(RagPurgeJob).values(updated_at=datetime.now(UTC) - _STALE_AFTER * 2)
+    )
+    await db_session.commit()
+
+    assert await begin_purge(db_session, NAMESPACE) is not None
+
+
+async def test_begin_purge_restarts_a_finished_job(db_session, qdrant, settings) -> None:
+    await purge_namespace(db_session, qdrant, NAMESPACE, settings=settings)
+
+    restarted = await begin_purge(db_session, NAMESPACE)
+
+    assert restarted is not None and restarted.deleted_chunks == 0
+    assert await get_purge_status(db_session, NAMESPACE) == restarted
@@ -0,0 +1,149 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from app.models.rag import RagNamespace
+from app.services.rag.upload_document import document_id, upload_document
+
+NAMESPACE = RagNamespace.MEANING_MAP_DOCS
+COLLECTION = "meaning_map_test"
+
+
+@pytest.fixture()
+def settings():
+    return SimpleNamespace(
+        qdrant_collection=COLLECTION,
+        rag_chunk_size=120,
+        rag_chunk_overlap=0,
+        rag_embed_batch_size=4,
+        rag_embed_concurrency=2,
+        rag_hybrid_search=False,
+    )
+
+
+@pytest.fixture()
+async def qdrant():
+    client = AsyncQdrantClient(":memory:")
+    await client.create_collection(
+        collection_name=COLLECTION, vectors_config=VectorParams(size=4, distance=Distance.COSINE)
+    )
+    yield client
+    await client.close()
+
+
+@pytest.fixture()
+def embeddings():
+    mock = AsyncMock()
+    mock.aembed_documents = AsyncMock(
+        side_effect=lambda texts: [[float(len(t)), 1.0, 0.5, 0.25] for t in texts]
+    )
+    return mock
+
+
+def _guide(*sections: str) -> str:
+    return "\n\n".join(f"## Section {i}\n\n{body}" for i, body in enumerate(sections))
+
+
+async def _points(qdrant) -> dict[int, tuple[str, str]]:
+    points, _ = await qdrant.scroll(COLLECTION, limit=100, with_payload=True)
+    return {p.payload["chunk_index"]: (str(p.id), p.payload["text"]) for p in points}
+
+
+async def test_reupload_embeds_only_changed_chunks(
+    db_session, qdrant, settings, embeddings
+) -> None:
+    sections = [f"Paragraph {i} about the methodology of meaning maps." for i in range(6)]
+    first = await upload_document(
+        db_session,
+        qdrant,
+        NAMESPACE,
+        "guide.md",
+        _guide(*sections),
+        doc_key="methodology-guide",
+        settings=settings,
+        embeddings=embeddings,
+    )
+    before = await _points(qdrant)
+
+    sections[2] = "Paragraph 2 about the methodology of meaning maps, typo fixed."
+    second = await upload_document(
+        db_session,
+        qdrant,
+        NAMESPACE,
+        "guide.md",
+        _guide(*sections),
+        doc_key="methodology-guide",
+        settings=settings,
+        embeddings=embeddings,
+    )
+    after = await _points(qdrant)
+
+    assert first.doc_id == second.doc_id == document_id(NAMESPACE, "methodology-guide")
+    assert (first.embedded_chunks, first.chunk_count) == (6, 6)
+    assert (second.embedded_chunks, second.removed_chunks, second.chunk_count) == (1, 1, 6)
+    assert embeddings.aembed_documents.await_args_list[-1].args[0] == [after[2][1]]
+    assert len(after) == 6
+    assert all(after[i][0] == before[i][0] for i in (0, 1, 3, 4, 5))
+    assert after[2][0] != before[2][0]
+
+
+async def test_removed_and_reordered_chunks(db_session, qdrant, settings, embeddings) -> None:
+    sections = ["Alpha content here.", "Beta content here.", "Gamma content here."]
+    await upload_document(
+        db_session,
+        qdrant,
+        NAMESPACE,
+        "guide.md",
+        _guide(*sections),
+        doc_key="g",
+        settings=settings,
+        embeddings=embeddings,
+    )
+
+    result = await upload_document(
+        db_session,
+        qdrant,
+        NAMESPACE,
+        "guide-v2.md",
+        _guide("Gamma content here.", "Alpha content here."),
+        doc_key="g",
+        settings=settings,
+        embeddings=embeddings,
+    )
+    points, _ = await qdrant.scroll(COLLECTION, limit=100, with_payload=True)
+
+    assert (result.embedded_chunks, result.removed_chunks) == (0, 1)
+    by_index = {p.payload["chunk_index"]: p.payload for p in points}
+    assert by_index[0]["text"] == "Gamma content here."
+    assert by_index[0]["headers"] == {"h2": "Section 0"}
+    assert by_index[1]["text"] == "Alpha content here."
+    assert {p.payload["filename"] for p in points} == {"guide-v2.md"}
+
+
+async def test_upload_without_key_always_creates_a_new_document(
+    db_session, qdrant, settings, embeddings
+) -> None:
+    first = await upload_document(
+        db_session,
+        qdrant,
+        NAMESPACE,
+        "a.md",
+        "# A\n\nSame text.",
+        settings=settings,
+        embeddings=embeddings,
+    )
+    second = await upload_document(
+        db_session,
+        qdrant,
+        NAMESPACE,
+        "a.md",
+        "# A\n\nSame text.",
+        settings=settings,
+        embeddings=embeddings,
+    )
+
+    assert first.doc_id != second.doc_id
+    assert second.embedded_chunks == 1
@@ -6,7 +6,6 @@ import pytest
 
 from app.models.rag import RagNamespace
 from app.services.rag.delete_document import delete_document
-from app.services.rag.list_documents import list_documents
 from app.services.rag.query import query
 from app.services.rag.upload_document import upload_document
 
@@ -32,6 +31,10 @@ def settings():
         rag_chunk_size=200,
         rag_chunk_overlap=50,
         rag_top_k=3,
+        rag_embed_batch_size=64,
+        rag_embed_concurrency=4,
+        rag_hybrid_search=False,
+        qdrant_quantization="none",
     )
 
 
@@ -53,9 +56,10 @@ def llm():
 
 
 @pytest.mark.asyncio
-async def test_upload_splits_embeds_and_upserts(qdrant, settings, embeddings) -> None:
+async def test_upload_splits_embeds_and_upserts(db_session, qdrant, settings, embeddings) -> None:
     content = "# Title\n\n" + ("Lorem ipsum dolor sit amet. " * 30)
     result = await upload_document(
+        db_session,
         qdrant,
         NAMESPACE,
         "guide.md",
@@ -84,9 +88,10 @@ async def test_upload_splits_embeds_and_upserts(qdrant, settings, embeddings) ->
 
 
 @pytest.mark.asyncio
-async def test_upload_rejects_non_md(qdrant, settings) -> None:
+async def test_upload_rejects_non_md(db_session, qdrant, settings) -> None:
     with pytest.raises(ValueError, match=r"Only \.md files"):
         await upload_document(
+            db_session,
             qdrant,
             NAMESPACE,
             "readme.txt",
@@ -96,9 +101,10 @@ async def test_upload_rejects_non_md(qdrant, settings) -> None:
 
 
 @pytest.mark.asyncio
-async def test_upload_rejects_empty_content(qdrant, settings, embeddings) -> None:
+async def test_upload_rejects_empty_content(db_session, qdrant, settings, embeddings) -> None:
     with pytest.raises(ValueError, match="empty"):
         await upload_document(
+            db_session,
             qdrant,
             NAMESPACE,
             "empty.md",
@@ -109,7 +115,9 @@ async def test_upload_rejects_empty_content(qdrant, settings, embeddings) -> Non
 
 
 @pytest.mark.asyncio
-async def test_query_returns_answer_and_sources(qdrant, settings, embeddings, llm) -> None:
+async def test_query_returns_answer_and_sources(
+    db_session, qdrant, settings, embeddings, llm
+) -> None:
     point = MagicMock()
     point.payload = {
         "namespace": "meaning-map-docs",
@@ -124,6 +132,7 @@ async def test_query_returns_answer_and_sources(qdrant, settings, embeddings, ll
     qdrant.query_points = AsyncMock(return_value=result_obj)
 
     result = await query(
+        db_session,
         qdrant,
         NAMESPACE,
         "What stack?",
@@ -144,12 +153,15 @@ async def test_query_returns_answer_and_sources(qdrant, settings, embeddings, ll
 
 
 @pytest.mark.asyncio
-async def test_query_empty_collection_returns_fallback(qdrant, settings, embeddings) -> None:
+async def test_query_empty_collection_returns_fallback(
+    db_session, qdrant, settings, embeddings
+) -> None:
     result_obj = MagicMock()
     result_obj.points = []
     qdrant.query_points = AsyncMock(return_value=result_obj)
 
     result = await query(
+        db_session,
         qdrant,
         NAMESPACE,
         "Any question?",
@@ -162,14 +174,18 @@ async def test_query_empty_collection_returns_fallback(qdrant, settings, embeddi
 
 
 @pytest.mark.asyncio
-async def test_delete_filters_by_namespace_and_doc_id(qdrant, settings) -> None:
-    mock_points = [MagicMock() for _ in range(3)]
-    qdrant.scroll = AsyncMock(return_value=(mock_points, None))
+async def test_delete_counts_exactly_and_filters_by_namespace_and_doc_id(
+    db_session, qdrant, settings
+) -> None:
+    qdrant.count = AsyncMock(return_value=SimpleNamespace(count=12_345))
+    qdrant.scroll = AsyncMock()
 
     doc_id = str(uuid.uuid4())
-    deleted = await delete_document(qdrant, NAMESPACE, doc_id, settings=settings)
+    deleted = await delete_document(db_session, qdrant, NAMESPACE, doc_id, settings=settings)
 
-    assert deleted == 3
+    assert deleted == 12_345
+    assert qdrant.count.call_args.kwargs["exact"] is True
+    qdrant.scroll.assert_not_called()
     qdrant.delete.assert_called_once()
 
     selector = qdrant.delete.call_args.kwargs["points_selector"]
@@ -179,45 +195,11 @@ async def test_delete_filters_by_namespace_and_doc_id(qdrant, settings) -> None:
 
 
 @pytest.mark.asyncio
-async def test_delete_returns_zero_when_not_found(qdrant, settings) -> None:
-    qdrant.scroll = AsyncMock(return_value=([], None))
+async def test_delete_returns_zero_when_not_found(db_session, qdrant, settings) -> None:
+    qdrant.count = AsyncMock(return_value=SimpleNamespace(count=0))
 
-    deleted = await delete_document(qdrant, NAMESPACE, str(uuid.uuid4()), settings=settings)
+    deleted = await delete_document(
+        db_session, qdrant, NAMESPACE, str(uuid.uuid4()), settings=settings
+    )
     assert deleted == 0
-
-
-@pytest.mark.asyncio
-async def test_list_groups_by_doc_id(qdrant, settings) -> None:
-    doc_id_a = str(uuid.uuid4())
-    doc_id_b = str(uuid.uuid4())
-
-    points = []
-    for doc_id, filename, count in [(doc_id_a, "a.md", 3), (doc_id_b, "b.md", 2)]:
-        for i in range(count):
-            p = MagicMock()
-            p.payload = {
-                "doc_id": doc_id,
-                "filename": filename,
-                "namespace": "meaning-map-docs",
-                "uploaded_at": "2026-03-02T00:00:00+00:00",
-                "chunk_index": i,
-            }
-            points.append(p)
-
-    qdrant.scroll = AsyncMock(return_value=(points, None))
-
-    result = await list_documents(qdrant, NAMESPACE, settings=settings)
-
-    assert len(result) == 2
-    by_id = {d.doc_id: d for d in result}
-    assert by_id[doc_id_a].chunk_count == 3
-    assert by_id[doc_id_a].filename == "a.md"
-    assert by_id[doc_id_b].chunk_count == 2
-
-
-@pytest.mark.asyncio
-async def test_list_empty_namespace(qdrant, settings) -> None:
-    qdrant.scroll = AsyncMock(return_value=([], None))
-
-    result = await list_documents(qdrant, NAMESPACE, settings=settings)
-    assert result == []
+    qdrant.delete.assert_not_called()
@@ -0,0 +1,164 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.rag import RagNamespace
+from app.services.rag import answer_cache
+from app.services.rag.stream_query import stream_query
+
+NAMESPACE = RagNamespace.MEANING_MAP_DOCS
+
+
+class _StreamingLLM:
+    def __init__(self, chunks, fail_after=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.calls = 0
+
+    async def astream(self, prompt):
+        self.calls += 1
+        for i, content in enumerate(self.chunks):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("quota exceeded")
+            yield SimpleNamespace(content=content)
+
+
+@pytest.fixture(autouse=True)
+def _clear_answers():
+    answer_cache.clear()
+    yield
+    answer_cache.clear()
+
+
+@pytest.fixture()
+def settings():
+    return SimpleNamespace(
+        qdrant_collection="meaning_map_test",
+        rag_top_k=3,
+        rag_hybrid_search=False,
+        qdrant_quantization="none",
+    )
+
+
+@pytest.fixture()
+def qdrant():
+    point = MagicMock()
+    point.payload = {"filename": "guide.md", "chunk_index": 2, "text": "Level 1 is the arc."}
+    point.score = 0.8
+    client = AsyncMock()
+    client.query_points = AsyncMock(return_value=MagicMock(points=[point]))
+    return client
+
+
+@pytest.fixture()
+def embeddings():
+    mock = AsyncMock()
+    mock.aembed_query = AsyncMock(return_value=[0.5] * 8)
+    return mock
+
+
+async def _collect(events):
+    return [(name, data) async for name, data in events]
+
+
+async def test_sources_are_sent_before_answer_tokens(
+    db_session, qdrant, settings, embeddings
+) -> None:
+    llm = _StreamingLLM(["Level 1 ", [{"text": "is the "}, "arc."], ""])
+
+    events = await _collect(
+        stream_query(
+            db_session,
+            qdrant,
+            NAMESPACE,
+            "What is level 1?",
+            settings=settings,
+            embeddings=embeddings,
+            llm=llm,
+        )
+    )
+
+    assert [name for name, _ in events] == ["sources", "token", "token", "done"]
+    assert events[0][1].sources[0].chunk_index == 2
+    assert [data.text for name, data in events if name == "token"] == ["Level 1 ", "is the arc."]
+    assert events[-1][1].answer == "Level 1 is the arc."
+
+
+async def test_empty_retrieval_streams_fallback_answer(db_session, settings, embeddings) -> None:
+    client = AsyncMock()
+    client.query_points = AsyncMock(return_value=MagicMock(points=[]))
+    llm = _StreamingLLM(["unused"])
+
+    events = await _collect(
+        stream_query(
+            db_session,
+            client,
+            NAMESPACE,
+            "Anything?",
+            settings=settings,
+            embeddings=embeddings,
+            llm=llm,
+        )
+    )
+
+    assert [name for name, _ in events] == ["sources", "token", "done"]
+    assert events[-1][1].sources == []
+    assert llm.calls == 0
+
+
+async def test_generation_failure_ends_stream_with_error(
+    db_session, qdrant, settings, embeddings
+) -> None:
+    llm = _StreamingLLM(["partial", "never"], fail_after=1)
+
+    events = await _collect(
+        stream_query(
+            db_session,
+            qdrant,
+            NAMESPACE,
+            "What is level 1?",
+            settings=settings,
+            embeddings=embeddings,
+            llm=llm,
+        )
+    )
+
+    assert [name for name, _ in events] == ["sources", "token", "error"]
+    assert "quota exceeded" in events[-1][1].detail
+
+
+async def test_streamed_answer_is_cached_for_the_namespace_version(
+    db_session, qdrant, settings, embeddings, monkeypatch
+) -> None:
+    monkeypatch.setattr(answer_cache, "get_version", AsyncMock(return_value=7))
+    llm = _StreamingLLM(["Level 1 ", "is the arc."])
+
+    await _collect(
+        stream_query(
+            db_session,
+            qdrant,
+            NAMESPACE,
+            "What is level 1?",
+            settings=settings,
+            embeddings=embeddings,
+            llm=llm,
+            use_cache=True,
+        )
+    )
+    replay = await _collect(
+        stream_query(
+            db_session,
+            qdrant,
+            NAMESPACE,
+            "What is level 1?",
+            settings=settings,
+            embeddings=embeddings,
+            llm=llm,
+            use_cache=True,
+        )
+    )
+
+    assert llm.calls == 1
+    assert [name for name, _ in replay] == ["sources", "token", "done"]
+    assert replay[1][1].text == "Level 1 is the arc."
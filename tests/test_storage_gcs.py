@@ -0,0 +1,63 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.storage import gcs
+
+
+@pytest.fixture(autouse=True)
+def fake_clients(monkeypatch):
+    created: list[str | None] = []
+
+    def new_client(project: str | None) -> MagicMock:
+        created.append(project)
+        return MagicMock(name=f"client-{project}")
+
+    monkeypatch.setattr(gcs, "_new_client", new_client)
+    gcs.shutdown()
+    yield created
+    gcs.shutdown()
+
+
+def test_client_is_shared_per_project(fake_clients) -> None:
+    first = gcs.get_client("proj-a")
+
+    assert gcs.get_client("proj-a") is first
+    assert gcs.get_client("proj-b") is not first
+    assert gcs.get_client() is gcs.get_client(None)
+    assert fake_clients == ["proj-a", "proj-b", None]
+
+
+async def test_blocking_calls_run_on_the_gcs_executor() -> None:
+    thread_name = await gcs.run(lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("gcs")
+    assert thread_name != threading.current_thread().name
+
+
+async def test_upload_bytes_and_copy_use_the_shared_bucket() -> None:
+    bucket = gcs.get_bucket("bucket", "proj")
+
+    await gcs.upload_bytes("bucket", "a/b.png", b"png", "image/png", project="proj")
+    await gcs.copy_blob("bucket", "a/b.png", "a/c.png", project="proj")
+
+    bucket.blob.return_value.upload_from_string.assert_called_once_with(
+        b"png", content_type="image/png"
+    )
+    bucket.copy_blob.assert_called_once_with(bucket.blob.return_value, bucket, "a/c.png")
+
+
+async def test_get_blob_returns_none_for_missing_blobs() -> None:
+    gcs.get_bucket("bucket").get_blob.return_value = None
+
+    assert await gcs.get_blob("bucket", "missing.m4a") is None
+
+
+async def test_delete_blob_runs_on_the_shared_bucket() -> None:
+    bucket = gcs.get_bucket("bucket", "proj")
+
+    await gcs.delete_blob("bucket", "a/b.m4a", project="proj")
+
+    bucket.blob.assert_called_once_with("a/b.m4a")
+    bucket.blob.return_value.delete.assert_called_once_with()